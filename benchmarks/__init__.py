@@ -0,0 +1,4 @@
+"""Performance benchmarks with reproducible, seeded scenarios.
+
+`python -m benchmarks.run` to run; `inv bench` to compare against a stored baseline.
+"""
@@ -0,0 +1,72 @@
+"""Compare benchmark results with a baseline; exit with status 1 on regression.
+
+`python -m benchmarks.compare --help` for options.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+LOWER_IS_BETTER_PREFIXES = ("peak_memory_bytes/",)
+
+
+def main() -> None:
+    """Compare results from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("results")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Fractional change counted as a regression (default: %(default)s).",
+    )
+    args = parser.parse_args()
+
+    baseline = _load_results(args.baseline)
+    results = _load_results(args.results)
+    regressions = compare(baseline, results, args.threshold)
+    sys.exit(1 if regressions else 0)
+
+
+def compare(
+    baseline: Mapping[str, float], results: Mapping[str, float], threshold: float
+) -> list[str]:
+    """Print a comparison table; return names of regressed benchmarks.
+
+    Benchmarks missing from either side are reported, but aren't regressions.
+    """
+    regressions = []
+    for name in sorted(baseline.keys() | results.keys()):
+        if name not in baseline or name not in results:
+            print(f"{name:<45} {'(missing in baseline or results)':>32}")
+            continue
+        change = (results[name] - baseline[name]) / baseline[name]
+        if name.startswith(LOWER_IS_BETTER_PREFIXES):
+            change = -change
+        regressed = change < -threshold
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<45} {baseline[name]:>12.1f} {results[name]:>12.1f}"
+            f" {change:>+7.1%}{'  REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def _load_results(path: str) -> dict[str, float]:
+    results: dict[str, float] = json.loads(Path(path).read_text(encoding="utf-8"))[
+        "results"
+    ]
+    return results
+
+
+if __name__ == "__main__":
+    main()
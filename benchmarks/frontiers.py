@@ -0,0 +1,62 @@
+"""Compare route engines and frontiers on each benchmark map.
+
+`python -m benchmarks.frontiers` to run.
+
+Reports route queries per second and frontier (heap) traffic per search, i.e. pushes
+and pops, and the fastest engine and frontier for each map.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from loguru import logger
+
+from benchmarks.run import ROUTE_MAPS, ROUTE_QUERIES, SEED
+from benchmarks.scenarios import SCENARIOS
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.world.priority_queue import FRONTIERS
+from two_d_game_ai.world.route_engines import ROUTE_ENGINES
+
+
+def main() -> None:
+    """Run comparisons from the command line."""
+    logger.disable("two_d_game_ai")
+    pushes = metrics.histogram("grid.frontier_pushes")
+    pops = metrics.histogram("grid.frontier_pops")
+
+    for map_name in ROUTE_MAPS:
+        grid = SCENARIOS[map_name](0, SEED).grid
+        rng = random.Random(SEED)
+        queries = [
+            (grid.random_free_cell(rng), grid.random_free_cell(rng))
+            for _ in range(ROUTE_QUERIES)
+        ]
+        queries_per_second = {}
+        print(map_name)
+        for engine_name in ROUTE_ENGINES:
+            for frontier_name in FRONTIERS:
+                grid.route_engine = engine_name
+                grid.route_frontier = frontier_name
+                metrics.reset()
+                start = time.perf_counter()
+                for from_cell, to_cell in queries:
+                    grid.route(from_cell, to_cell)
+                name = f"{engine_name}/{frontier_name}"
+                queries_per_second[name] = len(queries) / (time.perf_counter() - start)
+                traffic = (
+                    f"{pushes.mean:>8.1f} pushes/search {pops.mean:>8.1f} pops/search"
+                    if pushes.count
+                    else "(no searches: all line of sight)"
+                )
+                print(
+                    f"  {name:<30} {queries_per_second[name]:>8.1f} queries/s {traffic}"
+                )
+        print(
+            f"  fastest: {max(queries_per_second, key=queries_per_second.__getitem__)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
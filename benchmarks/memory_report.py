@@ -0,0 +1,151 @@
+"""Report memory footprint per `Bot` and per `Grid` cell, as JSON.
+
+`python -m benchmarks.memory_report --help` for options.
+
+Totals are measured with `tracemalloc`: the memory held by a scenario with `Bot`s,
+less the memory held by the same scenario without them, per `Bot`. Totals include
+shared structures that grow with `Bot` count, e.g. `World` indexes.
+
+The breakdown by attribute sums `sys.getsizeof` of objects each `Bot` owns, e.g. its
+`Vector2`s and the containers (not the other `Bot`s) in `visible_bots`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from pygame import Vector2
+
+from benchmarks.scenarios import SCENARIOS
+from two_d_game_ai.entities.bot_memory import BotMemory
+from two_d_game_ai.entities.generic_entity import GenericEntity
+from two_d_game_ai.geometry.bearing import Bearing
+from two_d_game_ai.world.grid import Grid
+
+if TYPE_CHECKING:
+    from two_d_game_ai.entities.bot import Bot
+    from two_d_game_ai.world.world import World
+
+BOT_COUNTS = (100, 1_000)
+FULL_BOT_COUNTS = (*BOT_COUNTS, 10_000)
+GRID_SIZES = (64, 256, 1_024)
+STEPS = 5
+"""Steps taken before measuring, so that routes and sensing are populated."""
+SEED = 0
+
+
+def main() -> None:
+    """Write memory report from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="memory_report.json")
+    parser.add_argument("--scenario", default="open_field", choices=SCENARIOS)
+    parser.add_argument(
+        "--full", action="store_true", help="Include 10k-Bot scenario (slow)."
+    )
+    args = parser.parse_args()
+    logger.disable("two_d_game_ai")
+
+    report = {
+        "bot": {
+            str(bot_count): bot_footprint(args.scenario, bot_count)
+            for bot_count in (FULL_BOT_COUNTS if args.full else BOT_COUNTS)
+        },
+        "grid": {str(size): grid_footprint(size) for size in GRID_SIZES},
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(json.dumps(report, indent=2))
+
+
+def bot_footprint(
+    scenario_name: str, bot_count: int
+) -> dict[str, float | dict[str, float]]:
+    """Measure bytes per `Bot` in a scenario, in total and by attribute."""
+    empty_bytes, _ = _traced_world(scenario_name, 0)
+    total_bytes, world = _traced_world(scenario_name, bot_count)
+
+    attribute_bytes: Counter[str] = Counter()
+    for bot in world.bots:
+        attribute_bytes.update(attribute_sizes(bot))
+    return {
+        "bytes_per_bot": (total_bytes - empty_bytes) / bot_count,
+        "attribute_bytes_per_bot": {
+            name: size / bot_count for name, size in attribute_bytes.most_common()
+        },
+    }
+
+
+def grid_footprint(size: int, density: float = 0.3) -> dict[str, float]:
+    """Measure bytes per cell of a `Grid` with `density` of cells blocked.
+
+    Includes the free cell index, which is built when first needed.
+    """
+    rng = random.Random(SEED)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        grid = Grid(size=size)
+        grid.block_cells(c for c in grid.cells if rng.random() < density)
+        grid.random_free_cell(rng)
+        gc.collect()
+        total_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"bytes_per_cell": total_bytes / size**2}
+
+
+def attribute_sizes(bot: Bot) -> dict[str, int]:
+    """Return bytes of objects owned by a `Bot`, by attribute.
+
+    References to other entities and the `World` count only as the reference.
+    """
+    sizes = {"(instance)": sys.getsizeof(bot) + sys.getsizeof(bot.__dict__)}
+    for f in dataclasses.fields(bot):
+        sizes[f.name] = _owned_size(getattr(bot, f.name))
+    return sizes
+
+
+def _owned_size(value: object) -> int:
+    """Return bytes of `value` and the objects it owns, excluding entities."""
+    if value is None or isinstance(value, GenericEntity):
+        return 0
+    if isinstance(value, Bearing | BotMemory):
+        return sys.getsizeof(value) + sum(
+            _owned_size(getattr(value, f.name)) for f in dataclasses.fields(value)
+        )
+    if isinstance(value, list | set | dict):
+        return sys.getsizeof(value) + sum(
+            _owned_size(v) for v in value if isinstance(v, Vector2)
+        )
+    if isinstance(value, Vector2 | str | array):
+        return sys.getsizeof(value)
+    # Shared or immutable small values, e.g. numbers and `World`:
+    return 0
+
+
+def _traced_world(scenario_name: str, bot_count: int) -> tuple[int, World]:
+    """Build and step a scenario; return memory it holds, and its `World`."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        world = SCENARIOS[scenario_name](bot_count, SEED)
+        world.step_many(STEPS)
+        gc.collect()
+        traced_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return traced_bytes, world
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Replay Moving AI Lab scenarios through `Grid.route`, checking path lengths.
+
+`python -m benchmarks.moving_ai path/to/file.map.scen` to run; maps are read from the
+scenario file's directory unless `--map-dir` is given.
+
+NB: `Grid.route` allows diagonal moves past blocked corners, and returns a direct route
+where there's line of sight, so routes may be *shorter* than the published octile
+optimum. Each route is checked with `benchmarks.verify_routes.path_errors`; only valid
+routes within `TOLERANCE` of the optimum pass. Valid shorter routes are reported, but
+don't pass, as they aren't comparable; longer routes are counted as suboptimal.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import math
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from benchmarks.verify_routes import path_errors
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.world.moving_ai import load_map, load_scenarios
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from two_d_game_ai.world.grid import Grid
+    from two_d_game_ai.world.grid_ref import GridRef
+    from two_d_game_ai.world.moving_ai import MovingAIScenario
+
+TOLERANCE = 1e-4
+"""Allowed difference from optimal length, as published lengths are rounded."""
+
+
+@dataclass(frozen=True)
+class QueryResult:
+    """Outcome of replaying one scenario."""
+
+    scenario: MovingAIScenario
+    path_length: float | None
+    """`None` if no route was found."""
+    seconds: float
+    nodes_expanded: int
+    errors: tuple[str, ...] = ()
+    """Reasons that the route is invalid; empty if valid."""
+
+    @property
+    def status(self) -> str:
+        """`optimal`, `shorter`, `suboptimal`, `invalid` or `no route`."""
+        if self.path_length is None:
+            return "no route"
+        if self.errors:
+            return "invalid"
+        difference = self.path_length - self.scenario.optimal_length
+        if abs(difference) <= TOLERANCE:
+            return "optimal"
+        return "shorter" if difference < 0 else "suboptimal"
+
+    @property
+    def passed(self) -> bool:
+        """Whether the route is valid and within `TOLERANCE` of the optimum."""
+        return self.status == "optimal"
+
+
+def main() -> None:
+    """Replay scenarios from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenario_file")
+    parser.add_argument("--map-dir")
+    args = parser.parse_args()
+    logger.disable("two_d_game_ai")
+
+    scenario_path = Path(args.scenario_file)
+    map_dir = Path(args.map_dir) if args.map_dir else scenario_path.parent
+    scenarios = load_scenarios(scenario_path)
+    results = []
+    for map_name in sorted({s.map_name for s in scenarios}):
+        grid = load_map(map_dir / Path(map_name).name).to_grid()
+        results += replay(grid, (s for s in scenarios if s.map_name == map_name))
+    report(results)
+
+
+def replay(grid: Grid, scenarios: Iterable[MovingAIScenario]) -> list[QueryResult]:
+    """Route each scenario on `grid`, recording path length, time and nodes expanded.
+
+    Nodes expanded are read from the `grid.nodes_expanded` telemetry histogram. Routes
+    are checked for validity after timing.
+    """
+    nodes_expanded = metrics.histogram("grid.nodes_expanded")
+    results = []
+    for scenario in scenarios:
+        nodes_before = nodes_expanded.total
+        start = time.perf_counter()
+        route = grid.route(scenario.start, scenario.goal)
+        seconds = time.perf_counter() - start
+        results.append(
+            QueryResult(
+                scenario=scenario,
+                path_length=None if route is None else path_length(route),
+                seconds=seconds,
+                nodes_expanded=int(nodes_expanded.total - nodes_before),
+                errors=()
+                if route is None
+                else tuple(path_errors(grid, route, scenario.start, scenario.goal)),
+            )
+        )
+    return results
+
+
+def path_length(route: list[GridRef]) -> float:
+    """Return the Euclidean length of a route through cell centres."""
+    return sum(math.dist((a.x, a.y), (b.x, b.y)) for a, b in itertools.pairwise(route))
+
+
+def report(results: list[QueryResult]) -> None:
+    """Print counts by status, passes, and time and nodes expanded per query."""
+    print(f"{len(results)} queries, {sum(r.passed for r in results)} passed")
+    for status in ("optimal", "shorter", "suboptimal", "invalid", "no route"):
+        print(f"  {status:<11} {sum(r.status == status for r in results)}")
+    if not results:
+        return
+    microseconds = [r.seconds * 1e6 for r in results]
+    nodes = [r.nodes_expanded for r in results]
+    print(
+        f"time per query (µs):   mean {statistics.mean(microseconds):.1f},"
+        f" median {statistics.median(microseconds):.1f},"
+        f" max {max(microseconds):.1f}"
+    )
+    print(
+        f"nodes expanded/query:  mean {statistics.mean(nodes):.1f},"
+        f" median {statistics.median(nodes):.1f}, max {max(nodes)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Run benchmarks, and write results to JSON.
+
+`python -m benchmarks.run --help` for options.
+
+Measures:
+- `Grid.route` queries per second, per map
+- `World.update` steps per second, per scenario and `Bot` count
+- `WorldRenderer.render` frames per second, under a dummy SDL video driver
+- peak memory while building and stepping each scenario, with `tracemalloc`
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from benchmarks.scenarios import SCENARIOS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from two_d_game_ai.world.world import World
+
+ROUTE_MAPS = ("open_field", "maze", "dense_obstacles")
+BOT_COUNTS = (10, 100, 1_000)
+FULL_BOT_COUNTS = (*BOT_COUNTS, 10_000)
+RENDER_BOT_COUNT = 100
+ROUTE_QUERIES = 200
+SEED = 0
+
+
+def main() -> None:
+    """Run benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=1.0,
+        help="Minimum seconds per measurement (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Include 10k-Bot scenarios (slow)."
+    )
+    args = parser.parse_args()
+
+    # Must be set before pygame initialises display:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    logger.disable("two_d_game_ai")
+
+    results = run_all(
+        bot_counts=FULL_BOT_COUNTS if args.full else BOT_COUNTS,
+        min_time=args.min_time,
+    )
+    Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Wrote {len(results['results'])} results to {args.output}")
+
+
+def run_all(
+    *, bot_counts: tuple[int, ...], min_time: float
+) -> dict[str, dict[str, float | str]]:
+    """Run all benchmarks.
+
+    Returns
+    -------
+    dict[str, dict[str, float | str]]
+        `meta` describing the environment, and `results` by benchmark name.
+    """
+    results: dict[str, float | str] = {}
+    for map_name in ROUTE_MAPS:
+        name = f"route_qps/{map_name}"
+        results[name] = route_queries_per_second(map_name, min_time)
+        print(f"{name}: {results[name]:.1f}")
+
+    for scenario_name in SCENARIOS:
+        for bot_count in bot_counts:
+            name = f"update_sps/{scenario_name}/{bot_count}"
+            results[name] = update_steps_per_second(scenario_name, bot_count, min_time)
+            print(f"{name}: {results[name]:.1f}")
+            name = f"peak_memory_bytes/{scenario_name}/{bot_count}"
+            results[name] = peak_memory(scenario_name, bot_count)
+            print(f"{name}: {results[name]:.0f}")
+
+    for scenario_name in SCENARIOS:
+        name = f"render_fps/{scenario_name}/{RENDER_BOT_COUNT}"
+        results[name] = render_frames_per_second(
+            scenario_name, RENDER_BOT_COUNT, min_time
+        )
+        print(f"{name}: {results[name]:.1f}")
+
+    meta: dict[str, float | str] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": SEED,
+        "min_time": min_time,
+    }
+    return {"meta": meta, "results": results}
+
+
+def route_queries_per_second(map_name: str, min_time: float) -> float:
+    """Measure `Grid.route` queries per second, between random free cells."""
+    world = SCENARIOS[map_name](0, SEED)
+    rng = random.Random(SEED)
+    queries = [
+        (world.grid.random_free_cell(rng), world.grid.random_free_cell(rng))
+        for _ in range(ROUTE_QUERIES)
+    ]
+
+    def run_queries() -> int:
+        for from_cell, to_cell in queries:
+            world.grid.route(from_cell, to_cell)
+        return len(queries)
+
+    return _rate(run_queries, min_time)
+
+
+def update_steps_per_second(
+    scenario_name: str, bot_count: int, min_time: float
+) -> float:
+    """Measure `World.update` steps per second."""
+    world = SCENARIOS[scenario_name](bot_count, SEED)
+
+    def step() -> int:
+        world.update()
+        return 1
+
+    return _rate(step, min_time)
+
+
+def render_frames_per_second(
+    scenario_name: str, bot_count: int, min_time: float
+) -> float:
+    """Measure `WorldRenderer.render` frames per second, in debug render mode."""
+    import pygame  # noqa: PLC0415
+
+    from two_d_game_ai.view.world_renderer import WorldRenderer  # noqa: PLC0415
+
+    pygame.init()
+    world = SCENARIOS[scenario_name](bot_count, SEED)
+    world_renderer = WorldRenderer(world=world, scale_factor=8)
+
+    def render() -> int:
+        world_renderer.render(debug_render_mode=True)
+        return 1
+
+    return _rate(render, min_time)
+
+
+def peak_memory(scenario_name: str, bot_count: int, steps: int = 10) -> int:
+    """Measure peak memory while building a scenario and updating it."""
+    tracemalloc.start()
+    try:
+        world: World = SCENARIOS[scenario_name](bot_count, SEED)
+        world.step_many(steps)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _rate(operation: Callable[[], int], min_time: float) -> float:
+    """Repeat `operation` for at least `min_time`; return operations per second.
+
+    `operation` returns the number of operations it performed.
+    """
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        count += operation()
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+if __name__ == "__main__":
+    main()
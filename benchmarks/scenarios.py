@@ -0,0 +1,149 @@
+"""Seeded benchmark scenarios.
+
+Each scenario builder returns a new `World`, identical for the same arguments.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.entities.obstacles import ObstacleRectangle
+from two_d_game_ai.world.events import BotSighted
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.world import World
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+WORLD_SIZE = 100
+GRID_SIZE = 64
+
+
+def open_field(bot_count: int, seed: int = 0) -> World:
+    """No obstacles; `Bot`s wander to random destinations."""
+    world = World(size=WORLD_SIZE, grid_size=GRID_SIZE, seed=seed)
+    _add_wandering_bots(world, bot_count)
+    return world
+
+
+def maze(bot_count: int, seed: int = 0) -> World:
+    """Maze with corridors one cell wide; `Bot`s wander to random destinations."""
+    world = World(size=WORLD_SIZE, grid_size=GRID_SIZE, seed=seed)
+    world.grid.block_cells(_maze_walls(GRID_SIZE, random.Random(seed)))
+    _add_wandering_bots(world, bot_count)
+    return world
+
+
+def dense_obstacles(bot_count: int, seed: int = 0) -> World:
+    """Many rectangular obstacles; `Bot`s wander to random destinations."""
+    world = World(size=WORLD_SIZE, grid_size=GRID_SIZE, seed=seed)
+    rng = random.Random(seed)
+    for i in range(60):
+        world.add_entity(
+            ObstacleRectangle(
+                name=f"or{i}",
+                position_from_sequence=(
+                    rng.uniform(-WORLD_SIZE / 2, WORLD_SIZE / 2 - 8),
+                    rng.uniform(-WORLD_SIZE / 2, WORLD_SIZE / 2 - 8),
+                ),
+                size=(rng.uniform(2, 8), rng.uniform(2, 8)),
+            )
+        )
+    _add_wandering_bots(world, bot_count)
+    return world
+
+
+def follower_chains(bot_count: int, seed: int = 0) -> World:
+    """Chains of followers, as in `examples/following.py`; leaders wander."""
+    world = World(size=WORLD_SIZE, grid_size=GRID_SIZE, seed=seed)
+    chain_length = 5
+    previous: Bot | None = None
+    for i in range(bot_count):
+        leader = None if i % chain_length == 0 else previous
+        bot = Bot(
+            name=f"b{i}",
+            # Behind (i.e. South of) the previous Bot in the chain, facing North:
+            position_from_sequence=tuple(
+                leader.position - (0, 2) if leader else world.random_location()
+            ),
+            leader=leader,
+            has_memory=True,
+        )
+        world.add_entity(bot)
+        if not leader:
+            bot.destination = world.random_location()
+        previous = bot
+    return world
+
+
+def zombie_swarm(bot_count: int, seed: int = 0) -> World:
+    """Zombies with varied speeds and vision, as in `examples/zombies.py`."""
+    world = World(size=WORLD_SIZE, grid_size=GRID_SIZE, seed=seed)
+    human = Bot(name="human", position_from_sequence=(0, 0))
+    world.add_entity(human)
+    human.destination = world.random_location()
+    zombies = set()
+    for i in range(bot_count - 1):
+        zombie = Bot(
+            name=f"z{i}",
+            max_speed=world.rng.uniform(1, 2),
+            max_rotation_rate=world.rng.uniform(5, 60),
+            position_from_sequence=tuple(world.random_location()),
+            initial_heading=world.rng.uniform(0, 360),
+            vision_range=world.rng.uniform(1, 5),
+        )
+        world.add_entity(zombie)
+        zombie.destination = world.random_location()
+        zombies.add(zombie)
+
+    def chase_human(event: BotSighted) -> None:
+        if event.observer in zombies and event.observed is human:
+            event.observer.leader = human
+
+    world.events.subscribe(BotSighted, chase_human)
+    return world
+
+
+SCENARIOS: dict[str, Callable[[int, int], World]] = {
+    "open_field": open_field,
+    "maze": maze,
+    "dense_obstacles": dense_obstacles,
+    "follower_chains": follower_chains,
+    "zombie_swarm": zombie_swarm,
+}
+"""Scenario builders, by name. Called with bot count and seed."""
+
+
+def _add_wandering_bots(world: World, bot_count: int) -> None:
+    for i in range(bot_count):
+        bot = Bot(name=f"b{i}", position_from_sequence=tuple(world.random_location()))
+        world.add_entity(bot)
+        bot.destination = world.random_location()
+
+
+def _maze_walls(size: int, rng: random.Random) -> set[GridRef]:
+    """Return wall cells of a maze generated by randomised depth-first search.
+
+    Passages are on even cells; odd cells are walls, except where knocked through.
+    """
+    walls = {GridRef(x, y) for x in range(size) for y in range(size)}
+    start = GridRef(0, 0)
+    walls.discard(start)
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        unvisited = [
+            GridRef(cell.x + dx, cell.y + dy)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if GridRef(cell.x + dx, cell.y + dy) in walls
+        ]
+        if not unvisited:
+            stack.pop()
+            continue
+        next_cell = rng.choice(unvisited)
+        walls.discard(next_cell)
+        walls.discard(GridRef((cell.x + next_cell.x) // 2, (cell.y + next_cell.y) // 2))
+        stack.append(next_cell)
+    return walls
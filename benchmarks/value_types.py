@@ -0,0 +1,105 @@
+"""Compare value types used in searches with the dataclasses they replaced.
+
+`python -m benchmarks.value_types` to run.
+
+Measures, for `GridRef` and heap entries, bytes per instance (with `tracemalloc`) and
+time for typical search operations: creating, hashing into a set, and heap push/pop.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Self, TypeVar
+
+from two_d_game_ai.world.grid_ref import GridRef
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+N = 100_000
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class DataclassGridRef:
+    """Previous `GridRef` implementation."""
+
+    x: int
+    y: int
+
+
+@dataclass(kw_only=True)
+class DataclassPrioritisedLocation:
+    """Previous heap entry implementation."""
+
+    priority: float
+    location: GridRef
+
+    def __lt__(self, other: Self) -> bool:
+        return self.priority < other.priority
+
+
+def main() -> None:
+    """Run comparisons from the command line."""
+    rng = random.Random(0)
+    coords = [(rng.randrange(1000), rng.randrange(1000)) for _ in range(N)]
+    priorities = [rng.random() for _ in range(N)]
+
+    dataclass_cells = _bytes_and_seconds(
+        "dataclass GridRef: create",
+        lambda: [DataclassGridRef(x, y) for x, y in coords],
+    )
+    _bytes_and_seconds("dataclass GridRef: add to set", lambda: set(dataclass_cells))
+    cells = _bytes_and_seconds(
+        "NamedTuple GridRef: create", lambda: [GridRef(x, y) for x, y in coords]
+    )
+    _bytes_and_seconds("NamedTuple GridRef: add to set", lambda: set(cells))
+    cell_indexes = _bytes_and_seconds(
+        "cell index: create", lambda: [y * 1000 + x for x, y in coords]
+    )
+    _bytes_and_seconds("cell index: add to set", lambda: set(cell_indexes))
+
+    location = GridRef(0, 0)
+
+    def push_pop_dataclasses() -> None:
+        heap: list[DataclassPrioritisedLocation] = []
+        for p in priorities:
+            heapq.heappush(
+                heap, DataclassPrioritisedLocation(priority=p, location=location)
+            )
+        while heap:
+            heapq.heappop(heap)
+
+    def push_pop_tuples() -> None:
+        heap: list[tuple[float, int, GridRef]] = []
+        sequence = itertools.count()
+        for p in priorities:
+            heapq.heappush(heap, (p, next(sequence), location))
+        while heap:
+            heapq.heappop(heap)
+
+    _bytes_and_seconds("dataclass heap entries: push/pop", push_pop_dataclasses)
+    _bytes_and_seconds("tuple heap entries: push/pop", push_pop_tuples)
+
+
+def _bytes_and_seconds(name: str, operation: Callable[[], R]) -> R:
+    """Print peak bytes per item, and time, of an operation on `N` items."""
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    result = operation()
+    seconds = time.perf_counter() - start
+    print(f"{name:<40} {peak / N:>7.1f} B/item {seconds * 1000:>8.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Verify route engines against the reference engine, on seeded random grids.
+
+`python -m benchmarks.verify_routes --help` for options.
+
+For each query, every engine registered in `ROUTE_ENGINES`, with every frontier in
+`FRONTIERS`, must find a path with the reference engine's cost (or no path, if it
+finds none), and each path must be valid: from start to goal, through unblocked cells,
+with each step to an adjacent cell or, for any-angle segments, with line of sight.
+Reports each engine and frontier's speed relative to the reference.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import math
+import random
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from two_d_game_ai.world.grid import Grid
+from two_d_game_ai.world.priority_queue import FRONTIERS
+from two_d_game_ai.world.route_engines import (
+    DEFAULT_FRONTIER,
+    REFERENCE_ENGINE,
+    ROUTE_ENGINES,
+    cost,
+)
+
+if TYPE_CHECKING:
+    from two_d_game_ai.world.grid_ref import GridRef
+
+COST_TOLERANCE = 1e-9
+REFERENCE = f"{REFERENCE_ENGINE}/{DEFAULT_FRONTIER}"
+
+
+@dataclass
+class Verification:
+    """Outcome of verifying route engines."""
+
+    queries: int = 0
+    failures: list[str] = field(default_factory=list)
+    seconds: dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    """Total search time, by `{engine}/{frontier}` name."""
+
+    def relative_speed(self, name: str) -> float:
+        """Return speed relative to the reference; >1 is faster."""
+        return self.seconds[REFERENCE] / self.seconds[name]
+
+
+def main() -> None:
+    """Verify route engines from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--grids", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=50, help="Per grid.")
+    parser.add_argument("--size", type=int, default=48)
+    parser.add_argument("--density", type=float, default=0.3)
+    args = parser.parse_args()
+    logger.disable("two_d_game_ai")
+
+    verification = verify_route_engines(
+        seed=args.seed,
+        grids=args.grids,
+        queries_per_grid=args.queries,
+        size=args.size,
+        density=args.density,
+    )
+    print(f"{verification.queries} queries, {len(verification.failures)} failures")
+    for failure in verification.failures:
+        print(f"  {failure}")
+    for name in sorted(verification.seconds):
+        print(
+            f"{name:<30} {verification.seconds[name]:>8.3f}s"
+            f" {verification.relative_speed(name):>6.2f}x"
+        )
+    sys.exit(1 if verification.failures else 0)
+
+
+def verify_route_engines(
+    *, seed: int, grids: int, queries_per_grid: int, size: int, density: float
+) -> Verification:
+    """Run all route engines on random grids and queries, checking their paths."""
+    rng = random.Random(seed)
+    verification = Verification()
+    for _ in range(grids):
+        grid = random_grid(rng, size, density)
+        for _ in range(queries_per_grid):
+            start_cell = grid.random_free_cell(rng)
+            goal_cell = grid.random_free_cell(rng)
+            verification.queries += 1
+            _verify_query(verification, grid, start_cell, goal_cell)
+    return verification
+
+
+def random_grid(rng: random.Random, size: int, density: float) -> Grid:
+    """Return a new `Grid`, with about `density` of its cells blocked."""
+    grid = Grid(size=size)
+    grid.block_cells(c for c in grid.cells if rng.random() < density)
+    return grid
+
+
+def path_cost(path: list[GridRef]) -> float:
+    """Return the total cost of a path."""
+    return sum(cost(a, b) for a, b in itertools.pairwise(path))
+
+
+def path_errors(
+    grid: Grid, path: list[GridRef], start_cell: GridRef, goal_cell: GridRef
+) -> list[str]:
+    """Return reasons that a path is invalid; empty if valid."""
+    errors = []
+    if path[0] != start_cell or path[-1] != goal_cell:
+        errors.append(f"doesn't run from {start_cell} to {goal_cell}")
+    errors.extend(
+        f"blocked cell {c}" for c in path if c in grid.movement_blocking_cells
+    )
+    for a, b in itertools.pairwise(path):
+        is_adjacent = max(abs(a.x - b.x), abs(a.y - b.y)) == 1
+        if not is_adjacent and not grid.is_line_of_sight(a, b):
+            errors.append(f"no line of sight from {a} to {b}")
+    return errors
+
+
+def _verify_query(
+    verification: Verification, grid: Grid, start_cell: GridRef, goal_cell: GridRef
+) -> None:
+    paths: dict[str, list[GridRef] | None] = {}
+    for engine_name, engine in ROUTE_ENGINES.items():
+        for frontier_name, frontier in FRONTIERS.items():
+            name = f"{engine_name}/{frontier_name}"
+            start = time.perf_counter()
+            paths[name] = engine(grid, start_cell, goal_cell, frontier=frontier)
+            verification.seconds[name] += time.perf_counter() - start
+
+    reference_path = paths[REFERENCE]
+    query = f"{start_cell} -> {goal_cell}"
+    for name, path in paths.items():
+        if path is None or reference_path is None:
+            if path != reference_path:
+                verification.failures.append(
+                    f"{name}: {query}: path found by only one of {name}, {REFERENCE}"
+                )
+            continue
+        verification.failures.extend(
+            f"{name}: {query}: {error}"
+            for error in path_errors(grid, path, start_cell, goal_cell)
+        )
+        if not math.isclose(
+            path_cost(path), path_cost(reference_path), abs_tol=COST_TOLERANCE
+        ):
+            verification.failures.append(
+                f"{name}: {query}: cost {path_cost(path)},"
+                f" expected {path_cost(reference_path)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import random
 from examples.logging_config import configure_logger
 from two_d_game_ai.entities.bot import Bot
 from two_d_game_ai.view.view import View
+from two_d_game_ai.world.events import BotSighted
 from two_d_game_ai.world.world import World
 
 configure_logger()
@@ -45,16 +46,20 @@ for i in range(ZOMBIES_COUNT):
         z.destination = the_world.random_location()
     zombies.add(z)
 
+
+def chase_human(event: BotSighted) -> None:
+    """Zombie starts chasing the human when it spots them."""
+    if event.observer in zombies and event.observed is human:
+        event.observer.leader = human
+
+
+the_world.events.subscribe(BotSighted, chase_human)
+
 # Create a View of the World
 view = View(world=the_world)
 
 while view.running:
     view.handle_inputs()
-
-    for z in zombies:
-        if z.can_see(human):
-            z.leader = human
-
     if not the_world.is_paused:
         the_world.update()
     view.render()
@@ -42,3 +42,20 @@ def doc(c: Any, *, build: bool = False) -> None:
     else:
         print("Opening pdoc server at http://localhost:8080...")
         c.run("pdoc two_d_game_ai -d numpy")
+
+
+@task
+def bench(
+    c: Any,
+    *,
+    baseline: str = "benchmarks/baseline.json",
+    save: bool = False,
+    full: bool = False,
+) -> None:
+    """Run benchmarks and compare with baseline, or save as new baseline."""
+    output = baseline if save else "bench_results.json"
+    print("⏱️ Running benchmarks...")
+    c.run(f"python -m benchmarks.run -o {output}{' --full' if full else ''}")
+    if not save:
+        print(f"📊 Comparing with {baseline}...")
+        c.run(f"python -m benchmarks.compare {baseline} {output}")
@@ -0,0 +1,38 @@
+"""Fixtures shared between test modules."""
+
+from pathlib import Path
+
+import pytest
+
+_MOVING_AI_MAP = """type octile
+height 3
+width 4
+map
+.@..
+.@T.
+....
+"""
+
+_MOVING_AI_SCENARIOS = """version 1
+0\ttest.map\t4\t3\t0\t0\t2\t0\t8.00000000
+0\ttest.map\t4\t3\t0\t0\t0\t2\t2.00000000
+"""
+
+
+@pytest.fixture
+def moving_ai_map(tmp_path: Path) -> Path:
+    """Write a small Moving AI map file: 4 x 3, with a wall; return its path."""
+    path = tmp_path / "test.map"
+    path.write_text(_MOVING_AI_MAP)
+    return path
+
+
+@pytest.fixture
+def moving_ai_scenarios(tmp_path: Path) -> Path:
+    """Write Moving AI scenarios for `moving_ai_map`; return the file's path.
+
+    The first is around the wall; the second is in line of sight.
+    """
+    path = tmp_path / "test.map.scen"
+    path.write_text(_MOVING_AI_SCENARIOS)
+    return path
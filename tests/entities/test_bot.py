@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 from pygame import Vector2
 
 from two_d_game_ai import SIMULATION_FPS
 from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.entities.obstacles import ObstacleRectangle
 from two_d_game_ai.world.world import World
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @pytest.fixture
 def compass_directions() -> dict[str, Vector2]:
@@ -139,3 +145,106 @@ def test_set_destination_tuple() -> None:
     b.destination_from_sequence((2.5, -5.0))
     # assert
     assert b.destination == Vector2(2.5, -5.0)
+
+
+def test_destination_is_copied() -> None:
+    """Test that destination isn't an alias, e.g. of another Bot's position.
+
+    Positions are updated in place.
+    """
+    # arrange
+    w = World(40)
+    b0 = Bot(name="b0", position_from_sequence=(0, 0))
+    b1 = Bot(name="b1", position_from_sequence=(10, 0))
+    w.add_entity(b0)
+    w.add_entity(b1)
+    # act
+    b0.destination = b1.position
+    b1.position.update(5, 5)
+    # assert
+    assert b0.destination == Vector2(10, 0)
+    assert b0.route == [Vector2(10, 0)]
+
+
+def test_memory_bounded() -> None:
+    """Test that a Bot remembers only its most recently lost peers, where last seen."""
+    # arrange
+    w = World(40)
+    b0 = Bot(
+        name="b0", position_from_sequence=(0, 0), has_memory=True, memory_capacity=2
+    )
+    others = [Bot(name=f"b{x}", position_from_sequence=(x, 5)) for x in (-1, 0, 1)]
+    for b in [b0, *others]:
+        w.add_entity(b)
+    b0.handle_sensing(others)
+    # act
+    for b in others:
+        # move behind b0:
+        b.position.update(b.position.x, -5)
+        b0.handle_sensing(others)
+    # assert
+    assert b0.remembered_bots == set(others[1:])
+    assert b0.memory is not None
+    assert [(e.x, e.y) for e in b0.memory.entries()] == [(0, -5), (1, -5)]
+
+
+def test_memory_forgets_peer_in_sight() -> None:
+    """Test that a remembered peer is forgotten when seen again."""
+    # arrange
+    w = World(40)
+    b0 = Bot(name="b0", position_from_sequence=(0, 0), has_memory=True)
+    b1 = Bot(name="b1", position_from_sequence=(0, 5))
+    w.add_entity(b0)
+    w.add_entity(b1)
+    b0.handle_sensing([b1])
+    b1.position.update(0, -5)
+    b0.handle_sensing([b1])
+    # act
+    b1.position.update(0, 5)
+    b0.handle_sensing([b1])
+    # assert
+    assert b0.visible_bots == {b1}
+    assert not b0.remembered_bots
+
+
+def test_occluded_vision() -> None:
+    """Test that a Bot with occluded vision can't see past obstacles."""
+    # arrange
+    w = World(20, grid_size=20)
+    w.add_entity(ObstacleRectangle(position_from_sequence=(-3, 2), size=(6, 1)))
+    b0 = Bot(name="b0", position_from_sequence=(0, 0), vision_is_occluded=True)
+    b1 = Bot(name="b1", position_from_sequence=(0, 0))
+    b2 = Bot(name="b2", position_from_sequence=(0, 5))
+    for b in (b0, b1, b2):
+        w.add_entity(b)
+    # act, assert
+    assert not b0.can_see(b2)
+    assert b1.can_see(b2)
+
+
+@pytest.mark.parametrize(("eager", "expected_sensing"), [("lazy", 0), ("eager", 1)])
+def test_sensing_deferred_until_read(
+    monkeypatch: pytest.MonkeyPatch, eager: str, expected_sensing: int
+) -> None:
+    """Test that a Bot only senses when `visible_bots` is read, unless eager."""
+    # arrange
+    w = World(40)
+    b0 = Bot(name="b0", position_from_sequence=(0, 0), senses_eagerly=eager == "eager")
+    b1 = Bot(name="b1", position_from_sequence=(0, 5))
+    w.add_entity(b0)
+    w.add_entity(b1)
+    sensed: list[Bot] = []
+    handle_sensing = Bot.handle_sensing
+
+    def spy(self: Bot, other_bots: Iterable[Bot]) -> None:
+        sensed.append(self)
+        handle_sensing(self, other_bots)
+
+    monkeypatch.setattr(Bot, "handle_sensing", spy)
+    # act
+    b0.decide(is_sensing_due=True)
+    # assert
+    assert sensed.count(b0) == expected_sensing
+    assert b0.visible_bots == {b1}
+    assert b0.visible_bots == {b1}
+    assert sensed.count(b0) == 1
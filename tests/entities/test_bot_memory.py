@@ -0,0 +1,61 @@
+"""Tests for `BotMemory` class."""
+
+import pytest
+
+from two_d_game_ai.entities.bot_memory import BotMemory, MemoryEntry
+
+
+def test_remember() -> None:
+    """Test that last-seen step and position are remembered, and updated."""
+    # arrange
+    m = BotMemory(capacity=4)
+    # act
+    m.remember(7, step=1, x=2, y=3)
+    m.remember(7, step=5, x=-1, y=0)
+    # assert
+    assert len(m) == 1
+    assert m.get(7) == MemoryEntry(7, 5, -1, 0)
+    assert m.get(8) is None
+
+
+def test_least_recently_seen_evicted() -> None:
+    """Test that when full, the least recently seen `Bot` is forgotten."""
+    # arrange
+    m = BotMemory(capacity=2)
+    m.remember(0, step=0, x=0, y=0)
+    m.remember(1, step=1, x=0, y=0)
+    m.remember(0, step=2, x=0, y=0)
+    # act
+    m.remember(2, step=3, x=0, y=0)
+    # assert
+    assert list(m) == [0, 2]
+
+
+def test_expire() -> None:
+    """Test that entries older than `max_age` are forgotten."""
+    # arrange
+    m = BotMemory(capacity=4, max_age=10)
+    m.remember(0, step=0, x=0, y=0)
+    m.remember(1, step=5, x=0, y=0)
+    # act
+    m.expire(step=12)
+    # assert
+    assert list(m) == [1]
+
+
+def test_forgotten_slot_reused() -> None:
+    """Test that capacity is freed by forgetting."""
+    # arrange
+    m = BotMemory(capacity=1)
+    m.remember(0, step=0, x=0, y=0)
+    # act
+    m.forget(0)
+    m.remember(1, step=1, x=1, y=1)
+    # assert
+    assert m.entries() == [MemoryEntry(1, 1, 1, 1)]
+
+
+def test_capacity_must_be_positive() -> None:
+    """Test that a memory without capacity is rejected."""
+    with pytest.raises(ValueError, match="capacity"):
+        BotMemory(capacity=0)
@@ -57,6 +57,28 @@ def test_bearing_degrees_normalised() -> None:
     assert [Bearing(d).degrees_normalised for d in degs] == [0, 90, -180, -90, 0]
 
 
+def test_bearing_tiny_negative_degrees() -> None:
+    """0 <= degrees < 360, and -180 <= normalised < 180, for tiny negative angles."""
+    b = Bearing(0)
+    b.rotate(-1e-15)
+    assert Bearing(-1e-20).degrees == 0
+    assert b.degrees == 0
+    assert Bearing(2e-14).relative_degrees(-1e-20, -1) == -180
+
+
+def test_update() -> None:
+    """Test that a `Bearing` is set in place, keeping its vector."""
+    # arrange
+    b = Bearing(0)
+    vector = b.vector
+    # act
+    b.update(450)
+    # assert
+    assert b.degrees == 90
+    assert b.vector is vector
+    assert vector == VECTOR_EAST
+
+
 def test_relative() -> None:
     """Test that relative bearings are calculated correctly."""
     vecs = [
@@ -74,3 +96,28 @@ def test_relative() -> None:
         0,
         pytest.approx(90),
     ]
+
+
+def test_rotate() -> None:
+    """Test that rotation updates both angle and vector, in place."""
+    # arrange
+    b = Bearing(350)
+    vector = b.vector
+    # act
+    b.rotate(100)
+    # assert
+    assert b.degrees == pytest.approx(90)
+    assert b.vector is vector
+    assert b.vector == VECTOR_EAST
+
+
+def test_relative_degrees() -> None:
+    """Test that relative bearings to vector components are normalised."""
+    # arrange
+    b = Bearing(90)
+    # act, assert
+    assert [b.relative_degrees(v.x, v.y) for v in (VECTOR_NORTH, VECTOR_SOUTH)] == [
+        -90,
+        90,
+    ]
+    assert b.relative_degrees(VECTOR_WEST.x, VECTOR_WEST.y) == -180
@@ -0,0 +1,131 @@
+"""Tests for benchmark tooling."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks.memory_report import bot_footprint
+from benchmarks.moving_ai import replay
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.verify_routes import path_errors, verify_route_engines
+from two_d_game_ai.world.grid import Grid
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.moving_ai import load_map, load_scenarios
+
+
+def test_scenarios_are_reproducible() -> None:
+    """Test that scenarios built with the same seed are identical."""
+    for build in SCENARIOS.values():
+        # arrange
+        world_a = build(5, 1)
+        world_b = build(5, 1)
+        # act
+        world_a.step_many(10)
+        world_b.step_many(10)
+        # assert
+        positions_a = sorted((b.name, tuple(b.position)) for b in world_a.bots)
+        positions_b = sorted((b.name, tuple(b.position)) for b in world_b.bots)
+        assert positions_a == positions_b
+
+
+def test_compare_flags_regressions() -> None:
+    """Test that only changes worse than threshold are regressions.
+
+    Memory is lower-is-better.
+    """
+    # arrange
+    baseline = {
+        "update_sps/a": 100,
+        "update_sps/b": 100,
+        "peak_memory_bytes/a": 100,
+        "peak_memory_bytes/b": 100,
+    }
+    results = {
+        "update_sps/a": 80,
+        "update_sps/b": 95,
+        "peak_memory_bytes/a": 120,
+        "peak_memory_bytes/b": 80,
+    }
+    # act
+    regressions = compare(baseline, results, threshold=0.1)
+    # assert
+    assert regressions == ["peak_memory_bytes/a", "update_sps/a"]
+
+
+def test_moving_ai_replay(moving_ai_map: Path, moving_ai_scenarios: Path) -> None:
+    """Test that scenarios are routed and path lengths checked."""
+    # arrange
+    grid = load_map(moving_ai_map).to_grid()
+    # act
+    results = replay(grid, load_scenarios(moving_ai_scenarios))
+    # assert
+    # Around the wall: cuts the corner of the blocked cell below it, so is shorter:
+    assert results[0].status == "shorter"
+    assert not results[0].passed
+    assert results[0].nodes_expanded > 0
+    # Line of sight:
+    assert results[1].status == "optimal"
+    assert results[1].passed
+    assert results[1].nodes_expanded == 0
+
+
+def test_moving_ai_replay__invalid(
+    moving_ai_map: Path, moving_ai_scenarios: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that invalid routes don't pass, however short."""
+    # arrange
+    grid = load_map(moving_ai_map).to_grid()
+    scenario = load_scenarios(moving_ai_scenarios)[0]
+    # straight through the wall:
+    monkeypatch.setattr(grid, "route", lambda *_: [scenario.start, scenario.goal])
+    # act
+    result = replay(grid, [scenario])[0]
+    # assert
+    assert result.status == "invalid"
+    assert not result.passed
+
+
+def test_route_engines_agree() -> None:
+    """Test that all route engines find paths with the reference engine's cost."""
+    # act
+    verification = verify_route_engines(
+        seed=0, grids=3, queries_per_grid=10, size=16, density=0.3
+    )
+    # assert
+    assert verification.queries == 30
+    assert verification.failures == []
+
+
+def test_path_errors() -> None:
+    """Test that invalid paths are detected."""
+    # arrange
+    g = Grid(size=4)
+    g.block_cells({GridRef(1, 1)})
+    # act
+    errors = path_errors(
+        g,
+        [GridRef(0, 0), GridRef(1, 1), GridRef(3, 3), GridRef(0, 3)],
+        GridRef(0, 0),
+        GridRef(3, 0),
+    )
+    # assert
+    assert errors == [
+        "doesn't run from GridRef(x=0, y=0) to GridRef(x=3, y=0)",
+        "blocked cell GridRef(x=1, y=1)",
+        "no line of sight from GridRef(x=1, y=1) to GridRef(x=3, y=3)",
+    ]
+
+
+def test_memory_report() -> None:
+    """Test that per-Bot footprint is broken down by attribute."""
+    # act
+    footprint = bot_footprint("follower_chains", 10)
+    # assert
+    bytes_per_bot = footprint["bytes_per_bot"]
+    assert isinstance(bytes_per_bot, float)
+    assert bytes_per_bot > 0
+    attribute_bytes = footprint["attribute_bytes_per_bot"]
+    assert isinstance(attribute_bytes, dict)
+    assert attribute_bytes["position"] > 0
+    assert attribute_bytes["heading"] > 0
@@ -0,0 +1,83 @@
+"""Tests for telemetry."""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from pygame import Vector2
+
+from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.entities.obstacles import ObstacleRectangle
+from two_d_game_ai.telemetry import Histogram, MetricsRegistry, metrics
+from two_d_game_ai.world.world import World
+
+
+def test_histogram() -> None:
+    """Test that observed values are summarised."""
+    # arrange
+    h = Histogram("h")
+    # act
+    for v in (3, 1, 2):
+        h.observe(v)
+    # assert
+    assert (h.count, h.min, h.max, h.mean) == (3, 1, 3, 2)
+
+
+def test_thread_safe() -> None:
+    """Test that no updates are lost when metrics are recorded concurrently."""
+    # arrange
+    registry = MetricsRegistry()
+    c = registry.counter("c")
+    h = registry.histogram("h")
+
+    def record(value: int) -> None:
+        for _ in range(10_000):
+            c.inc()
+            h.observe(value)
+
+    # act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for value in range(8):
+            executor.submit(record, value)
+    # assert
+    assert c.value == 80_000
+    assert (h.count, h.total, h.min, h.max) == (80_000, 280_000, 0, 7)
+    registry.reset()
+    assert (c.value, h.count) == (0, 0)
+
+
+def test_reset_in_place() -> None:
+    """Test that reset metrics are the same objects, so references remain valid."""
+    # arrange
+    registry = MetricsRegistry()
+    c = registry.counter("c")
+    h = registry.histogram("h")
+    c.inc()
+    h.observe(1)
+    # act
+    registry.reset()
+    # assert
+    assert registry.counter("c") is c
+    assert c.value == 0
+    assert math.isnan(h.mean)
+    assert registry.snapshot() == {"c": 0, "h": {"count": 0}}
+
+
+def test_simulation_metrics() -> None:
+    """Test that routing and arrivals are counted."""
+    # arrange
+    w = World(size=20, grid_size=20)
+    w.add_entity(
+        ObstacleRectangle(name="or0", position_from_sequence=(-1, -5), size=(2, 10))
+    )
+    b = Bot(position_from_sequence=(-5, 0))
+    w.add_entity(b)
+    metrics.reset()
+    # act
+    b.destination = Vector2(5, 0)
+    w.step_many(10 * SIMULATION_FPS)
+    # assert
+    assert metrics.counter("grid.routes_computed").value == 1
+    assert metrics.histogram("grid.nodes_expanded").count == 1
+    assert metrics.counter("bot.waypoint_arrivals").value > 0
+    assert metrics.counter("bot.destination_arrivals").value == 1
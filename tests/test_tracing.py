@@ -0,0 +1,67 @@
+"""Tests for tracing."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.tracing import Tracer, tracer
+from two_d_game_ai.world.world import World
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture
+def enabled_tracer() -> Iterator[Tracer]:
+    """Enable the default tracer for the duration of a test."""
+    tracer.enable()
+    yield tracer
+    tracer.disable()
+    tracer.clear()
+
+
+def test_disabled() -> None:
+    """Test that nothing is recorded while disabled."""
+    # arrange
+    t = Tracer()
+    # act
+    with t.span("s"):
+        pass
+    t.next_frame()
+    # assert
+    assert t.events() == []
+
+
+def test_ring_buffer() -> None:
+    """Test that only the last `max_frames` frames are kept."""
+    # arrange
+    t = Tracer()
+    t.enable(max_frames=2)
+    # act
+    for i in range(5):
+        with t.span(f"s{i}"):
+            pass
+        t.next_frame()
+    # assert
+    assert [e["name"] for e in t.events()] == ["s3", "s4"]
+
+
+def test_simulation_spans(enabled_tracer: Tracer, tmp_path: Path) -> None:
+    """Test that simulation phases are recorded, and written as a Chrome trace."""
+    # arrange
+    w = World(10)
+    w.add_entity(Bot(position_from_sequence=(0, 0)))
+    path = tmp_path / "trace.json"
+    # act
+    w.update()
+    enabled_tracer.write_chrome_trace(path)
+    # assert
+    trace = json.loads(path.read_text())
+    names = {e["name"] for e in trace["traceEvents"]}
+    assert {"World.update", "Bot.handle_sensing"} <= names
+    assert all(e["ph"] == "X" for e in trace["traceEvents"])
@@ -1,6 +1,7 @@
 """Tests for `View` class."""
 
 from two_d_game_ai.view.view import View
+from two_d_game_ai.world.events import EntityAdded, EntityRemoved
 from two_d_game_ai.world.world import World
 
 
@@ -24,3 +25,17 @@ def test_render() -> None:
     v.render()
     # assert
     assert v
+
+
+def test_close() -> None:
+    """Test that a closed `View` no longer follows `World` events."""
+    # arrange
+    w = World(20)
+    v = View(world=w)
+    # act
+    v.close()
+    v.close()
+    # assert
+    assert not v.running
+    assert not w.events.has_subscribers(EntityAdded)
+    assert not w.events.has_subscribers(EntityRemoved)
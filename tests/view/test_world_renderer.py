@@ -2,6 +2,7 @@
 
 from pygame import Vector2
 
+from two_d_game_ai.entities.bot import Bot
 from two_d_game_ai.view.world_renderer import WorldRenderer
 from two_d_game_ai.world.world import World
 
@@ -63,3 +64,18 @@ def test_from_display_with_scale_factor() -> None:
     # act
     assert local_origin == Vector2(-10, 10)
     assert local_point == Vector2(10, -10)
+
+
+def test_renderers_follow_world_events() -> None:
+    """Test that entity renderers are added and removed with entities."""
+    # arrange
+    w = World(20)
+    wr = WorldRenderer(world=w, scale_factor=1)
+    b = Bot(position_from_sequence=(0, 0))
+    # act
+    w.add_entity(b)
+    added = set(wr.entity_renderers)
+    w.remove_entity(b)
+    # assert
+    assert added == {b.id}
+    assert not wr.entity_renderers
@@ -0,0 +1,87 @@
+"""Tests for batch experiment runner."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.entities.obstacles import ObstacleRectangle
+from two_d_game_ai.world.batch_runner import (
+    Experiment,
+    ExperimentResult,
+    run_batch,
+    shared_static_map,
+    summarise,
+)
+from two_d_game_ai.world.world import World
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def _scenario(world: World, experiment: Experiment) -> Mapping[str, float]:
+    """Report blocked cells, and a value derived from the seeded `random` module."""
+    b = Bot(name="b0", position_from_sequence=(0, 0))
+    world.add_entity(b)
+    world.step_many(int(experiment.params["steps"]))
+    return {
+        "blocked_cells": len(world.grid.movement_blocking_cells),
+        "random": random.random(),
+    }
+
+
+def test_new_world() -> None:
+    """Test that a `World` created from a static map has the same blocked cells."""
+    # arrange
+    template = World(size=10, grid_size=10)
+    template.add_entity(
+        ObstacleRectangle(name="or0", position_from_sequence=(0, 0), size=(2, 2))
+    )
+    # act
+    with shared_static_map(template) as static_map:
+        w = static_map.new_world()
+    # assert
+    assert w.grid.movement_blocking_cells == template.grid.movement_blocking_cells
+    assert w.grid.blocked_mask == template.grid.blocked_mask
+    assert not w.obstacles
+
+
+def test_run_batch() -> None:
+    """Test that experiments run in worker processes, with results in order."""
+    # arrange
+    template = World(size=10, grid_size=10)
+    template.add_entity(
+        ObstacleRectangle(name="or0", position_from_sequence=(0, 0), size=(2, 2))
+    )
+    experiments = [Experiment(seed=s, params={"steps": 3}) for s in (0, 1, 0)]
+    # act
+    with shared_static_map(template) as static_map:
+        results = run_batch(
+            static_map=static_map,
+            scenario=_scenario,
+            experiments=experiments,
+            max_workers=2,
+        )
+    # assert
+    assert [r.experiment for r in results] == experiments
+    assert all(
+        r.metrics["blocked_cells"] == len(template.grid.movement_blocking_cells)
+        for r in results
+    )
+    # Same seed, same result:
+    assert results[0].metrics["random"] == results[2].metrics["random"]
+    assert results[0].metrics["random"] != results[1].metrics["random"]
+
+
+def test_summarise() -> None:
+    """Test that metrics are summarised across results."""
+    # arrange
+    results = [
+        ExperimentResult(experiment=Experiment(seed=0), metrics={"m": 1}),
+        ExperimentResult(experiment=Experiment(seed=1), metrics={"m": 3}),
+    ]
+    # act
+    summary = summarise(results)
+    # assert
+    assert summary == {"m": {"mean": 2, "min": 1, "max": 3}}
@@ -0,0 +1,111 @@
+"""Tests for `EventBus` class and `World` events."""
+
+from pygame import Vector2
+
+from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.world.events import (
+    ArrivedAtDestination,
+    BotLost,
+    BotSighted,
+    EntityAdded,
+    Event,
+    EventBus,
+)
+from two_d_game_ai.world.world import World
+
+
+def test_subscribe() -> None:
+    """Test that handlers are called with events of the subscribed type only."""
+    # arrange
+    bus = EventBus()
+    received: list[Event] = []
+    bus.subscribe(EntityAdded, received.append)
+    b = Bot(position_from_sequence=(0, 0))
+    # act
+    bus.emit(EntityAdded(b))
+    bus.emit(BotSighted(b, b))
+    # assert
+    assert received == [EntityAdded(b)]
+
+
+def test_unsubscribe() -> None:
+    """Test that unsubscribed handlers aren't called."""
+    # arrange
+    bus = EventBus()
+    received: list[Event] = []
+    bus.subscribe(EntityAdded, received.append)
+    # act
+    bus.unsubscribe(EntityAdded, received.append)
+    bus.emit(EntityAdded(Bot(position_from_sequence=(0, 0))))
+    # assert
+    assert not received
+    assert not bus.has_subscribers(EntityAdded)
+
+
+def test_entity_added() -> None:
+    """Test that the `World` emits an event when an entity is added."""
+    # arrange
+    w = World(10)
+    received: list[EntityAdded] = []
+    w.events.subscribe(EntityAdded, received.append)
+    b = Bot(position_from_sequence=(0, 0))
+    # act
+    w.add_entity(b)
+    # assert
+    assert received == [EntityAdded(b)]
+
+
+def test_arrived_at_destination() -> None:
+    """Test that an event is emitted when a Bot arrives at its destination."""
+    # arrange
+    w = World(10)
+    b = Bot(position_from_sequence=(0, 0))
+    w.add_entity(b)
+    b.destination = Vector2(0, 1)
+    received: list[ArrivedAtDestination] = []
+    w.events.subscribe(ArrivedAtDestination, received.append)
+    # act
+    w.step_many(2 * SIMULATION_FPS)
+    # assert
+    assert received == [ArrivedAtDestination(b, Vector2(0, 1))]
+
+
+def test_arrived_at_destination__redirect() -> None:
+    """Test that a handler can send a Bot on to a new destination."""
+    # arrange
+    w = World(10)
+    b = Bot(position_from_sequence=(0, 0))
+    w.add_entity(b)
+    b.destination = Vector2(0, 1)
+
+    def redirect(event: ArrivedAtDestination) -> None:
+        if event.destination == Vector2(0, 1):
+            event.bot.destination = Vector2(1, 1)
+
+    w.events.subscribe(ArrivedAtDestination, redirect)
+    # act
+    w.step_many(4 * SIMULATION_FPS)
+    # assert
+    assert b.is_at(Vector2(1, 1))
+    assert b.destination is None
+
+
+def test_bot_sighted_and_lost() -> None:
+    """Test that events are emitted when a Bot comes into, and goes out of, view."""
+    # arrange
+    w = World(20)
+    watcher = Bot(name="watcher", position_from_sequence=(0, 0))
+    w.add_entity(watcher)
+    mover = Bot(name="mover", position_from_sequence=(-3, 2), initial_heading=90)
+    w.add_entity(mover)
+    sighted: list[BotSighted] = []
+    lost: list[BotLost] = []
+    w.events.subscribe(BotSighted, sighted.append)
+    w.events.subscribe(BotLost, lost.append)
+    mover.velocity = Vector2(3, 0)
+    # act
+    w.step_many(2 * SIMULATION_FPS)
+    # assert
+    assert BotSighted(watcher, mover) in sighted
+    assert BotLost(watcher, mover) in lost
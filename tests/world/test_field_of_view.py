@@ -0,0 +1,79 @@
+"""Tests for `FieldOfView` class and `Grid.field_of_view`."""
+
+import pytest
+
+from two_d_game_ai.world.grid import Grid
+from two_d_game_ai.world.grid_ref import GridRef
+
+
+def test_open_field_of_view() -> None:
+    """Test that all cells within radius are visible on an open `Grid`."""
+    # arrange
+    g = Grid(size=11)
+    origin = GridRef(5, 5)
+    # act
+    fov = g.field_of_view(origin, 4)
+    # assert
+    for cell in g.cells:
+        distance_squared = (cell.x - 5) ** 2 + (cell.y - 5) ** 2
+        assert (cell in fov) == (distance_squared <= 4**2)
+
+
+def test_wall_occludes() -> None:
+    """Test that cells behind a wall aren't visible, but the wall is."""
+    # arrange
+    g = Grid(size=11)
+    g.block_cells(GridRef(7, y) for y in range(2, 9))
+    # act
+    fov = g.field_of_view(GridRef(5, 5), 5)
+    # assert
+    assert GridRef(7, 5) in fov
+    assert GridRef(8, 5) not in fov
+    assert GridRef(9, 4) not in fov
+    assert GridRef(5, 9) in fov
+    assert GridRef(2, 5) in fov
+
+
+def test_field_of_view_cached_until_grid_changes() -> None:
+    """Test that a field of view is reused, and recomputed when cells are blocked."""
+    # arrange
+    g = Grid(size=11)
+    fov_0 = g.field_of_view(GridRef(5, 5), 5)
+    # act
+    fov_1 = g.field_of_view(GridRef(5, 5), 5)
+    g.block_cells([GridRef(7, 5)])
+    fov_2 = g.field_of_view(GridRef(5, 5), 5)
+    # assert
+    assert fov_1 is fov_0
+    assert GridRef(9, 5) in fov_0
+    assert GridRef(9, 5) not in fov_2
+
+
+def test_field_of_view_cache_cleared_when_cells_blocked() -> None:
+    """Test that cached fields of view are discarded as soon as cells are blocked."""
+    # arrange
+    g = Grid(size=11)
+    g.field_of_view(GridRef(5, 5), 5)
+    g.field_of_view(GridRef(0, 0), 5)
+    # act
+    g.block_cells([GridRef(7, 5)])
+    # assert
+    assert not g._fields_of_view
+
+
+def test_field_of_view_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the cache is bounded, keeping the most recently used."""
+    # arrange
+    monkeypatch.setattr(Grid, "FIELDS_OF_VIEW_CAPACITY", 2)
+    g = Grid(size=11)
+    fov_a = g.field_of_view(GridRef(0, 0), 5)
+    fov_b = g.field_of_view(GridRef(5, 5), 5)
+    # act
+    g.field_of_view(GridRef(0, 0), 5)  # now most recently used
+    g.field_of_view(GridRef(9, 9), 5)  # evicts (5, 5)
+    # assert
+    assert len(g._fields_of_view) == 2
+    assert g.field_of_view(GridRef(0, 0), 5) is fov_a
+    assert g.field_of_view(GridRef(5, 5), 5) is not fov_b
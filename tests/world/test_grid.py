@@ -1,5 +1,11 @@
 """Tests for `Grid` class."""
 
+import copy
+import pickle
+import random
+import threading
+
+import pytest
 from pygame import Vector2
 
 from two_d_game_ai.world.grid import Grid
@@ -29,7 +35,7 @@ def test_cells_on_line() -> None:
     c0 = GridRef(x=0, y=0)
     c1 = GridRef(x=2, y=3)
     # act
-    cs = g._cells_on_line(c0, c1)
+    cs = g.cells_on_line(c0, c1)
     # assert
     assert cs == {
         GridRef(x=0, y=0),
@@ -48,3 +54,105 @@ def test_cell_centre_to_world_pos() -> None:
     world_pos = Grid.cell_centre_to_world_pos(world=w, grid_ref=min_cell)
     # assert
     assert world_pos == Vector2(-45, -45)
+
+
+def test_block_cells() -> None:
+    """Test that only newly blocked cells are returned."""
+    # arrange
+    g = Grid(size=4)
+    g.block_cells({GridRef(0, 0)})
+    # act
+    newly_blocked = g.block_cells({GridRef(0, 0), GridRef(1, 0)})
+    # assert
+    assert newly_blocked == {GridRef(1, 0)}
+    assert g.movement_blocking_cells == {GridRef(0, 0), GridRef(1, 0)}
+
+
+def test_random_free_cell() -> None:
+    """Test that random cells are never blocked, including after more are blocked."""
+    # arrange
+    g = Grid(size=4)
+    rng = random.Random(0)
+    g.block_cells(c for c in g.cells if c.x < 2)
+    g.random_free_cell(rng)  # builds index
+    # act
+    g.block_cells(c for c in g.cells if c.y < 3)
+    cells = {g.random_free_cell(rng) for _ in range(100)}
+    # assert
+    assert cells == {GridRef(2, 3), GridRef(3, 3)}
+
+
+def test_random_free_cell__none_free() -> None:
+    """Test that an error is raised if there are no free cells."""
+    # arrange
+    g = Grid(size=2)
+    g.block_cells(g.cells)
+    # act, assert
+    with pytest.raises(ValueError, match="no free cells"):
+        g.random_free_cell(random.Random(0))
+
+
+def test_search_scratch_reused_per_thread() -> None:
+    """Test that searches reuse scratch arrays; other threads get their own."""
+    # arrange
+    g = Grid(size=8)
+    g.block_cells(GridRef(4, y) for y in range(7))
+    scratch = g.search_scratch()
+    other_thread_scratch = []
+    # act
+    routes = [g.route(GridRef(0, 0), GridRef(7, 0)) for _ in range(2)]
+    thread = threading.Thread(
+        target=lambda: other_thread_scratch.append(g.search_scratch())
+    )
+    thread.start()
+    thread.join()
+    # assert
+    assert routes[0] == routes[1]
+    assert g.search_scratch() is scratch
+    assert scratch.generation == 2
+    assert other_thread_scratch[0] is not scratch
+
+
+def test_copy() -> None:
+    """Test that a Grid can be pickled and deep-copied, with its own search scratch."""
+    # arrange
+    g = Grid(size=8)
+    g.block_cells(GridRef(4, y) for y in range(7))
+    route = g.route(GridRef(0, 0), GridRef(7, 0))
+    # act
+    copies = [copy.deepcopy(g), pickle.loads(pickle.dumps(g))]  # noqa: S301
+    # assert
+    for g_copy in copies:
+        assert g_copy.movement_blocking_cells == g.movement_blocking_cells
+        assert g_copy.route(GridRef(0, 0), GridRef(7, 0)) == route
+        assert g_copy.search_scratch() is not g.search_scratch()
+
+
+def test_block_cells_from_mask() -> None:
+    """Test that cells blocked from a mask are blocked as by `block_cells`."""
+    # arrange
+    template = Grid(size=4)
+    template.block_cells(GridRef(x, 1) for x in range(3))
+    g = Grid(size=4)
+    g.random_free_cell(random.Random(0))  # build free cell index
+    already_blocked = Grid(size=4)
+    already_blocked.block_cells([GridRef(3, 3)])
+    # act
+    for grid in (g, already_blocked):
+        grid.block_cells_from_mask(
+            template.blocked_mask, template.movement_blocking_cells
+        )
+    # assert
+    assert g.movement_blocking_cells == template.movement_blocking_cells
+    assert g.blocked_mask == template.blocked_mask
+    assert g.version == 1
+    rng = random.Random(0)
+    assert all(
+        g.random_free_cell(rng) not in g.movement_blocking_cells for _ in range(50)
+    )
+    assert already_blocked.movement_blocking_cells == {
+        *template.movement_blocking_cells,
+        GridRef(3, 3),
+    }
+    with pytest.raises(ValueError, match="mask must have 16 bytes"):
+        g.block_cells_from_mask(bytes(4), set())
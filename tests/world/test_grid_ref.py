@@ -1,5 +1,7 @@
 """Tests for `GridRef` class."""
 
+from pygame import Vector2
+
 from two_d_game_ai.world.grid_ref import GridRef
 
 
@@ -23,3 +25,13 @@ def test_subtract() -> None:
     gr = gr0 - gr1
     # assert
     assert gr == GridRef(9, -9)
+
+
+def test_multiply() -> None:
+    """Test that a GridRef scaled by a number, either way round, is a `Vector2`."""
+    # arrange
+    gr = GridRef(3, -7)
+    # act
+    results = [gr * 2, 2 * gr]
+    # assert
+    assert results == [Vector2(6, -14), Vector2(6, -14)]
@@ -0,0 +1,100 @@
+"""Tests for `HeadlessRunner` class."""
+
+from pygame import Vector2
+
+from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.entities.obstacles import ObstacleCircle
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.world.headless_runner import HeadlessRunner, RunStats
+from two_d_game_ai.world.world import World
+
+
+def test_run() -> None:
+    """Test that the runner steps the `World` and reports statistics."""
+    # arrange
+    w = World(10)
+    runner = HeadlessRunner(world=w)
+    # act
+    stats = runner.run(20)
+    # assert
+    assert w.step_counter == 20
+    assert stats.steps == 20
+    assert stats.steps_per_second > 0
+
+
+def test_run_until() -> None:
+    """Test that the runner stops when the condition is met."""
+    # arrange
+    w = World(10)
+    runner = HeadlessRunner(world=w)
+    # act
+    stats = runner.run_until(lambda world: world.step_counter >= 3, max_steps=10)
+    # assert
+    assert stats.steps == 3
+
+
+def test_run__paced() -> None:
+    """Test that a capped runner doesn't exceed `max_fps`."""
+    # arrange
+    w = World(10)
+    runner = HeadlessRunner(world=w, max_fps=200)
+    # act
+    stats = runner.run(10)
+    # assert
+    # First step isn't delayed, so pace is measured over the following steps:
+    assert (stats.steps - 1) / stats.elapsed_seconds <= 200
+
+
+def test_stats() -> None:
+    """Test derived statistics."""
+    # arrange / act
+    stats = RunStats(steps=SIMULATION_FPS * 10, elapsed_seconds=2)
+    # assert
+    assert stats.simulated_seconds == 10
+    assert stats.realtime_factor == 5
+
+
+def _sparse_world() -> World:
+    """Bots far apart, each routing around its own obstacle."""
+    w = World(200, grid_size=40, seed=0)
+    for i, x in enumerate([-75, -25, 25, 75]):
+        w.add_entity(ObstacleCircle(position_from_sequence=(x, 0), radius=10))
+        b = Bot(name=f"b{i}", position_from_sequence=(x, -80), initial_heading=90 * i)
+        w.add_entity(b)
+        b.destination = Vector2(x + 5, 80)
+    return w
+
+
+def test_run__fast_forward() -> None:
+    """Test that fast-forwarding gives the same result as stepping."""
+    # arrange
+    w0 = _sparse_world()
+    w1 = _sparse_world()
+    fast_forwarded = metrics.counter("world.steps_fast_forwarded")
+    metrics.reset()
+    # act
+    HeadlessRunner(world=w0).run(3_000)
+    stats = HeadlessRunner(world=w1, fast_forward=True).run(3_000)
+    # assert
+    assert stats.steps == 3_000
+    assert fast_forwarded.value > 2_000
+    for b0, b1 in zip(
+        sorted(w0.bots, key=lambda b: b.name),
+        sorted(w1.bots, key=lambda b: b.name),
+        strict=True,
+    ):
+        assert b0.position == b1.position
+        assert b0.heading.degrees == b1.heading.degrees
+        assert b0.route == b1.route
+
+
+def test_run_until__fast_forward() -> None:
+    """Test that fast-forwarding stops when the condition is met."""
+    # arrange
+    w = _sparse_world()
+    runner = HeadlessRunner(world=w, fast_forward=True)
+    # act
+    stats = runner.run_until(lambda world: world.step_counter >= 500, max_steps=3_000)
+    # assert
+    assert stats.steps == 500
@@ -0,0 +1,56 @@
+"""Tests for Moving AI benchmark file loaders."""
+
+from pathlib import Path
+
+import pytest
+
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.moving_ai import load_map, load_scenarios
+
+
+def test_load_map(moving_ai_map: Path) -> None:
+    """Test that non-passable terrain is blocked, and non-square maps are padded."""
+    # act
+    grid = load_map(moving_ai_map).to_grid()
+    # assert
+    assert grid.size == 4
+    assert grid.movement_blocking_cells == {
+        GridRef(1, 0),
+        GridRef(1, 1),
+        GridRef(2, 1),
+        # padding:
+        GridRef(0, 3),
+        GridRef(1, 3),
+        GridRef(2, 3),
+        GridRef(3, 3),
+    }
+
+
+def test_load_map_to_world(moving_ai_map: Path) -> None:
+    """Test that a `World` is created with one unit per cell."""
+    # act
+    world = load_map(moving_ai_map).to_world()
+    # assert
+    assert world.grid_resolution == 1
+    assert GridRef(2, 1) in world.grid.movement_blocking_cells
+
+
+def test_load_malformed_map(moving_ai_map: Path) -> None:
+    """Test that a map with missing rows is rejected."""
+    # arrange
+    moving_ai_map.write_text(moving_ai_map.read_text().replace("....\n", ""))
+    # act, assert
+    with pytest.raises(ValueError, match="doesn't match"):
+        load_map(moving_ai_map)
+
+
+def test_load_scenarios(moving_ai_scenarios: Path) -> None:
+    """Test that scenario fields are read."""
+    # act
+    scenarios = load_scenarios(moving_ai_scenarios)
+    # assert
+    assert len(scenarios) == 2
+    assert scenarios[0].map_name == "test.map"
+    assert scenarios[0].start == GridRef(0, 0)
+    assert scenarios[0].goal == GridRef(2, 0)
+    assert scenarios[0].optimal_length == 8
@@ -0,0 +1,61 @@
+"""Tests for priority queue implementations."""
+
+import pytest
+
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.priority_queue import (
+    FRONTIERS,
+    IndexedPriorityQueue,
+    PriorityQueue,
+)
+
+
+def test_get_lowest_priority_first() -> None:
+    """Test that locations are returned lowest priority value first; ties in order.
+
+    Ties are broken by insertion order.
+    """
+    # arrange
+    q: PriorityQueue[GridRef] = PriorityQueue()
+    for priority, location in (
+        (2, GridRef(0, 0)),
+        (1, GridRef(5, 5)),
+        (2, GridRef(1, 1)),
+    ):
+        q.put(priority, location)
+    # act
+    locations = [q.get() for _ in range(3)]
+    # assert
+    assert locations == [GridRef(5, 5), GridRef(0, 0), GridRef(1, 1)]
+    assert q.is_empty
+
+
+@pytest.mark.parametrize("frontier_name", sorted(FRONTIERS))
+def test_frontiers_order(frontier_name: str) -> None:
+    """Test that every frontier returns locations in priority order."""
+    # arrange
+    q = FRONTIERS[frontier_name]()
+    priorities = [5.5, 0, 3.2, 1.4, 3.2, 9, 1]
+    for location, priority in enumerate(priorities):
+        q.put(priority, location)
+    # act
+    locations = []
+    while not q.is_empty:
+        locations.append(q.get())
+    # assert
+    assert locations == [1, 6, 3, 2, 4, 0, 5]
+    assert q.pushes == q.pops == len(priorities)
+
+
+def test_indexed_priority_queue_decrease_key() -> None:
+    """Test that putting a queued location with lower priority doesn't duplicate it."""
+    # arrange
+    q: IndexedPriorityQueue[int] = IndexedPriorityQueue()
+    for location in range(5):
+        q.put(10 + location, location)
+    # act
+    q.put(1, 3)
+    q.put(20, 0)  # ignored, as higher
+    # assert
+    assert [q.get() for _ in range(5)] == [3, 0, 1, 2, 4]
+    assert q.is_empty
@@ -0,0 +1,39 @@
+"""Tests for route engines."""
+
+import pytest
+
+from two_d_game_ai.world.grid import Grid
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.route_engines import ROUTE_ENGINES, octile_distance
+
+
+@pytest.mark.parametrize("engine_name", sorted(ROUTE_ENGINES))
+def test_route_around_wall(engine_name: str) -> None:
+    """Test that each engine finds a least-cost path around a wall."""
+    # arrange
+    g = Grid(size=5, route_engine=engine_name)
+    g.block_cells(GridRef(2, y) for y in range(4))
+    # act
+    route = g.route(GridRef(0, 0), GridRef(4, 0))
+    # assert
+    assert route is not None
+    assert route[0] == GridRef(0, 0)
+    assert route[-1] == GridRef(4, 0)
+    assert GridRef(2, 4) in route
+    assert len(route) == 9
+
+
+@pytest.mark.parametrize("engine_name", sorted(ROUTE_ENGINES))
+def test_no_route(engine_name: str) -> None:
+    """Test that each engine returns `None` where the goal is walled off."""
+    # arrange
+    g = Grid(size=5, route_engine=engine_name)
+    g.block_cells(GridRef(2, y) for y in range(5))
+    # act, assert
+    assert g.route(GridRef(0, 0), GridRef(4, 0)) is None
+
+
+def test_octile_distance() -> None:
+    """Test least cost of cardinal and diagonal moves."""
+    # act, assert
+    assert octile_distance(GridRef(0, 0), GridRef(3, 1)) == pytest.approx(2 + 2**0.5)
@@ -0,0 +1,39 @@
+"""Tests for `RouteIndex` class."""
+
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.route_index import RouteIndex
+
+
+def test_owners_through() -> None:
+    """Test that owners are found by the cells their routes pass through."""
+    # arrange
+    index: RouteIndex[str] = RouteIndex()
+    index.update("a", {GridRef(0, 0), GridRef(1, 0)})
+    index.update("b", {GridRef(1, 0), GridRef(2, 0)})
+    # act, assert
+    assert index.owners_through([GridRef(0, 0)]) == {"a"}
+    assert index.owners_through([GridRef(1, 0), GridRef(5, 5)]) == {"a", "b"}
+
+
+def test_update_replaces_route() -> None:
+    """Test that an owner's previous route is no longer indexed."""
+    # arrange
+    index: RouteIndex[str] = RouteIndex()
+    index.update("a", {GridRef(0, 0)})
+    # act
+    index.update("a", {GridRef(3, 3)})
+    # assert
+    assert not index.owners_through([GridRef(0, 0)])
+    assert index.owners_through([GridRef(3, 3)]) == {"a"}
+
+
+def test_discard() -> None:
+    """Test that a discarded owner isn't found."""
+    # arrange
+    index: RouteIndex[str] = RouteIndex()
+    index.update("a", {GridRef(0, 0)})
+    # act
+    index.discard("a")
+    # assert
+    assert "a" not in index
+    assert not index.owners_through([GridRef(0, 0)])
@@ -0,0 +1,77 @@
+"""Tests for `SensingScheduler` class."""
+
+from pygame import Vector2
+
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.world.sensing_scheduler import SensingScheduler
+from two_d_game_ai.world.world import World
+
+
+def _world_with_bots(count: int) -> tuple[World, list[Bot]]:
+    w = World(40)
+    bots = []
+    for i in range(count):
+        b = Bot(name=f"b{i}", position_from_sequence=(i, 0))
+        w.add_entity(b)
+        bots.append(b)
+    return w, bots
+
+
+def test_interval() -> None:
+    """Test that intervals depend on activity and distance from focus."""
+    # arrange
+    _, (b0, _, b2) = _world_with_bots(3)
+    scheduler = SensingScheduler(focus=Vector2(0, 0), near_distance=1.5)
+    b2.velocity = Vector2(1, 0)
+    # act, assert
+    assert scheduler.interval(b0) == scheduler.near_interval
+    assert scheduler.interval(b2) == scheduler.far_interval
+    b2.velocity = Vector2(0, 0)
+    assert scheduler.interval(b2) == scheduler.idle_interval
+
+
+def test_interval__routed_bot_far_from_focus() -> None:
+    """Test that a Bot on a route, far from focus, senses at the far interval."""
+    # arrange
+    _, (b0, _, b2) = _world_with_bots(3)
+    scheduler = SensingScheduler(focus=Vector2(0, 0), near_distance=1.5)
+    # act
+    b2.destination = Vector2(10, 10)
+    b2.velocity = Vector2(1, 0)
+    # assert
+    assert b2.route
+    assert scheduler.interval(b2) == scheduler.far_interval
+    # unless following a leader:
+    b2.leader = b0
+    assert scheduler.interval(b2) == scheduler.near_interval
+
+
+def test_staggered() -> None:
+    """Test that each Bot senses once per interval, spread evenly across steps."""
+    # arrange
+    _, bots = _world_with_bots(8)
+    scheduler = SensingScheduler(idle_interval=4)
+    # act
+    due_per_step = []
+    for step in range(4):
+        scheduler.begin_step(step)
+        due_per_step.append({b for b in bots if scheduler.is_due(b)})
+    # assert
+    assert [len(due) for due in due_per_step] == [2, 2, 2, 2]
+    assert set().union(*due_per_step) == set(bots)
+
+
+def test_max_per_step() -> None:
+    """Test that sensing per step is capped, and Bots which miss out sense later."""
+    # arrange
+    _, bots = _world_with_bots(5)
+    scheduler = SensingScheduler(near_interval=1, idle_interval=1, max_per_step=2)
+    # act
+    due_per_step = []
+    for step in range(3):
+        scheduler.begin_step(step)
+        due_per_step.append([b for b in bots if scheduler.is_due(b)])
+    # assert
+    assert [len(due) for due in due_per_step] == [2, 2, 2]
+    # Bots which missed out on the first step sense on the second:
+    assert set(due_per_step[0]) | set(due_per_step[1]) == set(bots[:4])
@@ -0,0 +1,109 @@
+"""Tests for `ShardedWorld` class."""
+
+import pytest
+from pygame import Vector2
+
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.world.sharded_world import (
+    BotState,
+    ShardedWorld,
+    _ghost,
+    _kinematics,
+)
+from two_d_game_ai.world.world import World
+
+
+def _moving_bot_world() -> tuple[World, Bot]:
+    w = World(20)
+    b = Bot(name="b0", position_from_sequence=(-1, -5), initial_heading=90)
+    w.add_entity(b)
+    b.velocity = Vector2(2.5, 0)
+    return w, b
+
+
+def test_bot_state_round_trip() -> None:
+    """Test that a `Bot` can be copied via its state."""
+    # arrange
+    w = World(20)
+    b0 = Bot(name="b0", position_from_sequence=(1, 2), initial_heading=45)
+    w.add_entity(b0)
+    b0.destination = Vector2(5, 5)
+    # act
+    b1 = BotState.from_bot(b0).to_bot()
+    # assert
+    assert b1.id == b0.id
+    assert b1.position == b0.position
+    assert b1.destination == b0.destination
+    assert b1.route == b0.route
+
+
+def test_export_without_id() -> None:
+    """Test that exporting a `Bot` not in a `World` names the unexpected id type."""
+    # arrange
+    b = Bot(name="b0", position_from_sequence=(1, 2))
+    # act, assert
+    for export in (_kinematics, _ghost):
+        with pytest.raises(TypeError, match="`id` is NoneType, not int"):
+            export(b)
+
+
+def test_migration() -> None:
+    """Test that a `Bot` crossing a tile boundary moves as in an unsharded `World`."""
+    # arrange
+    w0, b0 = _moving_bot_world()
+    w1, b1 = _moving_bot_world()
+    # act
+    w0.step_many(60)
+    with ShardedWorld(world=w1, tiles_per_side=2) as sw:
+        sw.step_many(60)
+        tile = sw.tile_index(b1.position)
+    # assert
+    assert tile == 1
+    assert w1.step_counter == 60
+    assert b1.position == b0.position
+
+
+def test_sensing_across_tiles() -> None:
+    """Test that a `Bot` can see a `Bot` in another tile."""
+    # arrange
+    w = World(20)
+    b0 = Bot(name="b0", position_from_sequence=(-1, 5), initial_heading=90)
+    w.add_entity(b0)
+    b1 = Bot(name="b1", position_from_sequence=(1, 5))
+    w.add_entity(b1)
+    # act
+    with ShardedWorld(world=w, tiles_per_side=2) as sw:
+        sw.step_many(2)
+    # assert
+    assert b0.visible_bots == {b1}
+
+
+def _leader_world() -> tuple[World, Bot, Bot]:
+    w = World(40)
+    leader = Bot(name="leader", position_from_sequence=(15, 15), initial_heading=90)
+    w.add_entity(leader)
+    follower = Bot(
+        name="follower",
+        position_from_sequence=(-15, -15),
+        leader=leader,
+        has_memory=True,
+    )
+    w.add_entity(follower)
+    leader.velocity = Vector2(1, 0)
+    return w, leader, follower
+
+
+def test_leader_in_other_tile() -> None:
+    """Test that a `Bot` follows a leader in a distant tile, as if unsharded."""
+    # arrange
+    w0, _, f0 = _leader_world()
+    w1, l1, f1 = _leader_world()
+    # act
+    w0.step_many(120)
+    with ShardedWorld(world=w1, tiles_per_side=2) as sw:
+        sw.step_many(120)
+        tiles = {sw.tile_index(f1.position), sw.tile_index(l1.position)}
+    # assert
+    assert len(tiles) == 2
+    assert f1.leader is l1
+    assert f1.position == f0.position
@@ -0,0 +1,44 @@
+"""Tests for `SpatialHash` class."""
+
+from pygame import Vector2
+
+from two_d_game_ai.world.spatial_hash import SpatialHash
+
+
+def test_near() -> None:
+    """Test that items in nearby buckets are returned, and distant ones aren't."""
+    # arrange
+    sh: SpatialHash[str] = SpatialHash(bucket_size=10)
+    sh.insert("a", Vector2(1, 1))
+    sh.insert("b", Vector2(-5, 12))
+    sh.insert("c", Vector2(50, 50))
+    # act
+    items = set(sh.near(Vector2(0, 0), 10))
+    # assert
+    assert items == {"a", "b"}
+
+
+def test_insert_moves_item() -> None:
+    """Test that re-inserting an item moves it."""
+    # arrange
+    sh: SpatialHash[str] = SpatialHash(bucket_size=10)
+    sh.insert("a", Vector2(1, 1))
+    # act
+    sh.insert("a", Vector2(50, 50))
+    # assert
+    assert not set(sh.near(Vector2(0, 0), 1))
+    assert set(sh.near(Vector2(50, 50), 1)) == {"a"}
+    assert len(sh) == 1
+
+
+def test_discard() -> None:
+    """Test that a discarded item is no longer returned."""
+    # arrange
+    sh: SpatialHash[str] = SpatialHash(bucket_size=10)
+    sh.insert("a", Vector2(1, 1))
+    # act
+    sh.discard("a")
+    sh.discard("a")
+    # assert
+    assert "a" not in sh
+    assert not set(sh.near(Vector2(0, 0), 10))
@@ -1,5 +1,8 @@
 """Tests for `World` class."""
 
+import copy
+import pickle
+
 import pytest
 from pygame import Vector2
 
@@ -92,3 +95,84 @@ def test_cell_from_pos__out_of_bounds() -> None:
     # act, assert
     with pytest.raises(ValueError, match="Can't get a `GridRef` for pos"):
         w.grid_ref_from_pos(pos)
+
+
+def test_remove_entity() -> None:
+    """Test removing a Bot from the World."""
+    # arrange
+    w = World(10)
+    b = Bot(
+        name="b0",
+        position_from_sequence=(0, 0),
+    )
+    w.add_entity(b)
+    # act
+    w.remove_entity(b)
+    # assert
+    assert w.entities == set()
+    assert b.world is None
+
+
+def test_entity_ids_unique_after_removal() -> None:
+    """Test that entity ids aren't reused after an entity is removed."""
+    # arrange
+    w = World(10)
+    b0 = Bot(name="b0", position_from_sequence=(0, 0))
+    b1 = Bot(name="b1", position_from_sequence=(0, 0))
+    b2 = Bot(name="b2", position_from_sequence=(0, 0))
+    w.add_entity(b0)
+    w.add_entity(b1)
+    # act
+    w.remove_entity(b0)
+    w.add_entity(b2)
+    # assert
+    assert b2.id not in {b0.id, b1.id}
+
+
+def test_random_location() -> None:
+    """Test that random locations are inside the World and not movement-blocked."""
+    # arrange
+    w = World(size=10, grid_size=10, seed=0)
+    w.add_entity(
+        ObstacleRectangle(
+            name="m0",
+            position_from_sequence=(-5, -5),
+            size=(10, 9),
+        )
+    )
+    # act
+    locations = [w.random_location() for _ in range(100)]
+    # assert
+    assert all(w.location_is_inside_world_bounds(p) for p in locations)
+    assert not any(w.location_is_movement_blocked(p) for p in locations)
+
+
+def test_random_location__seeded() -> None:
+    """Test that Worlds with the same seed give the same random locations."""
+    # arrange
+    w0 = World(size=10, grid_size=10, seed=1)
+    w1 = World(size=10, grid_size=10, seed=1)
+    # act, assert
+    assert w0.random_location() == w1.random_location()
+
+
+def test_copy() -> None:
+    """Test that a World can be pickled and deep-copied, then stepped independently."""
+    # arrange
+    w = World(40, grid_size=20, seed=0)
+    w.grid.block_cells(GridRef(10, y) for y in range(2, 18))
+    for i in range(3):
+        b = Bot(name=f"b{i}", position_from_sequence=(-10, 3 * i), team="a")
+        w.add_entity(b)
+        b.destination = Vector2(10, 3 * i)
+    w.step_many(5)
+    # act
+    copies = [copy.deepcopy(w), pickle.loads(pickle.dumps(w))]  # noqa: S301
+    w.step_many(50)
+    # assert
+    for w_copy in copies:
+        w_copy.step_many(50)
+        positions = sorted((b.name, tuple(b.position)) for b in w.bots)
+        copy_positions = sorted((b.name, tuple(b.position)) for b in w_copy.bots)
+        assert copy_positions == positions
+        assert all(b.world is w_copy for b in w_copy.bots)
@@ -1,9 +1,15 @@
 """Test integration of `World` and other classes."""
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from pygame import Vector2
 
 from two_d_game_ai import SIMULATION_FPS
 from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.entities.obstacles import ObstacleCircle, ObstacleRectangle
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.world.grid_ref import GridRef
 from two_d_game_ai.world.world import World
 
 
@@ -21,3 +27,342 @@ def test_bot_move_in_world_context() -> None:
     w.update()
     # assert
     assert b.position == Vector2(1 / SIMULATION_FPS, 0)
+
+
+def test_step_many() -> None:
+    """Test that `World` takes the requested number of steps, moving the Bot."""
+    # arrange
+    w = World(10)
+    b = Bot(
+        name="b0",
+        position_from_sequence=(0, 0),
+    )
+    w.add_entity(b)
+    b.velocity = Vector2(1, 0)
+    # act
+    w.step_many(SIMULATION_FPS)
+    # assert
+    assert w.step_counter == SIMULATION_FPS
+    assert b.position.x == pytest.approx(1)
+
+
+def test_run_until() -> None:
+    """Test that `World` stops stepping when the condition is met."""
+    # arrange
+    w = World(10)
+    # act
+    steps = w.run_until(lambda world: world.step_counter >= 5, max_steps=100)
+    # assert
+    assert steps == 5
+    assert w.step_counter == 5
+
+
+def test_run_until__max_steps() -> None:
+    """Test that `World` stops stepping at `max_steps` if the condition isn't met."""
+    # arrange
+    w = World(10)
+    # act
+    steps = w.run_until(lambda _: False, max_steps=7)
+    # assert
+    assert steps == 7
+
+
+def test_idle_bot_sleeps() -> None:
+    """Test that a Bot with nothing to do isn't updated."""
+    # arrange
+    w = World(10)
+    b = Bot(
+        name="b0",
+        position_from_sequence=(0, 0),
+    )
+    w.add_entity(b)
+    # act
+    w.update()
+    # assert
+    assert w.active_bots == set()
+
+
+def test_sleeping_bot_woken_by_destination() -> None:
+    """Test that a sleeping Bot is woken when given a destination."""
+    # arrange
+    w = World(10)
+    b = Bot(
+        name="b0",
+        position_from_sequence=(0, 0),
+    )
+    w.add_entity(b)
+    w.update()
+    # act
+    b.destination = Vector2(0, 2)
+    w.step_many(SIMULATION_FPS)
+    # assert
+    assert b.position.y > 0
+
+
+def test_sleeping_bot_woken_by_bot_in_view() -> None:
+    """Test that a sleeping Bot is woken when another Bot moves into view."""
+    # arrange
+    w = World(20)
+    watcher = Bot(
+        name="watcher",
+        position_from_sequence=(0, 0),
+    )
+    w.add_entity(watcher)
+    mover = Bot(
+        name="mover",
+        position_from_sequence=(-3, 2),
+        initial_heading=90,
+    )
+    w.add_entity(mover)
+    w.update()
+    # act
+    mover.destination = Vector2(3, 2)
+    w.step_many(SIMULATION_FPS)
+    # assert
+    assert watcher in w.active_bots
+    assert watcher.visible_bots == {mover}
+
+
+def test_sleeping_bot_woken_by_bot_added_in_view() -> None:
+    """Test that a sleeping Bot is woken when a Bot is added in its view."""
+    # arrange
+    w = World(20)
+    watcher = Bot(name="watcher", position_from_sequence=(0, 0))
+    w.add_entity(watcher)
+    w.update()
+    assert watcher not in w.active_bots
+    # act
+    newcomer = Bot(name="newcomer", position_from_sequence=(0, 3))
+    w.add_entity(newcomer)
+    w.update()
+    # assert
+    assert watcher in w.active_bots
+    assert watcher.visible_bots == {newcomer}
+
+
+def _followers_world() -> tuple[World, Bot, list[Bot]]:
+    w = World(20, grid_size=20)
+    # wall between followers and leader, with a gap at the North:
+    w.grid.block_cells(GridRef(10, y) for y in range(15))
+    leader = Bot(name="leader", position_from_sequence=(5, -5))
+    w.add_entity(leader)
+    followers = [
+        Bot(name=f"f{i}", position_from_sequence=p, leader=leader, has_memory=True)
+        for i, p in enumerate([(-5, -5), (-5, -3), (-3, -5)])
+    ]
+    for f in followers:
+        w.add_entity(f)
+    return w, leader, followers
+
+
+def test_followers_share_group_route() -> None:
+    """Test that followers of a leader join one route, rather than each searching."""
+    # arrange
+    w, leader, followers = _followers_world()
+    searches = metrics.histogram("grid.nodes_expanded")
+    metrics.reset()
+    # act
+    w.update()
+    # assert
+    assert searches.count == 1
+    routes = [f.route or [] for f in followers]
+    assert all(r and r[-1] == leader.position for r in routes)
+    # interior waypoints are shared, not copied:
+    assert any(wp is routes[0][-2] for wp in routes[1])
+
+
+def test_followers_share_group_route__executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that followers deciding in parallel chunks still share one search."""
+    # arrange
+    monkeypatch.setattr(World, "UPDATE_CHUNK_SIZE", 1)
+    w, leader, followers = _followers_world()
+    searches = metrics.histogram("grid.nodes_expanded")
+    metrics.reset()
+    # act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        w.update_executor = executor
+        w.update()
+    # assert
+    assert searches.count == 1
+    assert all(f.route and f.route[-1] == leader.position for f in followers)
+
+
+def test_routes_through_new_obstacle_repaired() -> None:
+    """Test that only routes through a newly added obstacle are repaired."""
+    # arrange
+    w = World(20, grid_size=20)
+    # any obstacle, so that routes are cell-based:
+    w.add_entity(ObstacleRectangle(position_from_sequence=(-10, 9), size=(1, 1)))
+    b0 = Bot(name="b0", position_from_sequence=(-5, 0))
+    b1 = Bot(name="b1", position_from_sequence=(-5, -8))
+    w.add_entity(b0)
+    w.add_entity(b1)
+    b0.destination = Vector2(5, 0)
+    b1.destination = Vector2(5, -8)
+    b1_route = b1.route
+    repairs = metrics.counter("world.routes_repaired")
+    metrics.reset()
+    # act
+    w.add_entity(ObstacleCircle(position_from_sequence=(0, 0), radius=2))
+    # assert
+    assert repairs.value == 1
+    assert b0.route
+    assert b0.route[-1] == Vector2(5, 0)
+    assert not any(w.location_is_movement_blocked(p) for p in b0.route)
+    assert b1.route is b1_route
+
+
+def _swarm_world() -> World:
+    w = World(40, seed=0)
+    for i in range(20):
+        b = Bot(
+            name=f"b{i}",
+            position_from_sequence=tuple(w.random_location()),
+            initial_heading=w.rng.uniform(0, 360),
+        )
+        w.add_entity(b)
+        b.destination = w.random_location()
+    return w
+
+
+def _following_world() -> World:
+    w = World(40, grid_size=20, seed=0)
+    # walls between followers and leaders, with gaps at the ends:
+    w.grid.block_cells(GridRef(10, y) for y in range(2, 18))
+    w.grid.block_cells(GridRef(x, 10) for x in range(12, 18))
+    for i in range(3):
+        leader = Bot(name=f"l{i}", position_from_sequence=(10, 8 * i - 8))
+        w.add_entity(leader)
+        leader.destination = Vector2(15, -8 * i + 8)
+        for j in range(5):
+            follower = Bot(
+                name=f"l{i}f{j}",
+                position_from_sequence=tuple(w.random_location()),
+                leader=leader,
+                has_memory=True,
+            )
+            w.add_entity(follower)
+    return w
+
+
+def test_update_order_independent() -> None:
+    """Test that Bots decide against positions at the start of the step."""
+    # arrange
+    w = World(10)
+    b0 = Bot(name="b0", position_from_sequence=(0, 0), initial_heading=90)
+    b1 = Bot(name="b1", position_from_sequence=(1.02, 0), initial_heading=90)
+    w.add_entity(b0)
+    w.add_entity(b1)
+    b0.velocity = Vector2(2.5, 0)
+    b1.velocity = Vector2(2.5, 0)
+    # act
+    w.update_bots([b1, b0])
+    # assert
+    # b0 decided against b1's old position, so collided, whichever moved first:
+    assert b0.position == Vector2(0, 0)
+    assert b1.position == Vector2(1.02 + 2.5 / SIMULATION_FPS, 0)
+
+
+def test_update_executor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that updating in parallel chunks gives the same result as in series."""
+    # arrange
+    monkeypatch.setattr(World, "UPDATE_CHUNK_SIZE", 3)
+    for make_world in (_swarm_world, _following_world):
+        w0 = make_world()
+        w1 = make_world()
+        # act
+        w0.step_many(30)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            w1.update_executor = executor
+            w1.step_many(30)
+        # assert
+        bots0 = sorted(w0.bots, key=lambda b: b.name)
+        bots1 = sorted(w1.bots, key=lambda b: b.name)
+        assert [b.position for b in bots0] == [b.position for b in bots1]
+        assert [b.route for b in bots0] == [b.route for b in bots1]
+
+
+def test_team_members_take_turns_to_sense() -> None:
+    """Test that non-scout team members each sense once per team-size steps."""
+    # arrange
+    w = World(100)
+    members = [
+        Bot(name=f"m{i}", position_from_sequence=(i, 0), team="a") for i in range(3)
+    ]
+    scout = Bot(name="scout", position_from_sequence=(0, 5), team="a", is_scout=True)
+    for b in [*members, scout]:
+        w.add_entity(b)
+    # act
+    due = []
+    for _ in range(3):
+        due.append([w.sensing_is_due(b) for b in members])
+        assert w.sensing_is_due(scout)
+        w.step_counter += 1
+    # assert
+    assert [sum(step) for step in due] == [1, 1, 1]
+    assert [sum(bot) for bot in zip(*due, strict=True)] == [1, 1, 1]
+
+
+def test_team_sleeping_members_dont_take_turns() -> None:
+    """Test that an active team member senses every step if the rest are asleep."""
+    # arrange
+    w = World(200)
+    # spaced out, so they can't see each other:
+    members = [
+        Bot(name=f"m{i}", position_from_sequence=(20 * i - 70, 0), team="a")
+        for i in range(8)
+    ]
+    for b in members:
+        w.add_entity(b)
+    mover = members[3]
+    mover.destination = Vector2(-10, 90)
+    w.update()
+    assert w.active_bots == {mover}
+    # act
+    due = []
+    for _ in range(8):
+        due.append(w.sensing_is_due(mover))
+        w.update()
+    # assert
+    assert all(due)
+
+
+def test_team_members_see_team_sightings() -> None:
+    """Test that a member which doesn't sense sees what a teammate saw that step."""
+    # arrange
+    w = World(100)
+    sensor = Bot(name="sensor", position_from_sequence=(0, 0), team="a")
+    member = Bot(name="member", position_from_sequence=(-40, 0), team="a")
+    other = Bot(name="other", position_from_sequence=(0, 5))
+    for b in [sensor, member, other]:
+        w.add_entity(b)
+    assert w.sensing_is_due(sensor)
+    assert not w.sensing_is_due(member)
+    # act
+    w.update()
+    # assert
+    assert not member.can_see(other)
+    assert member.visible_bots == {other}
+    assert sensor.visible_bots == {other}
+
+
+def test_team_shares_sightings() -> None:
+    """Test that a Bot seen by one team member is known to the whole team."""
+    # arrange
+    w = World(100)
+    scout = Bot(name="scout", position_from_sequence=(0, 0), team="a", is_scout=True)
+    member = Bot(name="member", position_from_sequence=(-40, 0), team="a")
+    other = Bot(name="other", position_from_sequence=(0, 5))
+    for b in [scout, member, other]:
+        w.add_entity(b)
+    # act
+    w.update()
+    # assert
+    assert other not in member.visible_bots
+    assert [s.bot_id for s in w.team_sightings("a")] == [other.id]
+    # sightings expire:
+    w.remove_entity(other)
+    w.step_counter += World.BLACKBOARD_MAX_AGE + 1
+    assert w.team_sightings("a") == []
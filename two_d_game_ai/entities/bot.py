@@ -10,13 +10,28 @@ from loguru import logger
 from pygame import Vector2
 
 from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.entities.bot_memory import BotMemory
 from two_d_game_ai.entities.generic_entity import GenericEntity
 from two_d_game_ai.geometry import point_in_or_on_circle
 from two_d_game_ai.geometry.bearing import Bearing
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.tracing import traced
+from two_d_game_ai.world.events import (
+    ArrivedAtDestination,
+    ArrivedAtWaypoint,
+    BotLost,
+    BotSighted,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
 
+    from two_d_game_ai.world.field_of_view import FieldOfView
+
+_WAYPOINT_ARRIVALS = metrics.counter("bot.waypoint_arrivals")
+_DESTINATION_ARRIVALS = metrics.counter("bot.destination_arrivals")
+_COLLISIONS = metrics.counter("bot.collisions")
+
 
 @dataclass(kw_only=True, eq=False)
 class Bot(GenericEntity):
@@ -38,20 +53,43 @@ class Bot(GenericEntity):
     """Initial direction the `Bot` is facing. Degrees."""
     has_memory: bool = False
     """Can remember peers."""
+    memory_capacity: int = 32
+    """Maximum number of peers remembered. Least recently seen are forgotten first."""
+    memory_duration: float | None = 30
+    """Seconds for which a peer is remembered. If `None`, indefinitely."""
     vision_range: float = 10
     """`World` units."""
+    team: str | None = None
+    """`Bot`s in a team share sightings; see `World.team_sightings`. Members which
+    don't sense in a step see what the team saw. Set before adding to `World`."""
+    is_scout: bool = False
+    """Whether a team member senses every step. Other members take turns."""
+    vision_is_occluded: bool = False
+    """Whether movement-blocking `Grid` cells block vision; see
+    `two_d_game_ai.world.grid.Grid.field_of_view`."""
+    senses_eagerly: bool = False
+    """Whether to sense as soon as due, rather than when `visible_bots` is next read.
+    Set for `has_memory` Bots which must track peers continuously, e.g. to remember
+    where each was lost from sight. Implied by a leader, team or sighting events."""
 
     heading: Bearing = field(init=False)
     """Direction the `Bot` is facing."""
     velocity: Vector2 = field(init=False)
     route: list[Vector2] | None = None
     """Waypoints to be visited, in order."""
-    visible_bots: set[Bot] = field(init=False, default_factory=set)
-    """Peers which are currently in sight."""
-    remembered_bots: set[Bot] = field(init=False, default_factory=set)
-    """Peers which are known about, but aren't currently in sight."""
+    memory: BotMemory | None = field(init=False, default=None)
+    """When and where peers which aren't currently in sight were last seen.
+
+    `None` unless `has_memory`.
+    """
 
     _destination: Vector2 | None = field(init=False, default=None)
+    _visible_bots: set[Bot] = field(init=False, default_factory=set)
+    _is_sensing_pending: bool = field(init=False, default=False)
+    """Sensing was due, but deferred until `visible_bots` is read."""
+    _next_position: Vector2 = field(init=False)
+    """Decided by `decide`, applied by `move`. Valid if `_has_next_position`."""
+    _has_next_position: bool = field(init=False, default=False)
 
     def __post_init__(
         self, position_from_sequence: Sequence[float], initial_heading: float
@@ -59,6 +97,16 @@ class Bot(GenericEntity):
         super().__post_init__(position_from_sequence)
         self.heading: Bearing = Bearing(initial_heading)
         self.velocity: Vector2 = Vector2(0, 0)
+        self._next_position = Vector2(0, 0)
+        if self.has_memory:
+            self.memory = BotMemory(
+                capacity=self.memory_capacity,
+                max_age=(
+                    None
+                    if self.memory_duration is None
+                    else round(self.memory_duration * SIMULATION_FPS)
+                ),
+            )
         if self.leader:
             logger.info(f"{self!s}: leader={self.leader!s}.")
 
@@ -67,6 +115,49 @@ class Bot(GenericEntity):
         """Get maximum rotation, in degrees per simulation step."""
         return self.max_rotation_rate / SIMULATION_FPS
 
+    @property
+    def is_idle(self) -> bool:
+        """Whether the `Bot` has nothing to do.
+
+        i.e. it has no destination or route, is stationary, and can't see anyone.
+        """
+        return (
+            not self.route
+            and self._destination is None
+            and not self.velocity
+            and not self.visible_bots
+        )
+
+    @property
+    def visible_bots(self) -> set[Bot]:
+        """Peers which are currently in sight.
+
+        Unless sensing eagerly, sensed when first read after sensing is due, against
+        positions at that time; then memoised until sensing is next due.
+        """
+        self._sense_if_pending()
+        return self._visible_bots
+
+    @visible_bots.setter
+    def visible_bots(self, bots: set[Bot]) -> None:
+        self._is_sensing_pending = False
+        self._visible_bots = bots
+
+    @property
+    def remembered_bots(self) -> set[Bot]:
+        """Peers which are remembered, but aren't currently in sight.
+
+        Only those still in the `World`.
+        """
+        self._sense_if_pending()
+        if self.memory is None or not self.world:
+            return set()
+        return {
+            bot
+            for bot_id in self.memory
+            if (bot := self.world.bot_by_id(bot_id)) is not None
+        }
+
     @property
     def destination(self) -> Vector2 | None:
         """Destination point in `World` coordinates."""
@@ -80,88 +171,202 @@ class Bot(GenericEntity):
             raise ValueError(err_msg)
 
         if proposed_destination is None:
-            logger.debug(f"{self!s}: destination -> `None`.")
+            logger.debug("{}: destination -> `None`.", self)
             self._destination = None
+            self.world.track_route(self)
         elif (
             proposed_destination != self.position
             and not self.is_at(proposed_destination)
             and self.world.location_is_inside_world_bounds(proposed_destination)
         ):
-            logger.info(f"{self!s}: destination -> {proposed_destination}.")
+            logger.info("{}: destination -> {}.", self, proposed_destination)
             self.stop()
-            self._destination = proposed_destination
-
-            if self.destination:
-                self.route = self.world.route(
-                    from_pos=self.position, to_pos=self.destination
-                )
-            if self.route:
-                logger.info(f"{self!s}: routed: {len(self.route)} waypoints.")
+            # Copied, as positions are updated in place:
+            self._destination = Vector2(proposed_destination)
+            self.world.wake(self)
+            self.replan_route()
+
+    def replan_route(self) -> None:
+        """Route from current position to destination, replacing any route."""
+        if not self.world or not self.destination:
+            return
+        if self.leader and self.destination == self.leader.position:
+            self.route = self.world.group_route(self.leader, from_pos=self.position)
+        else:
+            self.route = self.world.route(
+                from_pos=self.position, to_pos=self.destination
+            )
+        if self.route:
+            logger.info("{}: routed: {} waypoints.", self, len(self.route))
 
-                if len(self.route) >= 2:  # noqa: PLR2004
-                    del self.route[0]
-                    # effectively suppress reporting arrival at first waypoint, which is
-                    # always own position
+            if len(self.route) >= 2:  # noqa: PLR2004
+                del self.route[0]
+                # effectively suppress reporting arrival at first waypoint, which is
+                # always own position
+        self.world.track_route(self)
 
     def destination_from_sequence(self, position: Sequence[float]) -> None:
         """Set destination point."""
         self.destination = Vector2(position)
 
     def update(self) -> None:
-        """Update `Bot`, including move over 1 simulation step."""
+        """Update `Bot`, including move over 1 simulation step.
+
+        Equivalent to `decide` then `move`. To update several `Bot`s consistently, use
+        `World.update_bots`.
+        """
+        if not self.world:
+            err_msg = f"Can't update {self!s}. Add to World first."
+            raise ValueError(err_msg)
+        self.decide(is_sensing_due=self.world.sensing_is_due(self))
+        self.move()
+
+    def decide(self, *, is_sensing_due: bool) -> None:
+        """Read phase of an update: sense, steer, and decide the next position.
+
+        Reads, but doesn't change, other `Bot`s' positions; own position is unchanged
+        until `move`.
+
+        Parameters
+        ----------
+        is_sensing_due
+            Whether to sense this step; see `World.sensing_is_due`.
+        """
         if not self.world:
             err_msg = f"Can't update {self!s}. Add to World first."
             raise ValueError(err_msg)
 
+        self._has_next_position = False
         other_bots = self.world.bots - {self}
-        self.handle_sensing(other_bots)
+        if is_sensing_due:
+            if self._must_sense_eagerly():
+                self.handle_sensing(other_bots)
+            else:
+                self._is_sensing_pending = True
 
         if self.leader and self.destination != self.leader.position:
             self.destination = self.leader.position.copy()
 
         if self.route:
-            if not self.destination:
-                err_msg = f"{self!s} has a route but no destination!"
-                raise ValueError(err_msg)
-
-            if self.is_at(self.destination):
-                logger.info(f"{self!s}: arrived at destination.")
-                self.stop()
-                self.route = []
-                self.destination = None
+            if self._handle_arrival():
                 return
+            self._steer_towards(self.route[0])
 
-            if self.is_at(self.route[0]):
-                logger.info(f"{self!s}: arrived at waypoint.")
-                self.stop()
-                del self.route[0]
-                return
+        if not self.velocity:
+            return
+        next_x = self.position.x + self.velocity.x / SIMULATION_FPS
+        next_y = self.position.y + self.velocity.y / SIMULATION_FPS
 
-            waypoint_relative_bearing = self.heading.relative(
-                self.route[0] - self.position
-            ).degrees_normalised
+        if self._is_in_collision(next_x, next_y, other_bots):
+            _COLLISIONS.inc()
+            self.stop()
+        else:
+            self._next_position.update(next_x, next_y)
+            self._has_next_position = True
 
-            #  if Bot can complete rotation to face wp this step...
-            if abs(waypoint_relative_bearing) <= self.max_rotation_step:
-                # face wp precisely
-                self.rotate(waypoint_relative_bearing)
-                # initiate move towards wp
-                self.velocity = self.heading.vector * self.max_speed
+    def move(self) -> bool:
+        """Write phase of an update: move to the position decided by `decide`, if any.
 
-            else:
-                # turn towards wp
-                self.rotate(
-                    math.copysign(
-                        self.max_rotation_step,
-                        waypoint_relative_bearing,
-                    ),
-                )
-        next_pos = self.position + self.velocity / SIMULATION_FPS
-
-        if self._is_in_collision(next_pos, other_bots):
+        Returns
+        -------
+        bool
+            `True` if `Bot` moved, else `False`.
+        """
+        if not self._has_next_position:
+            return False
+        self._has_next_position = False
+        self.position.update(self._next_position)
+        return True
+
+    def coast(self) -> None:
+        """Steer and move over 1 simulation step, without sensing or collision checks.
+
+        Equivalent to `update` while nothing is in sensing or collision range, and the
+        `Bot` isn't arriving; see `two_d_game_ai.world.fast_forward`.
+        """
+        if self.route:
+            self._steer_towards(self.route[0])
+        if self.velocity:
+            self.position.update(
+                self.position.x + self.velocity.x / SIMULATION_FPS,
+                self.position.y + self.velocity.y / SIMULATION_FPS,
+            )
+
+    @property
+    def is_arriving(self) -> bool:
+        """Whether the `Bot` is at its destination or next waypoint.
+
+        i.e. whether its next update handles an arrival.
+        """
+        if not self.route:
+            return False
+        return (
+            self.destination is None
+            or self.is_at(self.destination)
+            or self.is_at(self.route[0])
+        )
+
+    def _handle_arrival(self) -> bool:
+        """Handle arrival at destination or next waypoint, if applicable.
+
+        Returns
+        -------
+        bool
+            `True` if `Bot` has arrived, else `False`.
+        """
+        if not self.world or not self.route:
+            return False
+        if not self.destination:
+            err_msg = f"{self!s} has a route but no destination!"
+            raise ValueError(err_msg)
+
+        if self.is_at(self.destination):
+            logger.info("{}: arrived at destination.", self)
+            _DESTINATION_ARRIVALS.inc()
+            destination = self.destination
             self.stop()
+            self.route = []
+            self.destination = None
+            # Last, so that handlers can redirect the `Bot`:
+            if self.world.events.has_subscribers(ArrivedAtDestination):
+                self.world.events.emit(ArrivedAtDestination(self, destination))
+            return True
+
+        if self.is_at(self.route[0]):
+            logger.info("{}: arrived at waypoint.", self)
+            _WAYPOINT_ARRIVALS.inc()
+            self.stop()
+            waypoint = self.route.pop(0)
+            if self.world.events.has_subscribers(ArrivedAtWaypoint):
+                self.world.events.emit(ArrivedAtWaypoint(self, waypoint))
+            return True
+
+        return False
+
+    def _steer_towards(self, waypoint: Vector2) -> None:
+        """Rotate towards `waypoint`; move towards it once facing it."""
+        waypoint_relative_bearing = self.heading.relative_degrees(
+            waypoint.x - self.position.x, waypoint.y - self.position.y
+        )
+
+        #  if Bot can complete rotation to face wp this step...
+        if abs(waypoint_relative_bearing) <= self.max_rotation_step:
+            # face wp precisely
+            self.rotate(waypoint_relative_bearing)
+            # initiate move towards wp
+            self.velocity.update(
+                self.heading.vector.x * self.max_speed,
+                self.heading.vector.y * self.max_speed,
+            )
+
         else:
-            self.position = next_pos
+            # turn towards wp
+            self.rotate(
+                math.copysign(
+                    self.max_rotation_step,
+                    waypoint_relative_bearing,
+                ),
+            )
 
     def is_at(self, location: Vector2) -> bool:
         """Get whether `Bot` is at location (True) or not (False)."""
@@ -180,24 +385,86 @@ class Bot(GenericEntity):
             Rotation in degrees
 
         """
-        # NB legacy use of Pygame CCW rotation here, thus negative angle:
-        self.heading.vector.rotate_ip(-rotation_delta)
+        self.heading.rotate(rotation_delta)
 
     def stop(self) -> None:
         """Stop."""
-        self.velocity = Vector2(0)
+        self.velocity.update(0, 0)
 
+    @traced("Bot.handle_sensing")
     def handle_sensing(self, other_bots: Iterable[Bot]) -> None:
         """Update knowledge of others."""
-        currently_visible_bots = {bot for bot in other_bots if self.can_see(bot)}
-        newly_lost_bots = self.visible_bots - currently_visible_bots
-
-        if self.has_memory:
-            self.remembered_bots.update(newly_lost_bots)
-        elif self.leader not in currently_visible_bots:
+        field_of_view = self._field_of_view()
+        currently_visible_bots = {
+            bot
+            for bot in other_bots
+            if self._can_see_location(bot.position, field_of_view)
+        }
+        if self.team is not None and self.world:
+            self.world.publish_sightings(self.team, currently_visible_bots)
+        if self.memory is None and self.leader not in currently_visible_bots:
             self.leader = None
+        self._see(currently_visible_bots)
+
+    def handle_team_sightings(self, sighted_bots: set[Bot]) -> None:
+        """Update knowledge of others from what teammates saw, instead of sensing.
+
+        Teammates in sight when last sensed are kept in sight; the leader is kept.
+        """
+        self._see(
+            {bot for bot in self._visible_bots if bot.team == self.team}
+            | (sighted_bots - {self})
+        )
+
+    def _see(self, currently_visible_bots: set[Bot]) -> None:
+        """Replace `visible_bots`, and remember and report the changes."""
+        self._is_sensing_pending = False
+        newly_lost_bots = self._visible_bots - currently_visible_bots
+        if self.memory is not None:
+            self._remember(currently_visible_bots, newly_lost_bots)
+
+        if self.world:
+            events = self.world.events
+            if events.has_subscribers(BotSighted):
+                for bot in currently_visible_bots - self._visible_bots:
+                    events.emit(BotSighted(self, bot))
+            if events.has_subscribers(BotLost):
+                for bot in newly_lost_bots:
+                    events.emit(BotLost(self, bot))
+
+        self._visible_bots = currently_visible_bots
+
+    def _must_sense_eagerly(self) -> bool:
+        """Determine whether sensing can't be deferred until `visible_bots` is read.
+
+        i.e. if anything depends on the `Bot` noticing peers as soon as it can.
+        """
+        if self.senses_eagerly or self.leader or self.team is not None:
+            return True
+        if not self.world:
+            return False
+        events = self.world.events
+        return events.has_subscribers(BotSighted) or events.has_subscribers(BotLost)
+
+    def _sense_if_pending(self) -> None:
+        if self._is_sensing_pending and self.world:
+            self.handle_sensing(self.world.bots - {self})
 
-        self.visible_bots = currently_visible_bots
+    def _remember(self, visible_bots: set[Bot], lost_bots: set[Bot]) -> None:
+        """Update memory: forget peers in sight, remember lost ones, expire old ones.
+
+        A lost peer is remembered at its position when lost from sight.
+        """
+        if self.memory is None:
+            return
+        step = self.world.step_counter if self.world else 0
+        for bot in visible_bots:
+            if bot.id is not None:
+                self.memory.forget(bot.id)
+        for bot in lost_bots:
+            if bot.id is not None:
+                self.memory.remember(bot.id, step, bot.position.x, bot.position.y)
+        self.memory.expire(step)
 
     def can_see(self, other_bot: Bot) -> bool:
         """Determine whether the `Bot` can see `other_bot`.
@@ -210,24 +477,42 @@ class Bot(GenericEntity):
     def can_see_location(self, location: Vector2) -> bool:
         """Determine whether the `Bot` can see `location`.
 
-        Specifically, whether the `location` is within the vision cone.
+        Specifically, whether the `location` is within the vision cone and, if
+        `vision_is_occluded`, its cell is in the `Bot`'s field of view.
         """
-        relative_vector = location - self.position
-        relative_bearing_magnitude = abs(
-            self.heading.relative(relative_vector).degrees_normalised
-        )
+        return self._can_see_location(location, self._field_of_view())
 
+    def _can_see_location(
+        self, location: Vector2, field_of_view: FieldOfView | None
+    ) -> bool:
+        dx = location.x - self.position.x
+        dy = location.y - self.position.y
         return (
-            relative_bearing_magnitude <= Bot.VISION_CONE_ANGLE / 2
-            and relative_vector.magnitude() < self.vision_range
+            math.hypot(dx, dy) < self.vision_range
+            and abs(self.heading.relative_degrees(dx, dy)) <= Bot.VISION_CONE_ANGLE / 2
+            and (
+                field_of_view is None
+                or self.world is None
+                or self.world.nearest_grid_ref(location) in field_of_view
+            )
         )
 
-    def _is_in_collision(self, point: Vector2, bots: Iterable[Bot]) -> bool:
+    def _field_of_view(self) -> FieldOfView | None:
+        """Return cells visible from the `Bot`'s cell, or `None` if unoccluded."""
+        if (
+            not self.vision_is_occluded
+            or not self.world
+            or not self.world.grid.movement_blocking_cells
+        ):
+            return None
+        return self.world.grid.field_of_view(
+            self.world.nearest_grid_ref(self.position),
+            math.ceil(self.vision_range / self.world.grid_resolution),
+        )
+
+    def _is_in_collision(self, x: float, y: float, bots: Iterable[Bot]) -> bool:
+        """Determine whether a `Bot` at `(x, y)` would collide with any of `bots`."""
         return any(
-            point_in_or_on_circle(
-                point=point,
-                circle_centre=b.position,
-                circle_radius=self.radius + b.radius,
-            )
+            math.hypot(b.position.x - x, b.position.y - y) <= self.radius + b.radius
             for b in bots
         )
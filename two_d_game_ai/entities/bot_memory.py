@@ -0,0 +1,110 @@
+"""Contains `BotMemory` class."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class MemoryEntry(NamedTuple):
+    """What a `Bot` remembers about another."""
+
+    bot_id: int
+    step: int
+    """`World` step when last seen."""
+    x: float
+    """Position when last seen."""
+    y: float
+
+
+@dataclass
+class BotMemory:
+    """Bounded memory of other `Bot`s, by id: when and where each was last seen.
+
+    Holds at most `capacity` entries, evicting the least recently seen. Entries older
+    than `max_age` steps are forgotten by `expire`.
+
+    Compact: entries are held in preallocated arrays, indexed by slot, rather than as
+    objects.
+    """
+
+    capacity: int = 32
+    max_age: int | None = None
+    """Steps. If `None`, entries are only evicted for capacity."""
+
+    _slots: dict[int, int] = field(init=False, default_factory=dict)
+    """Slot, by `Bot` id, least recently seen first."""
+    _free_slots: list[int] = field(init=False)
+    _steps: array[int] = field(init=False)
+    _xs: array[float] = field(init=False)
+    _ys: array[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.capacity < 1:
+            err_msg = f"{type(self).__name__}: capacity must be at least 1."
+            raise ValueError(err_msg)
+        self._free_slots = list(reversed(range(self.capacity)))
+        self._steps = array("q", bytes(8 * self.capacity))
+        self._xs = array("d", bytes(8 * self.capacity))
+        self._ys = array("d", bytes(8 * self.capacity))
+
+    def __contains__(self, bot_id: int) -> bool:
+        return bot_id in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over remembered `Bot` ids, least recently seen first."""
+        return iter(self._slots)
+
+    def remember(self, bot_id: int, step: int, x: float, y: float) -> None:
+        """Record that a `Bot` was seen at a step and position.
+
+        If full, the least recently seen `Bot` is forgotten.
+        """
+        slot = self._slots.pop(bot_id, None)
+        if slot is None:
+            if not self._free_slots:
+                self.forget(next(iter(self._slots)))
+            slot = self._free_slots.pop()
+        self._slots[bot_id] = slot
+        self._steps[slot] = step
+        self._xs[slot] = x
+        self._ys[slot] = y
+
+    def forget(self, bot_id: int) -> None:
+        """Forget a `Bot`, if remembered."""
+        slot = self._slots.pop(bot_id, None)
+        if slot is not None:
+            self._free_slots.append(slot)
+
+    def clear(self) -> None:
+        """Forget all `Bot`s."""
+        self._slots.clear()
+        self._free_slots = list(reversed(range(self.capacity)))
+
+    def expire(self, step: int) -> None:
+        """Forget `Bot`s last seen more than `max_age` steps before `step`."""
+        if self.max_age is None:
+            return
+        # Least recently seen first, so stop at the first that isn't too old:
+        for bot_id, slot in list(self._slots.items()):
+            if step - self._steps[slot] <= self.max_age:
+                break
+            self.forget(bot_id)
+
+    def get(self, bot_id: int) -> MemoryEntry | None:
+        """Return what is remembered about a `Bot`, or `None`."""
+        slot = self._slots.get(bot_id)
+        if slot is None:
+            return None
+        return MemoryEntry(bot_id, self._steps[slot], self._xs[slot], self._ys[slot])
+
+    def entries(self) -> list[MemoryEntry]:
+        """Return all entries, least recently seen first."""
+        return [e for bot_id in self._slots if (e := self.get(bot_id))]
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from two_d_game_ai.world.grid import Grid
+    from two_d_game_ai.world.grid_ref import GridRef
 
 
 @dataclass(kw_only=True, eq=False)
@@ -21,9 +22,15 @@ class Obstacle(GenericEntity, ABC):
     def __post_init__(self, position_from_sequence: Sequence[float]) -> None:
         super().__post_init__(position_from_sequence)
 
-    def add_to_grid(self, grid: Grid) -> None:
-        """Set relevant grid cells to untraversable."""
-        grid.movement_blocking_cells.update(self.occupied_cells())
+    def add_to_grid(self, grid: Grid) -> set[GridRef]:
+        """Set relevant grid cells to untraversable.
+
+        Returns
+        -------
+        set[GridRef]
+            Cells which weren't previously untraversable.
+        """
+        return grid.block_cells(self.occupied_cells())
 
 
 @dataclass(kw_only=True, eq=False)
@@ -10,7 +10,7 @@ def point_in_or_on_circle(
     circle_radius: float,
 ) -> bool:
     """Return `True` if `point` is (inside or on) the circle, else `False`."""
-    return (point - circle_centre).length() <= circle_radius
+    return point.distance_to(circle_centre) <= circle_radius
 
 
 def point_in_or_on_rect(
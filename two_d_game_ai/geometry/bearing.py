@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 
 from pygame import Vector2
@@ -9,11 +10,12 @@ from pygame import Vector2
 _CIRCLE_DEGREES = 360
 
 
-@dataclass
+@dataclass(slots=True)
 class Bearing:
     """Represents a conventional bearing (aka azimuthal angle).
 
-    Stored as a unit vector, based on Pygame's `Vector2` class.
+    Stored as a unit vector, based on Pygame's `Vector2` class, and as an angle.
+    Use `rotate` to change it in place, so that both are kept consistent.
     """
 
     vector: Vector2 = field(init=False)
@@ -24,9 +26,8 @@ class Bearing:
 
     def __post_init__(self) -> None:
         """Construct vector from bearing angle."""
-        v = Vector2()
-        v.from_polar((1, self._degrees - _CIRCLE_DEGREES / 4))
-        self.vector = _flip_vector_y(v)
+        self.vector = Vector2()
+        self._set(self._degrees)
 
     @property
     def degrees(self) -> float:
@@ -36,12 +37,7 @@ class Bearing:
 
         Intended for absolute bearings, where North is 0, East is 90, etc.
         """
-        angle = -self.vector.as_polar()[1] + _CIRCLE_DEGREES / 4
-        if angle < 0:
-            angle += _CIRCLE_DEGREES
-        if angle == _CIRCLE_DEGREES:
-            angle = 0
-        return angle
+        return self._degrees
 
     @property
     def degrees_normalised(self) -> float:
@@ -52,16 +48,41 @@ class Bearing:
         Intended for relative bearings, where negative value is to left/port; positive
         is to right/starboard.
         """
-        if self.degrees >= _CIRCLE_DEGREES / 2:
-            return self.degrees - _CIRCLE_DEGREES
-        return self.degrees
+        return _normalised(self._degrees)
+
+    def rotate(self, degrees: float) -> None:
+        """Rotate in place; positive is clockwise."""
+        self._set(self._degrees + degrees)
+
+    def update(self, degrees: float) -> None:
+        """Set angle in place, e.g. to copy another bearing without allocating."""
+        self._set(degrees)
 
     def relative(self, other_vector: Vector2) -> Bearing:
         """Return new `Bearing` representing relative bearing to vector."""
-        angle = -self.vector.angle_to(other_vector)
-        return Bearing(angle)
+        return Bearing(self.relative_degrees(other_vector.x, other_vector.y))
+
+    def relative_degrees(self, x: float, y: float) -> float:
+        """Return relative bearing to vector `(x, y)`, without allocating objects.
+
+        -180 <= degrees < 180, as `degrees_normalised`.
+        """
+        return _normalised(math.degrees(math.atan2(x, y)) - self._degrees)
+
+    def _set(self, degrees: float) -> None:
+        """Set angle and update vector in place."""
+        self._degrees = _wrapped(degrees)
+        radians = math.radians(self._degrees)
+        self.vector.update(math.sin(radians), math.cos(radians))
+
+
+def _wrapped(degrees: float) -> float:
+    """Return equivalent angle, 0 <= degrees < 360."""
+    wrapped = degrees % _CIRCLE_DEGREES
+    # Float modulo of a tiny negative angle rounds up to 360:
+    return 0.0 if wrapped == _CIRCLE_DEGREES else wrapped
 
 
-def _flip_vector_y(vector: Vector2) -> Vector2:
-    """Inverse the vector's y-axis to convert from Pygame's `Vector2` implementation."""
-    return Vector2(vector.x, -vector.y)
+def _normalised(degrees: float) -> float:
+    """Return equivalent angle, -180 <= degrees < 180."""
+    return _wrapped(degrees + _CIRCLE_DEGREES / 2) - _CIRCLE_DEGREES / 2
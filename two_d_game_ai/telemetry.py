@@ -0,0 +1,184 @@
+"""Contains lightweight telemetry: counters and histograms in a registry.
+
+Hot paths hold references to their metrics, obtained once at import, so recording is
+just an update to the calling thread's own values, without locking; they're merged when
+read. For example:
+
+```python
+from two_d_game_ai.telemetry import metrics
+
+metrics.reset()
+world.step_many(1000)
+print(metrics.snapshot())
+```
+
+NB: Logging in hot paths uses Loguru's deferred formatting, so it costs little when no
+sink accepts the level. It can be switched off entirely with
+`loguru.logger.disable("two_d_game_ai")`.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+
+@dataclass(slots=True)
+class _PerThreadMetric:
+    """Base for metrics which each thread records in its own cell, without locking.
+
+    Cells are merged when read. Cells of threads which have finished are kept, so
+    nothing recorded is lost.
+    """
+
+    name: str
+    _local: threading.local = field(
+        init=False, default_factory=threading.local, repr=False, compare=False
+    )
+    """Holds this thread's cell."""
+    _cells: list[list[float]] = field(
+        init=False, default_factory=list, repr=False, compare=False
+    )
+    """All threads' cells."""
+    _cells_lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False, compare=False
+    )
+    """Taken only to add a thread's cell, and to read or reset all cells."""
+
+    _INITIAL: ClassVar[tuple[float, ...]] = ()
+    """A new cell's values."""
+
+    def reset(self) -> None:
+        """Reset to initial values, e.g. between runs; not while recording."""
+        with self._cells_lock:
+            for cell in self._cells:
+                cell[:] = self._INITIAL
+
+    def _new_cell(self) -> list[float]:
+        """Return a new cell for this thread."""
+        cell = list(self._INITIAL)
+        with self._cells_lock:
+            self._cells.append(cell)
+        self._local.cell = cell
+        return cell
+
+    def _copied_cells(self) -> list[list[float]]:
+        """Return a copy of all threads' cells, to be merged."""
+        with self._cells_lock:
+            return [cell.copy() for cell in self._cells]
+
+
+@dataclass(slots=True)
+class Counter(_PerThreadMetric):
+    """Monotonic count of occurrences.
+
+    Thread-safe, e.g. for `Bot`s deciding on `World.update_executor`.
+    """
+
+    _INITIAL: ClassVar[tuple[float, ...]] = (0,)
+
+    @property
+    def value(self) -> int:
+        """Count, across all threads."""
+        return int(sum(cell[0] for cell in self._copied_cells()))
+
+    def inc(self, amount: int = 1) -> None:
+        """Increment the count."""
+        try:
+            self._local.cell[0] += amount
+        except AttributeError:
+            self._new_cell()[0] += amount
+
+
+@dataclass(slots=True)
+class Histogram(_PerThreadMetric):
+    """Summary of observed values: count, sum, min and max.
+
+    Thread-safe, as `Counter`.
+    """
+
+    _INITIAL: ClassVar[tuple[float, ...]] = (0, 0, math.inf, -math.inf)
+    """count, total, min, max"""
+
+    @property
+    def count(self) -> int:
+        """Number of observed values."""
+        return int(sum(cell[0] for cell in self._copied_cells()))
+
+    @property
+    def total(self) -> float:
+        """Sum of observed values."""
+        return sum(cell[1] for cell in self._copied_cells())
+
+    @property
+    def min(self) -> float:
+        """Least observed value, or infinity if none."""
+        return min((cell[2] for cell in self._copied_cells()), default=math.inf)
+
+    @property
+    def max(self) -> float:
+        """Greatest observed value, or minus infinity if none."""
+        return max((cell[3] for cell in self._copied_cells()), default=-math.inf)
+
+    @property
+    def mean(self) -> float:
+        """Mean of observed values, or NaN if none."""
+        count = self.count
+        return self.total / count if count else math.nan
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._new_cell()
+        cell[0] += 1
+        cell[1] += value
+        cell[2] = min(cell[2], value)
+        cell[3] = max(cell[3], value)
+
+
+@dataclass
+class MetricsRegistry:
+    """Named counters and histograms."""
+
+    counters: dict[str, Counter] = field(default_factory=dict)
+    histograms: dict[str, Histogram] = field(default_factory=dict)
+
+    def counter(self, name: str) -> Counter:
+        """Return the named counter, creating it if necessary."""
+        if name not in self.counters:
+            self.counters[name] = Counter(name)
+        return self.counters[name]
+
+    def histogram(self, name: str) -> Histogram:
+        """Return the named histogram, creating it if necessary."""
+        if name not in self.histograms:
+            self.histograms[name] = Histogram(name)
+        return self.histograms[name]
+
+    def reset(self) -> None:
+        """Reset all metrics, in place, so that existing references remain valid."""
+        for c in self.counters.values():
+            c.reset()
+        for h in self.histograms.values():
+            h.reset()
+
+    def snapshot(self) -> dict[str, float | dict[str, float]]:
+        """Return current values, e.g. for JSON output."""
+        values: dict[str, float | dict[str, float]] = {
+            name: c.value for name, c in self.counters.items()
+        }
+        for name, h in self.histograms.items():
+            values[name] = (
+                {"count": h.count, "mean": h.mean, "min": h.min, "max": h.max}
+                if h.count
+                else {"count": 0}
+            )
+        return values
+
+
+metrics = MetricsRegistry()
+"""Default registry, used by the simulation."""
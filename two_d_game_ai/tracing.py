@@ -0,0 +1,132 @@
+"""Contains optional instrumentation spans, exported as Chrome trace-event JSON.
+
+Traces open in `chrome://tracing` or [Perfetto](https://ui.perfetto.dev). For example:
+
+```python
+from two_d_game_ai.tracing import tracer
+
+tracer.enable(max_frames=600)  # keep only the last 600 frames
+world.step_many(10_000)
+tracer.write_chrome_trace("trace.json")
+```
+
+Simulation and render phases are instrumented with `traced`. While the tracer is
+disabled (the default), each instrumented call costs only a flag check.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_TraceEvent = dict[str, str | int | float]
+
+
+@dataclass
+class Tracer:
+    """Records spans, grouped into frames, for export as Chrome trace events."""
+
+    enabled: bool = False
+    """Whether spans are recorded."""
+    max_frames: int | None = None
+    """If set, only the last `max_frames` frames are kept (ring buffer mode)."""
+
+    _frames: deque[list[_TraceEvent]] = field(init=False, default_factory=deque)
+    """Completed frames."""
+    _current_frame: list[_TraceEvent] = field(init=False, default_factory=list)
+
+    def enable(self, max_frames: int | None = None) -> None:
+        """Start recording spans, discarding any previously recorded."""
+        self.max_frames = max_frames
+        self.clear()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans. Recorded spans are kept, e.g. for export."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Discard recorded spans."""
+        self._frames = deque(maxlen=self.max_frames)
+        self._current_frame = []
+
+    def next_frame(self) -> None:
+        """Complete the current frame, and start a new one."""
+        if not self.enabled:
+            return
+        self._frames.append(self._current_frame)
+        self._current_frame = []
+
+    def span(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager recording a span, if enabled."""
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name)
+
+    @contextmanager
+    def _span(self, name: str) -> Iterator[None]:
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, start_ns, time.perf_counter_ns())
+
+    def record(self, name: str, start_ns: int, end_ns: int) -> None:
+        """Record a completed span."""
+        self._current_frame.append(
+            {
+                "name": name,
+                "ph": "X",  # complete event
+                "ts": start_ns / 1000,  # microseconds
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+        )
+
+    def events(self) -> list[_TraceEvent]:
+        """Return recorded spans, oldest first."""
+        return [e for frame in self._frames for e in frame] + self._current_frame
+
+    def write_chrome_trace(self, path: str | Path) -> None:
+        """Write recorded spans as a Chrome trace-event JSON file."""
+        trace = {"traceEvents": self.events(), "displayTimeUnit": "ms"}
+        Path(path).write_text(json.dumps(trace), encoding="utf-8")
+
+
+tracer = Tracer()
+"""Default tracer, used by the simulation and `View`."""
+
+
+def traced(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function so that calls are recorded as spans by `tracer`."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start_ns = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.record(name, start_ns, time.perf_counter_ns())
+
+        return wrapper
+
+    return decorator
@@ -41,9 +41,8 @@ class BotRenderer(GenericEntityRenderer):
             self._draw_lines_to_others(
                 self.entity.visible_bots, colors.BOT_CAN_SEE_LINE, 3
             )
-            self._draw_lines_to_others(
-                self.entity.remembered_bots, colors.BOT_KNOWS_LINE, 1
-            )
+            if self.entity.memory:
+                self._draw_lines_to_last_seen_positions()
 
     def _draw_destination(self) -> None:
         """Draw `Bot` destination icon."""
@@ -114,6 +113,19 @@ class BotRenderer(GenericEntityRenderer):
                 width=width,
             )
 
+    def _draw_lines_to_last_seen_positions(self) -> None:
+        """Draw lines from Bot to where remembered bots were last seen."""
+        if not isinstance(self.entity, Bot) or not self.entity.memory:
+            raise TypeError
+
+        for entry in self.entity.memory.entries():
+            self.parent.draw_line(
+                color=colors.BOT_KNOWS_LINE,
+                start_pos=self.entity.position,
+                end_pos=Vector2(entry.x, entry.y),
+                width=1,
+            )
+
     def _draw_icon(self) -> None:
         """Draw unscaled icon to surface."""
         if not isinstance(self.entity, Bot) or not self.radius:
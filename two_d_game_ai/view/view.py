@@ -10,6 +10,7 @@ import pygame
 from pygame import Clock, Font, Surface, Vector2
 
 from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.tracing import traced
 from two_d_game_ai.view import FONT_DIR_RELATIVE, FONT_FILENAME, FONT_SIZE, colors
 from two_d_game_ai.view.world_renderer import WorldRenderer
 
@@ -68,7 +69,7 @@ class View:
             match event.type:
                 # WINDOW/HIGH LEVEL EVENTS
                 case pygame.QUIT:  # user clicked window close
-                    self.running = False
+                    self.close()
 
                 # MOUSE EVENTS
                 case pygame.MOUSEBUTTONDOWN:
@@ -87,6 +88,12 @@ class View:
                     if event.key == _PAUSE_KEY:
                         self.world.is_paused = not self.world.is_paused
 
+    def close(self) -> None:
+        """Stop running, and detach from the `World`'s events."""
+        self.running = False
+        self.world_renderer.close()
+
+    @traced("View.render")
     def render(self) -> None:
         """Render to the Pygame window."""
         # Limit update rate to save CPU:
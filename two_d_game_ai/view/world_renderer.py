@@ -12,6 +12,7 @@ from pygame import Color, Font, FRect, Rect, Surface, Vector2
 
 from two_d_game_ai.entities.bot import Bot
 from two_d_game_ai.entities.obstacles import Obstacle
+from two_d_game_ai.tracing import traced
 from two_d_game_ai.view import (
     FONT_DIR_RELATIVE,
     FONT_FILENAME,
@@ -21,10 +22,12 @@ from two_d_game_ai.view import (
 )
 from two_d_game_ai.view.bot_renderer import BotRenderer
 from two_d_game_ai.view.obstacle_renderers import ObstacleRenderer
+from two_d_game_ai.world.events import EntityAdded, EntityRemoved
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from two_d_game_ai.entities.generic_entity import GenericEntity
     from two_d_game_ai.view.generic_entity_renderer import GenericEntityRenderer
     from two_d_game_ai.world.grid import Grid
     from two_d_game_ai.world.world import World
@@ -54,6 +57,8 @@ class WorldRenderer:
     selected_renderer: GenericEntityRenderer | None = field(init=False)
     """Selected entity renderer."""
     font: Font = field(init=False)
+    _is_subscribed: bool = field(init=False, default=False)
+    """Whether renderers follow `World` events; see `close`."""
 
     def __post_init__(self) -> None:
         font_filepath = Path(__file__).resolve().parent / FONT_DIR_RELATIVE
@@ -62,6 +67,10 @@ class WorldRenderer:
         self.surface = Surface((self.size, self.size))
         self.base_grid_surface = self.base_grid()
         self.selected_renderer = None
+        self.ensure_renderers()
+        self.world.events.subscribe(EntityAdded, self._handle_entity_added)
+        self.world.events.subscribe(EntityRemoved, self._handle_entity_removed)
+        self._is_subscribed = True
         logger.info(
             f"WorldRenderer(size={self.size}px, scale={self.scale_factor}) initialized."
         )
@@ -91,9 +100,9 @@ class WorldRenderer:
         """Clickable elements."""
         return set(self.entity_renderers.values())
 
+    @traced("WorldRenderer.render")
     def render(self, *, debug_render_mode: bool = False) -> None:
         """Render the `World` to `self.surface`."""
-        self.ensure_renderers()
         # Drawn in order, bottom layer to top:
         self.surface.blit(self.base_grid_surface)
         self.render_movement_blocking_cells(self.world.grid)
@@ -139,20 +148,44 @@ class WorldRenderer:
             )
         return surface
 
+    def close(self) -> None:
+        """Stop following `World` events, so the renderer isn't kept alive by them."""
+        if not self._is_subscribed:
+            return
+        self.world.events.unsubscribe(EntityAdded, self._handle_entity_added)
+        self.world.events.unsubscribe(EntityRemoved, self._handle_entity_removed)
+        self._is_subscribed = False
+
     def ensure_renderers(self) -> None:
-        """Update the set of entity renderers."""
+        """Update the set of entity renderers.
+
+        Only needed initially: subsequent changes are handled as `World` events.
+        """
         for e in {e for e in self.world.entities if e.id not in self.entity_renderers}:
-            if e.id is None:
-                err_msg = f"{e!s} must have an `id` to be rendered."
-                raise ValueError(err_msg)
+            self._add_renderer(e)
+
+    def _add_renderer(self, e: GenericEntity) -> None:
+        if e.id is None:
+            err_msg = f"{e!s} must have an `id` to be rendered."
+            raise ValueError(err_msg)
+
+        if isinstance(e, Obstacle):
+            self.entity_renderers[e.id] = ObstacleRenderer(parent=self, entity=e)
+
+        elif isinstance(e, Bot):
+            self.entity_renderers[e.id] = BotRenderer(parent=self, entity=e)
 
-            if isinstance(e, Obstacle):
-                self.entity_renderers[e.id] = ObstacleRenderer(parent=self, entity=e)
+        logger.debug(f"Added renderer for {e!s}.")
 
-            elif isinstance(e, Bot):
-                self.entity_renderers[e.id] = BotRenderer(parent=self, entity=e)
+    def _handle_entity_added(self, event: EntityAdded) -> None:
+        self._add_renderer(event.entity)
 
-            logger.debug(f"Added renderer for {e!s}.")
+    def _handle_entity_removed(self, event: EntityRemoved) -> None:
+        if event.entity.id is None:
+            return
+        renderer = self.entity_renderers.pop(event.entity.id, None)
+        if renderer is not None and renderer is self.selected_renderer:
+            self.selected_renderer = None
 
     def to_local(self, world_pos: Vector2) -> Vector2:
         """Convert `World` coordinates to local coordinates.
@@ -0,0 +1,212 @@
+"""Contains batch experiment runner, running many `World`s across processes.
+
+The obstacle layout (static map) is rasterised once, in the calling process, and shared
+read-only with worker processes via shared memory.
+
+NB: only rasterisation and transfer are shared. Each worker process decodes the mask
+into its own set of cells, once, and each `World` copies the mask and cells whole into
+its `Grid` (see `Grid.block_cells_from_mask`). So memory per map still grows with
+processes and `World`s; `Grid` isn't backed by the shared buffer, because it can be
+changed, e.g. by adding obstacles.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.world import World
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+_BLOCKED = 1
+
+_attached_maps: dict[str, tuple[bytes, frozenset[GridRef]]] = {}
+"""Per-process cache of blocked-cell masks and movement-blocking cells, keyed by shared
+memory name."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class StaticMap:
+    """Handle to a rasterised obstacle layout in shared memory.
+
+    Picklable, so can be passed to worker processes.
+    """
+
+    world_size: int
+    """`World` units per side."""
+    grid_size: int
+    """`Grid` units per side."""
+    shared_memory_name: str
+    """Name of the shared memory block holding the row-major blocked-cell mask."""
+
+    def new_world(self, seed: int | None = None) -> World:
+        """Return a new `World` with the static map's movement-blocking cells.
+
+        Obstacle entities aren't added, so no rasterisation is done. The mask and cells
+        are copied whole into the `World`'s own `Grid`, rather than shared.
+        """
+        world = World(size=self.world_size, grid_size=self.grid_size, seed=seed)
+        world.grid.block_cells_from_mask(*self._movement_blocking_mask())
+        return world
+
+    def _movement_blocking_mask(self) -> tuple[bytes, frozenset[GridRef]]:
+        """Return the blocked-cell mask and movement-blocking cells.
+
+        Read from shared memory once per process.
+        """
+        attached_map = _attached_maps.get(self.shared_memory_name)
+        if attached_map is None:
+            shared_memory = SharedMemory(name=self.shared_memory_name)
+            try:
+                mask = bytes(_buffer(shared_memory)[: self.grid_size**2])
+            finally:
+                shared_memory.close()
+            cells = frozenset(
+                GridRef(i % self.grid_size, i // self.grid_size)
+                for i, value in enumerate(mask)
+                if value == _BLOCKED
+            )
+            attached_map = (mask, cells)
+            _attached_maps[self.shared_memory_name] = attached_map
+        return attached_map
+
+
+@contextmanager
+def shared_static_map(world: World) -> Iterator[StaticMap]:
+    """Share a `World`'s movement-blocking cells for the duration of the context.
+
+    Parameters
+    ----------
+    world
+        Template `World`, with obstacles already added.
+
+    Yields
+    ------
+    StaticMap
+        Handle which worker processes can use to create equivalent `World`s.
+    """
+    grid_size = world.grid.size
+    shared_memory = SharedMemory(create=True, size=grid_size**2)
+    try:
+        _buffer(shared_memory)[: grid_size**2] = world.grid.blocked_mask
+        yield StaticMap(
+            world_size=world.size,
+            grid_size=grid_size,
+            shared_memory_name=shared_memory.name,
+        )
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+@dataclass(kw_only=True, frozen=True)
+class Experiment:
+    """Parameters for a single run within a batch."""
+
+    seed: int
+    """Seed for the `World`'s random number generator, and the `random` module."""
+    params: Mapping[str, float] = field(default_factory=dict)
+    """Scenario-specific parameters, e.g. `Bot` speeds."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class ExperimentResult:
+    """Metrics collected from a single run within a batch."""
+
+    experiment: Experiment
+    metrics: Mapping[str, float]
+
+
+def run_batch(
+    *,
+    static_map: StaticMap,
+    scenario: Callable[[World, Experiment], Mapping[str, float]],
+    experiments: Iterable[Experiment],
+    max_workers: int | None = None,
+) -> list[ExperimentResult]:
+    """Run experiments across a pool of worker processes.
+
+    Parameters
+    ----------
+    static_map
+        Shared obstacle layout, used to create a new `World` per experiment.
+    scenario
+        Adds entities to the `World`, runs it, and returns summary metrics.
+        Must be picklable, i.e. defined at module level.
+    experiments
+        One `World` is created and run per experiment.
+    max_workers
+        Number of worker processes. Defaults to the number of processors.
+
+    Returns
+    -------
+    list[ExperimentResult]
+        In the same order as `experiments`.
+    """
+    experiments = list(experiments)
+    workers = max_workers or os.cpu_count() or 1
+    # A few chunks per worker balances load while limiting inter-process traffic:
+    chunksize = max(1, len(experiments) // (4 * workers))
+    # Consistent across platforms, and safe if the calling process has threads:
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        metrics = executor.map(
+            _run_experiment,
+            [static_map] * len(experiments),
+            [scenario] * len(experiments),
+            experiments,
+            chunksize=chunksize,
+        )
+        results = [
+            ExperimentResult(experiment=e, metrics=m)
+            for e, m in zip(experiments, metrics, strict=True)
+        ]
+    logger.info("Batch: ran {} experiments.", len(results))
+    return results
+
+
+def summarise(results: Iterable[ExperimentResult]) -> dict[str, dict[str, float]]:
+    """Summarise each metric across results, as mean, min and max."""
+    values: dict[str, list[float]] = {}
+    for result in results:
+        for name, value in result.metrics.items():
+            values.setdefault(name, []).append(value)
+    return {
+        name: {
+            "mean": statistics.fmean(vs),
+            "min": min(vs),
+            "max": max(vs),
+        }
+        for name, vs in values.items()
+    }
+
+
+def _run_experiment(
+    static_map: StaticMap,
+    scenario: Callable[[World, Experiment], Mapping[str, float]],
+    experiment: Experiment,
+) -> Mapping[str, float]:
+    """Run a single experiment. Executed in a worker process."""
+    random.seed(experiment.seed)
+    world = static_map.new_world(seed=experiment.seed)
+    return dict(scenario(world, experiment))
+
+
+def _buffer(shared_memory: SharedMemory) -> memoryview:
+    """Return the shared memory buffer."""
+    if shared_memory.buf is None:
+        err_msg = f"Shared memory {shared_memory.name} is closed."
+        raise ValueError(err_msg)
+    return shared_memory.buf
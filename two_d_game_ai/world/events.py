@@ -0,0 +1,103 @@
+"""Contains `EventBus` class and event types emitted by a `World`."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pygame import Vector2
+
+    from two_d_game_ai.entities.bot import Bot
+    from two_d_game_ai.entities.generic_entity import GenericEntity
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """Base event."""
+
+
+@dataclass(frozen=True, slots=True)
+class EntityAdded(Event):
+    """Entity was added to the `World`."""
+
+    entity: GenericEntity
+
+
+@dataclass(frozen=True, slots=True)
+class EntityRemoved(Event):
+    """Entity was removed from the `World`."""
+
+    entity: GenericEntity
+
+
+@dataclass(frozen=True, slots=True)
+class ArrivedAtWaypoint(Event):
+    """`Bot` arrived at an intermediate waypoint on its route."""
+
+    bot: Bot
+    waypoint: Vector2
+
+
+@dataclass(frozen=True, slots=True)
+class ArrivedAtDestination(Event):
+    """`Bot` arrived at its destination."""
+
+    bot: Bot
+    destination: Vector2
+
+
+@dataclass(frozen=True, slots=True)
+class BotSighted(Event):
+    """`observer` can now see `observed`, having not seen it at the last sensing."""
+
+    observer: Bot
+    observed: Bot
+
+
+@dataclass(frozen=True, slots=True)
+class BotLost(Event):
+    """`observer` can no longer see `observed`."""
+
+    observer: Bot
+    observed: Bot
+
+
+E = TypeVar("E", bound=Event)
+
+
+@dataclass
+class EventBus:
+    """Dispatches events to subscribed handlers, synchronously.
+
+    Emitters should check `has_subscribers` before creating events, so that
+    unobserved events cost almost nothing.
+    """
+
+    _handlers: dict[type[Event], list[Callable[[Event], None]]] = field(
+        init=False, default_factory=dict
+    )
+
+    def subscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        """Call `handler` with each event of `event_type`."""
+        handlers = self._handlers.setdefault(event_type, [])
+        handlers.append(handler)  # type: ignore[arg-type]
+
+    def unsubscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        """Stop calling `handler` with events of `event_type`."""
+        handlers = self._handlers.get(event_type, [])
+        handlers.remove(handler)  # type: ignore[arg-type]
+        if not handlers:
+            self._handlers.pop(event_type, None)
+
+    def has_subscribers(self, event_type: type[Event]) -> bool:
+        """Determine whether any handler is subscribed to `event_type`."""
+        return event_type in self._handlers
+
+    def emit(self, event: Event) -> None:
+        """Call handlers subscribed to the type of `event`."""
+        # Copied, in case a handler unsubscribes:
+        for handler in tuple(self._handlers.get(type(event), ())):
+            handler(event)
@@ -0,0 +1,159 @@
+"""Fast-forward a `World` over uneventful steps.
+
+Most steps of a sparse simulation are `Bot`s rotating towards a waypoint or driving
+towards it. While no `Bot` can sense, be sensed by or collide with another, and none
+arrives at a waypoint, each `Bot`'s update depends only on its own state. So those
+steps can be taken with `Bot.coast`, skipping sensing and collision checks against
+other `Bot`s, and the `World`'s per-step bookkeeping.
+
+Results are identical to stepping: each `Bot` does the same arithmetic as `Bot.update`.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.world.spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from two_d_game_ai.entities.bot import Bot
+    from two_d_game_ai.world.world import World
+
+MAX_FAST_FORWARD_STEPS = 10 * SIMULATION_FPS
+"""Upper limit on steps that `uneventful_steps` looks ahead."""
+
+_STEPS_FAST_FORWARDED = metrics.counter("world.steps_fast_forwarded")
+
+
+def uneventful_steps(world: World, max_steps: int) -> int:
+    """Return a number of steps, up to `max_steps`, that can be taken by `fast_forward`.
+
+    Conservative: 0 unless every active `Bot` is alone (sees no one, and has no
+    leader), isn't idle, and isn't arriving. Otherwise, limited by how soon any pair of
+    `Bot`s, moving at most at their maximum speeds, could come within vision range or
+    collision distance. Pairs are found with a `SpatialHash`.
+
+    NB: waypoint arrivals aren't predicted; `fast_forward` stops before any.
+    """
+    max_steps = min(max_steps, MAX_FAST_FORWARD_STEPS)
+    if world.sensing_scheduler is not None or max_steps <= 0:
+        return 0
+    active_bots = world.active_bots
+    if any(
+        b.visible_bots or b.leader or b.is_idle or b.is_arriving for b in active_bots
+    ):
+        return 0
+    if not active_bots:
+        return max_steps
+
+    step_distances = {b: _max_step_distance(b) for b in active_bots}
+    max_step_distance = max(step_distances.values())
+    bots = world.bots
+    max_reach = max(_reach(b, b) for b in bots)
+    bots_by_position: SpatialHash[Bot] = SpatialHash(bucket_size=max(max_reach, 1))
+    for b in bots:
+        bots_by_position.insert(b, b.position)
+
+    steps = max_steps
+    for bot in active_bots:
+        search_radius = max_reach + (step_distances[bot] + max_step_distance) * (
+            steps + 1
+        )
+        candidates = bots_by_position.near(bot.position, search_radius)
+        steps = _steps_apart(bot, candidates, step_distances, steps)
+        if not steps:
+            return 0
+    return steps
+
+
+def _steps_apart(
+    bot: Bot, others: Iterable[Bot], step_distances: dict[Bot, float], max_steps: int
+) -> int:
+    """Return steps, up to `max_steps`, before `bot` could sense or collide with any of
+    `others`.
+    """
+    steps = max_steps
+    for other in others:
+        if other is bot:
+            continue
+        clearance = bot.position.distance_to(other.position) - _reach(bot, other)
+        if clearance <= 0:
+            # e.g. could be seen by turning:
+            return 0
+        closing_distance = step_distances[bot] + step_distances.get(other, 0)
+        if closing_distance:
+            # A step's sensing and collision checks see positions up to a step ahead:
+            steps = min(steps, max(math.floor(clearance / closing_distance) - 1, 0))
+    return steps
+
+
+def fast_forward(
+    world: World, steps: int, condition: Callable[[World], bool] | None = None
+) -> int:
+    """Take up to `steps` steps with `Bot.coast`.
+
+    `steps` should be at most `uneventful_steps`. Stops early before any `Bot` arrives,
+    or, if given, when `condition` is met; it's checked before each step but the first.
+
+    Returns
+    -------
+    int
+        Number of steps taken.
+    """
+    active_bots = sorted(world.active_bots, key=lambda b: b.id or 0)
+    arrivals_checked_from = min(
+        (_steps_before_arrival(b) for b in active_bots), default=steps
+    )
+    steps_taken = 0
+    while steps_taken < steps:
+        if steps_taken and condition and condition(world):
+            break
+        if steps_taken >= arrivals_checked_from and any(
+            b.is_arriving for b in active_bots
+        ):
+            break
+        for bot in active_bots:
+            bot.coast()
+        world.step_counter += 1
+        steps_taken += 1
+
+    for bot in active_bots:
+        # As if sensed on the last step:
+        if bot.memory is not None:
+            bot.memory.expire(world.step_counter - 1)
+    _STEPS_FAST_FORWARDED.inc(steps_taken)
+    return steps_taken
+
+
+def _steps_before_arrival(bot: Bot) -> int:
+    """Return a lower bound on steps before a `Bot` could be arriving."""
+    if not bot.route:
+        return MAX_FAST_FORWARD_STEPS
+    if bot.destination is None:
+        return 0
+    step_distance = _max_step_distance(bot)
+    if not step_distance:
+        return MAX_FAST_FORWARD_STEPS
+    distance = min(
+        bot.position.distance_to(bot.route[0]),
+        bot.position.distance_to(bot.destination),
+    )
+    return max(
+        math.floor((distance - bot.POSITION_ARRIVAL_TOLERANCE) / step_distance) - 1,
+        0,
+    )
+
+
+def _max_step_distance(bot: Bot) -> float:
+    """Return the furthest a `Bot` can move in a step."""
+    return max(bot.max_speed, bot.velocity.length()) / SIMULATION_FPS
+
+
+def _reach(bot: Bot, other: Bot) -> float:
+    """Return the distance within which two `Bot`s can see or collide."""
+    return max(bot.vision_range, other.vision_range, bot.radius + other.radius)
@@ -0,0 +1,129 @@
+"""Contains `FieldOfView` class, and shadowcasting to compute it."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from two_d_game_ai.world.grid import Grid
+    from two_d_game_ai.world.grid_ref import GridRef
+
+_OCTANTS = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+)
+"""Transforms from octant-relative (column, row) to `Grid` x, y offsets:
+xx, xy, yx, yy."""
+
+
+@dataclass(frozen=True, slots=True)
+class FieldOfView:
+    """Cells visible from an origin cell, within a radius, past movement-blocking cells.
+
+    Held as a bitset (one byte per cell) over the square window around the origin.
+    Blocking cells are visible themselves, but hide cells behind them.
+    """
+
+    origin: GridRef
+    radius: int
+    """`Grid` units."""
+    visible: bytearray
+    """By row-major index within the window: 1 if visible, else 0."""
+
+    def __contains__(self, cell: GridRef) -> bool:
+        width = 2 * self.radius + 1
+        x = cell.x - self.origin.x + self.radius
+        y = cell.y - self.origin.y + self.radius
+        return 0 <= x < width and 0 <= y < width and bool(self.visible[y * width + x])
+
+
+def shadowcast(grid: Grid, origin: GridRef, radius: int) -> FieldOfView:
+    """Compute the `FieldOfView` from a cell, with recursive shadowcasting.
+
+    Each octant is scanned row by row outwards from the origin, tracking the slopes
+    between which cells are lit. A blocking cell narrows the lit range, and starts a
+    recursive scan of the rows beyond it. So each visible cell is visited about once,
+    rather than tracing a ray to every cell. Cells outside the `Grid` block.
+    """
+    width = 2 * radius + 1
+    field_of_view = FieldOfView(origin, radius, bytearray(width * width))
+    field_of_view.visible[radius * width + radius] = 1
+    for transform in _OCTANTS:
+        _cast_light(grid, field_of_view, 1, 1.0, 0.0, transform)
+    return field_of_view
+
+
+def _cast_light(
+    grid: Grid,
+    field_of_view: FieldOfView,
+    row: int,
+    start_slope: float,
+    end_slope: float,
+    transform: tuple[int, int, int, int],
+) -> None:
+    """Light an octant from `row` outwards, between slopes."""
+    if start_slope < end_slope:
+        return
+    xx, xy, yx, yy = transform
+    radius = field_of_view.radius
+    new_start_slope = start_slope
+
+    for distance in range(row, radius + 1):
+        is_blocked = False
+        dy = -distance
+        for dx in range(-distance, 1):
+            left_slope = (dx - 0.5) / (dy + 0.5)
+            right_slope = (dx + 0.5) / (dy - 0.5)
+            if start_slope < right_slope:
+                continue
+            if end_slope > left_slope:
+                break
+
+            cell_blocks = _light(
+                grid, field_of_view, dx * xx + dy * xy, dx * yx + dy * yy
+            )
+            if is_blocked:
+                if cell_blocks:
+                    new_start_slope = right_slope
+                else:
+                    is_blocked = False
+                    start_slope = new_start_slope
+            elif cell_blocks and distance < radius:
+                is_blocked = True
+                _cast_light(
+                    grid,
+                    field_of_view,
+                    distance + 1,
+                    start_slope,
+                    left_slope,
+                    transform,
+                )
+                new_start_slope = right_slope
+        if is_blocked:
+            break
+
+
+def _light(
+    grid: Grid, field_of_view: FieldOfView, offset_x: int, offset_y: int
+) -> bool:
+    """Mark a cell visible, if within radius; return whether it blocks vision.
+
+    Cells outside the `Grid` block.
+    """
+    radius = field_of_view.radius
+    if offset_x * offset_x + offset_y * offset_y <= radius * radius:
+        width = 2 * radius + 1
+        field_of_view.visible[(offset_y + radius) * width + offset_x + radius] = 1
+    x = field_of_view.origin.x + offset_x
+    y = field_of_view.origin.y + offset_y
+    size = grid.size
+    return not (0 <= x < size and 0 <= y < size) or bool(
+        grid.blocked_mask[y * size + x]
+    )
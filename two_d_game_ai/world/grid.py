@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import math
+import threading
+from array import array
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, ClassVar
 
@@ -10,15 +11,32 @@ from loguru import logger
 from pygame import Vector2
 from pygame.math import lerp
 
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.tracing import traced
+from two_d_game_ai.world.field_of_view import FieldOfView, shadowcast
 from two_d_game_ai.world.grid_ref import GridRef
-from two_d_game_ai.world.priority_queue import PriorityQueue
+from two_d_game_ai.world.priority_queue import FRONTIERS
+from two_d_game_ai.world.route_engines import (
+    DEFAULT_FRONTIER,
+    REFERENCE_ENGINE,
+    ROUTE_ENGINES,
+)
+from two_d_game_ai.world.search_scratch import SearchScratch
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Set as AbstractSet
+    from random import Random
+
     from two_d_game_ai.world.world import World
 
 
 _MIN_PATH_NODES: int = 3
 
+_ROUTES_COMPUTED = metrics.counter("grid.routes_computed")
+_PATH_LENGTH = metrics.histogram("grid.path_length")
+"""Cells on searched paths."""
+
 
 @dataclass
 class Grid:
@@ -45,19 +63,210 @@ class Grid:
     }
     _DIRECTIONS: ClassVar = _CARDINAL_DIRECTIONS | _DIAGONAL_DIRECTIONS
 
+    FIELDS_OF_VIEW_CAPACITY: ClassVar[int] = 4096
+    """Maximum fields of view cached. Least recently used are evicted first."""
+
     size: int = DEFAULT_SIZE
     """`Grid` units per side."""
+    route_engine: str = REFERENCE_ENGINE
+    """Name of search used by `route`; see
+    `two_d_game_ai.world.route_engines.ROUTE_ENGINES`."""
+    route_frontier: str = DEFAULT_FRONTIER
+    """Name of priority queue used by `route_engine`; see
+    `two_d_game_ai.world.priority_queue.FRONTIERS`."""
     movement_blocking_cells: set[GridRef] = field(init=False, default_factory=set)
+    """Use `block_cells` to add cells, so that derived indexes are kept up to date."""
+    version: int = field(init=False, default=0)
+    """Incremented whenever cells are blocked, invalidating derived caches."""
+
+    _blocked_mask: bytearray = field(init=False)
+    """By row-major cell index: 1 if movement-blocking, else 0."""
+    _free_cells: array[int] | None = field(init=False, default=None)
+    """Indexes of cells which aren't movement-blocking, in no particular order.
+    Built when first needed."""
+    _free_cell_slots: array[int] = field(init=False, default_factory=lambda: array("l"))
+    """Maps cell index to its position in `_free_cells`, or -1 if blocked."""
+    _thread_local: threading.local = field(
+        init=False, default_factory=threading.local, repr=False, compare=False
+    )
+    """Holds each thread's `SearchScratch`."""
+    _fields_of_view: dict[tuple[int, int], FieldOfView] = field(
+        init=False, default_factory=dict, repr=False, compare=False
+    )
+    """Cache of `field_of_view` results, by cell index and radius, least recently used
+    first."""
+    _fields_of_view_lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False, compare=False
+    )
+    """`Bot`s may sense concurrently; see `World.update_executor`."""
+
+    def __post_init__(self) -> None:
+        self._blocked_mask = bytearray(self.size**2)
 
     def __str__(self) -> str:
         """Human-readable description."""
         return f"{type(self).__name__}(size={self.size})"
 
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle, or copy, without per-thread search scratch; it's recreated."""
+        state = self.__dict__.copy()
+        del state["_thread_local"]
+        del state["_fields_of_view_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._thread_local = threading.local()
+        self._fields_of_view_lock = threading.Lock()
+
+    @property
+    def blocked_mask(self) -> bytearray:
+        """By row-major cell index: 1 if movement-blocking, else 0.
+
+        For fast lookup, e.g. in searches. Don't modify; use `block_cells`.
+        """
+        return self._blocked_mask
+
     @property
     def cells(self) -> set[GridRef]:
         """Return all cells."""
         return {GridRef(x, y) for x in range(self.size) for y in range(self.size)}
 
+    def search_scratch(self) -> SearchScratch:
+        """Return this thread's search working arrays, creating them if necessary."""
+        scratch: SearchScratch | None = getattr(self._thread_local, "scratch", None)
+        if scratch is None:
+            scratch = SearchScratch(self.size**2)
+            self._thread_local.scratch = scratch
+        return scratch
+
+    def cell_index(self, cell: GridRef) -> int:
+        """Return the row-major index of a cell."""
+        return cell.y * self.size + cell.x
+
+    def cell_from_index(self, index: int) -> GridRef:
+        """Return the cell with a row-major index."""
+        return GridRef(index % self.size, index // self.size)
+
+    def block_cells(self, cells: Iterable[GridRef]) -> set[GridRef]:
+        """Set cells to movement-blocking.
+
+        Returns
+        -------
+        set[GridRef]
+            Cells which weren't previously movement-blocking.
+        """
+        newly_blocked_cells = set(cells) - self.movement_blocking_cells
+        if newly_blocked_cells:
+            self.version += 1
+            with self._fields_of_view_lock:
+                self._fields_of_view.clear()
+        self.movement_blocking_cells.update(newly_blocked_cells)
+        for cell in newly_blocked_cells:
+            if not self._cell_is_in_bounds(cell):
+                continue
+            index = self.cell_index(cell)
+            self._blocked_mask[index] = 1
+            self._remove_free_cell(index)
+        return newly_blocked_cells
+
+    def block_cells_from_mask(
+        self, mask: bytes | bytearray, cells: AbstractSet[GridRef]
+    ) -> None:
+        """Set cells to movement-blocking, given both as a mask and as cells.
+
+        e.g. from another `Grid`'s `blocked_mask` and `movement_blocking_cells`. If no
+        cells are blocked yet, both are copied whole, rather than cell by cell as in
+        `block_cells`.
+
+        Parameters
+        ----------
+        mask
+            By row-major cell index: 1 if movement-blocking, else 0.
+        cells
+            The same cells as are set in `mask`.
+
+        Raises
+        ------
+        ValueError
+            If `mask` isn't one byte per cell.
+        """
+        if len(mask) != self.size**2:
+            err_msg = f"{self!s}: mask must have {self.size**2} bytes, not {len(mask)}."
+            raise ValueError(err_msg)
+        if self.movement_blocking_cells:
+            self.block_cells(cells)
+            return
+        if not cells:
+            return
+        self.version += 1
+        with self._fields_of_view_lock:
+            self._fields_of_view.clear()
+        self.movement_blocking_cells.update(cells)
+        self._blocked_mask[:] = mask
+        self._free_cells = None  # rebuilt when next needed
+
+    def field_of_view(self, cell: GridRef, radius: int) -> FieldOfView:
+        """Return cells visible from `cell` within `radius`, past blocking cells.
+
+        Computed by shadowcasting once per cell and radius, then cached until cells
+        are next blocked, or until evicted, for `FIELDS_OF_VIEW_CAPACITY`.
+        """
+        key = (self.cell_index(cell), radius)
+        with self._fields_of_view_lock:
+            # (re)insert as most recently used:
+            field_of_view = self._fields_of_view.pop(key, None)
+            if field_of_view is not None:
+                self._fields_of_view[key] = field_of_view
+                return field_of_view
+        version = self.version
+        field_of_view = shadowcast(self, cell, radius)
+        with self._fields_of_view_lock:
+            if self.version != version:  # blocked meanwhile; don't cache
+                return field_of_view
+            while len(self._fields_of_view) >= self.FIELDS_OF_VIEW_CAPACITY:
+                del self._fields_of_view[next(iter(self._fields_of_view))]
+            self._fields_of_view[key] = field_of_view
+        return field_of_view
+
+    def random_free_cell(self, rng: Random) -> GridRef:
+        """Return a random cell which isn't movement-blocking, in constant time.
+
+        Raises
+        ------
+        ValueError
+            If all cells are movement-blocking.
+        """
+        free_cells = self._ensure_free_cells()
+        if not free_cells:
+            err_msg = f"{self!s}: no free cells."
+            raise ValueError(err_msg)
+        return self.cell_from_index(free_cells[rng.randrange(len(free_cells))])
+
+    def _ensure_free_cells(self) -> array[int]:
+        """Return the free cell index, building it if necessary."""
+        if self._free_cells is None:
+            self._free_cells = array("l")
+            self._free_cell_slots = array("l", [-1]) * self.size**2
+            for index, is_blocked in enumerate(self._blocked_mask):
+                if not is_blocked:
+                    self._free_cell_slots[index] = len(self._free_cells)
+                    self._free_cells.append(index)
+        return self._free_cells
+
+    def _remove_free_cell(self, index: int) -> None:
+        """Remove a cell from the free cell index, by swapping in the last entry."""
+        if self._free_cells is None or not 0 <= index < len(self._free_cell_slots):
+            return
+        slot = self._free_cell_slots[index]
+        if slot == -1:
+            return
+        last_index = self._free_cells.pop()
+        if last_index != index:
+            self._free_cells[slot] = last_index
+            self._free_cell_slots[last_index] = slot
+        self._free_cell_slots[index] = -1
+
     def _cell_is_in_bounds(self, cell: GridRef) -> bool:
         """Determine whether a cell is within the `Grid`."""
         return 0 <= cell.x < self.size and 0 <= cell.y < self.size
@@ -78,12 +287,16 @@ class Grid:
 
         return reachable_neighbours
 
+    @traced("Grid.route")
     def route(
         self,
         from_cell: GridRef,
         to_cell: GridRef,
     ) -> list[GridRef] | None:
-        """Determine a cell-based route between two cells using uniform cost search.
+        """Determine a cell-based route between two cells.
+
+        Uses a direct route if there's line of sight; otherwise searches with
+        `route_engine` and `route_frontier`.
 
         Parameters
         ----------
@@ -97,6 +310,7 @@ class Grid:
         `None`
             if no route was found.
         """
+        _ROUTES_COMPUTED.inc()
         # Early return cases:
         if (
             from_cell in self.movement_blocking_cells
@@ -105,75 +319,25 @@ class Grid:
             return None
         if from_cell == to_cell:
             return [to_cell]
-        if self._is_line_of_sight(from_cell, to_cell):
+        if self.is_line_of_sight(from_cell, to_cell):
             return [from_cell, to_cell]
 
-        came_from = self._uniform_cost_search(from_cell, to_cell)
-
-        # Construct cell path starting at `to_cell` and retracing to `start_cell`...
-        path_from_goal = [to_cell]
-        current_cell = to_cell
-
-        while current_cell != from_cell:
-            came_from_location = came_from.get(current_cell)
-            if came_from_location is None:
-                return None
-
-            current_cell = came_from_location
-            path_from_goal.append(current_cell)
-
-        logger.debug(f"Calculated path: {len(path_from_goal)} points.")
-        return list(reversed(path_from_goal))
-
-    def _uniform_cost_search(
-        self,
-        start_cell: GridRef,
-        goal_cell: GridRef,
-    ) -> dict[GridRef, GridRef | None]:
-        came_from: dict[GridRef, GridRef | None] = {start_cell: None}
-        cost_so_far: dict[GridRef, float] = {start_cell: 0}
-        frontier: PriorityQueue = PriorityQueue()
-        frontier.put(0, start_cell)
-
-        while not frontier.is_empty:
-            current_cell = frontier.get()
-
-            if current_cell == goal_cell:  # early exit
-                break
-
-            for new_cell in self.reachable_neighbours(current_cell):
-                new_cost = cost_so_far[current_cell] + self._cost(
-                    current_cell, new_cell
-                )
-                if (
-                    new_cell not in came_from or new_cost < cost_so_far[new_cell]
-                    # add new_cell to frontier if cheaper
-                ):
-                    cost_so_far[new_cell] = new_cost
-                    frontier.put(priority=new_cost, location=new_cell)
-                    came_from[new_cell] = current_cell
-
-        return came_from
-
-    @staticmethod
-    def _cost(from_cell: GridRef, to_cell: GridRef) -> float:
-        """Calculate the cost as Euclidean distance from one cell to another.
-
-        NB: when calculating next step in a search, locations will be adjacent, so a
-        cardinal move has basic cost = 1, and diagonal basic cost =~ 1.4.
-        This function is generalised for wider use.
+        path = ROUTE_ENGINES[self.route_engine](
+            self, from_cell, to_cell, frontier=FRONTIERS[self.route_frontier]
+        )
+        if path is None:
+            return None
 
-        """
-        x_dist = abs(from_cell.x - to_cell.x)
-        y_dist = abs(from_cell.y - to_cell.y)
-        return math.sqrt(x_dist**2 + y_dist**2)
+        logger.debug("Calculated path: {} points.", len(path))
+        _PATH_LENGTH.observe(len(path))
+        return path
 
-    def _is_line_of_sight(self, cell_0: GridRef, cell_1: GridRef) -> bool:
+    def is_line_of_sight(self, cell_0: GridRef, cell_1: GridRef) -> bool:
         """Determine whether there is line-of-sight between two cells."""
-        cells = self._cells_on_line(cell_0, cell_1)
+        cells = self.cells_on_line(cell_0, cell_1)
         return all(cell not in self.movement_blocking_cells for cell in cells)
 
-    def _cells_on_line(self, cell_0: GridRef, cell_1: GridRef) -> set[GridRef]:
+    def cells_on_line(self, cell_0: GridRef, cell_1: GridRef) -> set[GridRef]:
         """Return cells on the line between two cells, including end cells."""
         if not self._cell_is_in_bounds(cell_0):
             err_msg = f"{self!s}: cell {cell_0} is out of bounds."
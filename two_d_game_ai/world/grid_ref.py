@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 
 from pygame import Vector2
 
 
-@dataclass(frozen=True)
-class GridRef:
+class GridRef(NamedTuple):
     """Grid reference class.
 
+    A `NamedTuple`, so compact, and cheap to hash and compare. NB: so also a tuple,
+    e.g. equal to `(x, y)`, and can be unpacked.
+
     NB: Not a `Grid` cell class.
     """
 
@@ -19,11 +21,14 @@ class GridRef:
     y: int
     """y coordinate."""
 
-    def __add__(self, other: GridRef) -> GridRef:
+    def __add__(self, other: GridRef) -> GridRef:  # type: ignore[override]
         return GridRef(self.x + other.x, self.y + other.y)
 
     def __sub__(self, other: GridRef) -> GridRef:
         return GridRef(self.x - other.x, self.y - other.y)
 
-    def __mul__(self, other: float) -> Vector2:
+    def __mul__(self, other: float) -> Vector2:  # type: ignore[override]
+        return Vector2(self.x * other, self.y * other)
+
+    def __rmul__(self, other: float) -> Vector2:  # type: ignore[override]
         return Vector2(self.x * other, self.y * other)
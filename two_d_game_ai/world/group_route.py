@@ -0,0 +1,59 @@
+"""Contains `GroupRoute` class."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pygame import Vector2
+
+if TYPE_CHECKING:
+    from two_d_game_ai.world.grid_ref import GridRef
+    from two_d_game_ai.world.world import World
+
+
+@dataclass(frozen=True)
+class GroupRoute:
+    """Route to a leader, shared by its followers.
+
+    Routed once, from the first follower needing it, while the leader stays in the
+    same cell. Other followers join it rather than each searching.
+    """
+
+    leader_cell: GridRef
+    """Cell containing the leader when routed."""
+    waypoints: list[Vector2]
+    """Points on the route; shared by followers' routes, so mustn't be modified."""
+
+    def joined_from(
+        self, world: World, from_pos: Vector2, to_pos: Vector2
+    ) -> list[Vector2] | None:
+        """Return a route which joins this one at the nearest waypoint in sight.
+
+        Parameters
+        ----------
+        world
+            The `World` this route is in.
+        from_pos
+            Follower's position.
+        to_pos
+            Leader's position, which replaces the final waypoint.
+
+        Returns
+        -------
+        list[Vector2]
+            `from_pos`, the shared waypoints from the join onwards, and `to_pos`.
+        `None`
+            if no waypoint is in sight.
+        """
+        from_cell = world.grid_ref_from_pos(from_pos)
+        by_distance = sorted(
+            range(len(self.waypoints) - 1),
+            key=lambda i: from_pos.distance_squared_to(self.waypoints[i]),
+        )
+        for i in by_distance:
+            if world.grid.is_line_of_sight(
+                from_cell, world.grid_ref_from_pos(self.waypoints[i])
+            ):
+                return [Vector2(from_pos), *self.waypoints[i:-1], Vector2(to_pos)]
+        return None
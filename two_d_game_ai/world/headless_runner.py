@@ -0,0 +1,135 @@
+"""Contains `HeadlessRunner` class."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+from loguru import logger
+
+from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.world.fast_forward import fast_forward, uneventful_steps
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from two_d_game_ai.world.world import World
+
+
+@dataclass(kw_only=True, frozen=True)
+class RunStats:
+    """Summary of a headless run."""
+
+    steps: int
+    """Number of steps taken."""
+    elapsed_seconds: float
+    """Wall-clock time taken."""
+
+    @property
+    def simulated_seconds(self) -> float:
+        """Simulated time covered by the run."""
+        return self.steps / SIMULATION_FPS
+
+    @property
+    def steps_per_second(self) -> float:
+        """Steps per wall-clock second."""
+        if self.elapsed_seconds == 0:
+            return float("inf")
+        return self.steps / self.elapsed_seconds
+
+    @property
+    def realtime_factor(self) -> float:
+        """Simulated time per wall-clock time, e.g. 10 is 10x faster than real-time."""
+        return self.steps_per_second / SIMULATION_FPS
+
+
+@dataclass(kw_only=True)
+class HeadlessRunner:
+    """Drives a `World` without a `View`, e.g. for batch simulations.
+
+    Doesn't require a pygame display. Ignores `World.is_paused`.
+    """
+
+    world: World
+    """The `World` to be run."""
+    max_fps: float | None = None
+    """Cap on steps per wall-clock second. `None` runs as fast as possible."""
+    fast_forward: bool = False
+    """Whether to fast-forward over uneventful steps, with identical results; see
+    `two_d_game_ai.world.fast_forward`. Ignored if `max_fps` is set."""
+
+    FAST_FORWARD_RETRY_STEPS: ClassVar[int] = 10
+    """Steps taken normally before looking for uneventful steps again, after finding
+    none."""
+
+    def run(self, steps: int) -> RunStats:
+        """Run for a number of steps."""
+        return self.run_until(lambda _: False, max_steps=steps)
+
+    def run_until(self, condition: Callable[[World], bool], max_steps: int) -> RunStats:
+        """Run until `condition` is met, or `max_steps` is reached.
+
+        Parameters
+        ----------
+        condition
+            Called with the `World` before each step; stops when it returns `True`.
+        max_steps
+            Upper limit on steps taken.
+
+        Returns
+        -------
+        RunStats
+            Summary of the run.
+        """
+        start_time = time.perf_counter()
+        if self.max_fps is None and self.fast_forward:
+            steps = self._run_until_fast_forwarding(condition, max_steps)
+        elif self.max_fps is None:
+            steps = self.world.run_until(condition, max_steps)
+        else:
+            steps = self._run_until_paced(condition, max_steps, self.max_fps)
+        stats = RunStats(steps=steps, elapsed_seconds=time.perf_counter() - start_time)
+        logger.info(
+            "{}: {} steps in {:.3f} s ({:.0f} steps/s).",
+            self.world,
+            stats.steps,
+            stats.elapsed_seconds,
+            stats.steps_per_second,
+        )
+        return stats
+
+    def _run_until_paced(
+        self, condition: Callable[[World], bool], max_steps: int, max_fps: float
+    ) -> int:
+        """Run, sleeping as necessary so as not to exceed `max_fps`."""
+        step_duration = 1 / max_fps
+        next_step_time = time.perf_counter()
+        steps_taken = 0
+        while steps_taken < max_steps and not condition(self.world):
+            delay = next_step_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.world.update()
+            steps_taken += 1
+            next_step_time += step_duration
+        return steps_taken
+
+    def _run_until_fast_forwarding(
+        self, condition: Callable[[World], bool], max_steps: int
+    ) -> int:
+        """Run, fast-forwarding over uneventful steps where possible."""
+        steps_taken = 0
+        next_look_ahead = 0
+        while steps_taken < max_steps and not condition(self.world):
+            if steps_taken >= next_look_ahead:
+                steps = uneventful_steps(self.world, max_steps - steps_taken)
+                if steps > 1:
+                    steps_taken += fast_forward(self.world, steps, condition)
+                    # Next step may be an arrival, so take it normally:
+                    next_look_ahead = steps_taken + 1
+                    continue
+                next_look_ahead = steps_taken + self.FAST_FORWARD_RETRY_STEPS
+            self.world.update()
+            steps_taken += 1
+        return steps_taken
@@ -0,0 +1,140 @@
+"""Contains loaders for Moving AI Lab pathfinding benchmark files.
+
+See https://movingai.com/benchmarks/formats.html. Files are read locally; none are
+downloaded.
+
+Map coordinates are used as `GridRef`s as-is, i.e. with y increasing down the map file.
+As the `World` y-axis is up, maps appear vertically flipped in a `View`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from two_d_game_ai.world.grid import Grid
+from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.world import World
+
+PASSABLE_TERRAIN = frozenset(".GS")
+"""Map characters for passable terrain: ground and swamp. Others are blocked."""
+
+_MAP_HEADER_LINES = 4
+_SCENARIO_FIELDS = 9
+
+
+@dataclass(frozen=True)
+class MovingAIMap:
+    """Map read from a `.map` file."""
+
+    width: int
+    height: int
+    blocked_cells: frozenset[GridRef]
+
+    @property
+    def grid_size(self) -> int:
+        """Side of the smallest square `Grid` that contains the map."""
+        return max(self.width, self.height)
+
+    def to_grid(self) -> Grid:
+        """Return a new `Grid` with the map's blocked cells.
+
+        Non-square maps are padded with blocked cells.
+        """
+        grid = Grid(size=self.grid_size)
+        grid.block_cells(self.blocked_cells | self._padding_cells())
+        return grid
+
+    def to_world(self) -> World:
+        """Return a new `World`, with one `World` unit per `Grid` cell."""
+        world = World(size=self.grid_size, grid_size=self.grid_size)
+        world.grid.block_cells(self.blocked_cells | self._padding_cells())
+        return world
+
+    def _padding_cells(self) -> set[GridRef]:
+        return {
+            GridRef(x, y)
+            for x in range(self.grid_size)
+            for y in range(self.grid_size)
+            if x >= self.width or y >= self.height
+        }
+
+
+@dataclass(frozen=True)
+class MovingAIScenario:
+    """Pathfinding query read from a `.scen` file."""
+
+    bucket: int
+    map_name: str
+    start: GridRef
+    goal: GridRef
+    optimal_length: float
+    """Octile path length, without cutting corners of blocked cells."""
+
+
+def load_map(path: str | Path) -> MovingAIMap:
+    """Read a `.map` file.
+
+    Raises
+    ------
+    ValueError
+        If the file is malformed.
+    """
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    header = {}
+    for line in lines[: _MAP_HEADER_LINES - 1]:
+        key, _, value = line.partition(" ")
+        header[key] = value
+    if lines[_MAP_HEADER_LINES - 1 : _MAP_HEADER_LINES] != ["map"]:
+        err_msg = f"{path}: expected 'map' line after header."
+        raise ValueError(err_msg)
+    try:
+        width = int(header["width"])
+        height = int(header["height"])
+    except (KeyError, ValueError) as e:
+        err_msg = f"{path}: missing or invalid width/height."
+        raise ValueError(err_msg) from e
+    rows = lines[_MAP_HEADER_LINES : _MAP_HEADER_LINES + height]
+    if len(rows) != height or any(len(row) < width for row in rows):
+        err_msg = f"{path}: map data doesn't match {width}x{height}."
+        raise ValueError(err_msg)
+    blocked_cells = frozenset(
+        GridRef(x, y)
+        for y, row in enumerate(rows)
+        for x, terrain in enumerate(row[:width])
+        if terrain not in PASSABLE_TERRAIN
+    )
+    return MovingAIMap(width=width, height=height, blocked_cells=blocked_cells)
+
+
+def load_scenarios(path: str | Path) -> list[MovingAIScenario]:
+    """Read a `.scen` file.
+
+    Raises
+    ------
+    ValueError
+        If the file is malformed.
+    """
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    if not lines or not lines[0].startswith("version"):
+        err_msg = f"{path}: expected 'version' line."
+        raise ValueError(err_msg)
+    scenarios = []
+    for line_number, line in enumerate(lines[1:], start=2):
+        if not line.strip():
+            continue
+        fields = line.split("\t") if "\t" in line else line.split()
+        if len(fields) != _SCENARIO_FIELDS:
+            err_msg = f"{path}:{line_number}: expected {_SCENARIO_FIELDS} fields."
+            raise ValueError(err_msg)
+        bucket, map_name, _, _, start_x, start_y, goal_x, goal_y, length = fields
+        scenarios.append(
+            MovingAIScenario(
+                bucket=int(bucket),
+                map_name=map_name,
+                start=GridRef(int(start_x), int(start_y)),
+                goal=GridRef(int(goal_x), int(goal_y)),
+                optimal_length=float(length),
+            )
+        )
+    return scenarios
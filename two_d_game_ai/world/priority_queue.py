@@ -1,53 +1,241 @@
-"""Contains priority queue implementation."""
+"""Contains priority queue implementations, used as search frontiers.
+
+All implement `Frontier`, and return equal-priority locations in insertion order.
+Searches push a location whenever they find a cheaper cost to it:
+
+- `PriorityQueue` pushes a duplicate entry; stale entries are popped later
+- `IndexedPriorityQueue` decreases the priority of the existing entry instead
+- `BucketQueue` buckets entries by priority, exploiting search step costs of only 1 and
+  √2, so that each heap operation is on a small bucket
+"""
 
 from __future__ import annotations
 
 import heapq
+import itertools
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, ClassVar, Generic, Protocol, TypeVar
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from two_d_game_ai.world.grid_ref import GridRef
 
+T = TypeVar("T", bound="GridRef | int")
+
+PrioritisedLocation = tuple[float, int, T]
+"""Heap entry: priority, insertion sequence number, location.
+
+The sequence number breaks ties, so locations themselves are never compared, and
+equal-priority locations are returned in insertion order. Plain tuples are compared
+by `heapq` without calling Python code.
+"""
+
+
+class Frontier(Protocol[T]):
+    """Priority queue of locations, lowest priority value first."""
+
+    pushes: int
+    """Entries pushed, including decreased-priority entries."""
+    pops: int
+    """Entries popped, including stale entries."""
+
+    @property
+    def is_empty(self) -> bool:
+        """Check whether the queue is empty."""
+        ...
+
+    def put(self, priority: float, location: T) -> None:
+        """Add a location with priority, or lower its priority if already queued."""
+        ...
+
+    def get(self) -> T:
+        """Remove and return the highest priority location."""
+        ...
+
 
 @dataclass(kw_only=True)
-class PriorityQueue:
+class PriorityQueue(Generic[T]):
     """Simple priority queue, using heapq.
 
-    Specialised for holding locations.
+    Specialised for holding locations: `GridRef`s or cell indexes.
+
+    Lazy: putting an already-queued location adds a duplicate entry.
     """
 
-    items: list[PrioritisedLocation] = field(init=False, default_factory=list)
+    items: list[PrioritisedLocation[T]] = field(init=False, default_factory=list)
+    pushes: int = field(init=False, default=0)
+    pops: int = field(init=False, default=0)
+    _sequence: Iterator[int] = field(init=False, default_factory=itertools.count)
 
     @property
     def is_empty(self) -> bool:
         """Check whether the queue is empty."""
         return not self.items
 
-    def put(self, priority: float, location: GridRef) -> None:
+    def put(self, priority: float, location: T) -> None:
         """Add a location with priority."""
-        heapq.heappush(
-            self.items, PrioritisedLocation(priority=priority, location=location)
-        )
+        self.pushes += 1
+        heapq.heappush(self.items, (priority, next(self._sequence), location))
+
+    def get(self) -> T:
+        """Remove and return the highest priority location.
+
+        NB this is the lowest `priority` value.
+        """
+        self.pops += 1
+        return heapq.heappop(self.items)[2]
+
+
+@dataclass(kw_only=True)
+class IndexedPriorityQueue(Generic[T]):
+    """Binary heap which tracks each location's position, allowing decrease-key.
+
+    Holds each location at most once, so there are no stale entries.
+    """
+
+    items: list[PrioritisedLocation[T]] = field(init=False, default_factory=list)
+    pushes: int = field(init=False, default=0)
+    pops: int = field(init=False, default=0)
+    _positions: dict[T, int] = field(init=False, default_factory=dict)
+    """Index in `items`, by location."""
+    _sequence: Iterator[int] = field(init=False, default_factory=itertools.count)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check whether the queue is empty."""
+        return not self.items
 
-    def get(self) -> GridRef:
+    def put(self, priority: float, location: T) -> None:
+        """Add a location with priority, or lower its priority if already queued.
+
+        A higher priority value than the queued one is ignored.
+        """
+        position = self._positions.get(location)
+        if position is None:
+            self.pushes += 1
+            self.items.append((priority, next(self._sequence), location))
+            self._sift_up(len(self.items) - 1)
+        elif priority < self.items[position][0]:
+            self.pushes += 1
+            self.items[position] = (priority, next(self._sequence), location)
+            self._sift_up(position)
+
+    def get(self) -> T:
         """Remove and return the highest priority location.
 
         NB this is the lowest `priority` value.
         """
-        return heapq.heappop(self.items).location
+        self.pops += 1
+        items = self.items
+        last = items.pop()
+        if not items:
+            del self._positions[last[2]]
+            return last[2]
+        first = items[0]
+        items[0] = last
+        del self._positions[first[2]]
+        self._sift_down(0)
+        return first[2]
+
+    def _sift_up(self, position: int) -> None:
+        items = self.items
+        entry = items[position]
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent = items[parent_position]
+            if entry >= parent:
+                break
+            items[position] = parent
+            self._positions[parent[2]] = position
+            position = parent_position
+        items[position] = entry
+        self._positions[entry[2]] = position
+
+    def _sift_down(self, position: int) -> None:
+        items = self.items
+        end = len(items)
+        entry = items[position]
+        child_position = 2 * position + 1
+        while child_position < end:
+            right_position = child_position + 1
+            if right_position < end and items[right_position] < items[child_position]:
+                child_position = right_position
+            child = items[child_position]
+            if entry <= child:
+                break
+            items[position] = child
+            self._positions[child[2]] = position
+            position = child_position
+            child_position = 2 * position + 1
+        items[position] = entry
+        self._positions[entry[2]] = position
 
 
 @dataclass(kw_only=True)
-class PrioritisedLocation:
-    """Wrapper for prioritised location.
+class BucketQueue(Generic[T]):
+    """Queue of buckets, each a small heap of entries whose priorities are in a range.
+
+    Suited to monotone searches, where popped priorities never decrease. Bucket width
+    is the least search step cost (1), so the lowest non-empty bucket is found by
+    scanning forward from the last one popped.
 
-    Avoids unintended prioritisation attempts on `location` itself.
+    Lazy, like `PriorityQueue`.
     """
 
-    priority: float
-    location: GridRef
+    BUCKET_WIDTH: ClassVar[float] = 1
+    """Priority range of each bucket."""
 
-    def __lt__(self, other: Self) -> bool:
-        """Determine priority for `heapq`."""
-        return self.priority < other.priority
+    pushes: int = field(init=False, default=0)
+    pops: int = field(init=False, default=0)
+    _buckets: list[list[PrioritisedLocation[T]]] = field(
+        init=False, default_factory=list
+    )
+    _current: int = field(init=False, default=0)
+    """Index of lowest bucket that might be non-empty."""
+    _size: int = field(init=False, default=0)
+    _sequence: Iterator[int] = field(init=False, default_factory=itertools.count)
+
+    @property
+    def is_empty(self) -> bool:
+        """Check whether the queue is empty."""
+        return not self._size
+
+    def put(self, priority: float, location: T) -> None:
+        """Add a location with priority."""
+        self.pushes += 1
+        self._size += 1
+        index = int(priority / self.BUCKET_WIDTH)
+        buckets = self._buckets
+        if index >= len(buckets):
+            buckets.extend([] for _ in range(index - len(buckets) + 1))
+        heapq.heappush(buckets[index], (priority, next(self._sequence), location))
+        self._current = min(self._current, index)
+
+    def get(self) -> T:
+        """Remove and return the highest priority location.
+
+        NB this is the lowest `priority` value.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty.
+        """
+        if not self._size:
+            err_msg = "get from empty BucketQueue"
+            raise IndexError(err_msg)
+        self.pops += 1
+        self._size -= 1
+        buckets = self._buckets
+        while not buckets[self._current]:
+            self._current += 1
+        return heapq.heappop(buckets[self._current])[2]
+
+
+FRONTIERS: dict[str, Callable[[], Frontier[int]]] = {
+    "binary_heap": PriorityQueue,
+    "indexed_heap": IndexedPriorityQueue,
+    "bucket_queue": BucketQueue,
+}
+"""Frontier implementations for searches on cell indexes, by name."""
@@ -0,0 +1,220 @@
+"""Contains route engines: interchangeable searches used by `Grid.route`.
+
+An engine takes a `Grid`, start and goal cells, and a frontier (priority queue)
+factory, and returns the cells on a least-cost path between them, or `None` if there
+is none. Engines are registered by name in `ROUTE_ENGINES`; `uniform_cost` with the
+default frontier is the reference that others are verified against (see
+`benchmarks/verify_routes.py`).
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Protocol
+
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.world.priority_queue import PriorityQueue
+
+if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Callable
+
+    from two_d_game_ai.world.grid import Grid
+    from two_d_game_ai.world.grid_ref import GridRef
+    from two_d_game_ai.world.priority_queue import Frontier
+
+    FrontierFactory = Callable[[], Frontier[int]]
+
+
+class RouteEngine(Protocol):
+    """Search for a least-cost path between cells."""
+
+    def __call__(
+        self,
+        grid: Grid,
+        start_cell: GridRef,
+        goal_cell: GridRef,
+        *,
+        frontier: FrontierFactory = ...,
+    ) -> list[GridRef] | None:
+        """Return cells on the path, including start and goal, or `None`."""
+        ...
+
+
+REFERENCE_ENGINE = "uniform_cost"
+DEFAULT_FRONTIER = "binary_heap"
+
+ROUTE_ENGINES: dict[str, RouteEngine] = {}
+"""Route engines, by name."""
+
+_NODES_EXPANDED = metrics.histogram("grid.nodes_expanded")
+"""Cells expanded per search."""
+_FRONTIER_PUSHES = metrics.histogram("grid.frontier_pushes")
+"""Frontier entries pushed per search."""
+_FRONTIER_POPS = metrics.histogram("grid.frontier_pops")
+"""Frontier entries popped per search."""
+
+
+def register_route_engine(name: str) -> Callable[[RouteEngine], RouteEngine]:
+    """Decorate a function to register it as a route engine."""
+
+    def decorator(engine: RouteEngine) -> RouteEngine:
+        ROUTE_ENGINES[name] = engine
+        return engine
+
+    return decorator
+
+
+def cost(from_cell: GridRef, to_cell: GridRef) -> float:
+    """Calculate the cost as Euclidean distance from one cell to another.
+
+    NB: when calculating next step in a search, locations will be adjacent, so a
+    cardinal move has basic cost = 1, and diagonal basic cost =~ 1.4.
+    This function is generalised for wider use.
+    """
+    x_dist = abs(from_cell.x - to_cell.x)
+    y_dist = abs(from_cell.y - to_cell.y)
+    return math.sqrt(x_dist**2 + y_dist**2)
+
+
+def octile_distance(from_cell: GridRef, to_cell: GridRef) -> float:
+    """Return the least cost between cells, moving cardinally and diagonally.
+
+    Never overestimates, so is an admissible heuristic.
+    """
+    return _octile_distance(from_cell.x, from_cell.y, to_cell.x, to_cell.y)
+
+
+@register_route_engine(REFERENCE_ENGINE)
+def uniform_cost(
+    grid: Grid,
+    start_cell: GridRef,
+    goal_cell: GridRef,
+    *,
+    frontier: FrontierFactory = PriorityQueue,
+) -> list[GridRef] | None:
+    """Find a path using uniform cost search (Dijkstra's algorithm)."""
+    return _best_first_search(
+        grid, start_cell, goal_cell, heuristic=None, frontier_factory=frontier
+    )
+
+
+@register_route_engine("a_star")
+def a_star(
+    grid: Grid,
+    start_cell: GridRef,
+    goal_cell: GridRef,
+    *,
+    frontier: FrontierFactory = PriorityQueue,
+) -> list[GridRef] | None:
+    """Find a path using A* search, with octile distance heuristic."""
+    return _best_first_search(
+        grid,
+        start_cell,
+        goal_cell,
+        heuristic=_octile_distance,
+        frontier_factory=frontier,
+    )
+
+
+_DIAGONAL_COST = math.sqrt(2)
+_STEPS = (
+    (1, 0, 1.0),
+    (0, 1, 1.0),
+    (-1, 0, 1.0),
+    (0, -1, 1.0),
+    (1, 1, _DIAGONAL_COST),
+    (-1, 1, _DIAGONAL_COST),
+    (-1, -1, _DIAGONAL_COST),
+    (1, -1, _DIAGONAL_COST),
+)
+"""x, y offsets of neighbouring cells, and cost of moving to them."""
+
+
+def _octile_distance(x0: int, y0: int, x1: int, y1: int) -> float:
+    x_dist = abs(x0 - x1)
+    y_dist = abs(y0 - y1)
+    return max(x_dist, y_dist) + (_DIAGONAL_COST - 1) * min(x_dist, y_dist)
+
+
+def _best_first_search(
+    grid: Grid,
+    start_cell: GridRef,
+    goal_cell: GridRef,
+    heuristic: Callable[[int, int, int, int], float] | None,
+    frontier_factory: FrontierFactory,
+) -> list[GridRef] | None:
+    """Search on cell indexes (row-major), which are cheaper than `GridRef`s.
+
+    Uses the `Grid`'s per-thread scratch arrays, so allocates little per search.
+    """
+    size = grid.size
+    blocked_mask = grid.blocked_mask
+    scratch = grid.search_scratch()
+    generation = scratch.begin()
+    visited = scratch.visited
+    closed = scratch.closed
+    parent = scratch.parent
+    cost_so_far = scratch.cost
+    goal_x, goal_y = goal_cell
+    start = grid.cell_index(start_cell)
+    goal = grid.cell_index(goal_cell)
+    visited[start] = generation
+    parent[start] = -1
+    cost_so_far[start] = 0
+    frontier = frontier_factory()
+    frontier.put(0, start)
+    nodes_expanded = 0
+
+    while not frontier.is_empty:
+        current = frontier.get()
+
+        if current == goal:  # early exit
+            break
+        if closed[current] == generation:  # stale entry
+            continue
+        closed[current] = generation
+
+        nodes_expanded += 1
+        y, x = divmod(current, size)
+        current_cost = cost_so_far[current]
+
+        for dx, dy, step_cost in _STEPS:
+            new_x = x + dx
+            new_y = y + dy
+            if not (0 <= new_x < size and 0 <= new_y < size):
+                continue
+            new = new_y * size + new_x
+            if blocked_mask[new]:
+                continue
+            new_cost = current_cost + step_cost
+            if (
+                visited[new] != generation or new_cost < cost_so_far[new]
+                # add new cell to frontier if cheaper
+            ):
+                visited[new] = generation
+                cost_so_far[new] = new_cost
+                parent[new] = current
+                priority = new_cost
+                if heuristic:
+                    priority += heuristic(new_x, new_y, goal_x, goal_y)
+                frontier.put(priority=priority, location=new)
+
+    _NODES_EXPANDED.observe(nodes_expanded)
+    _FRONTIER_PUSHES.observe(frontier.pushes)
+    _FRONTIER_POPS.observe(frontier.pops)
+    if visited[goal] != generation:
+        return None
+    return _path(grid, parent, start, goal)
+
+
+def _path(grid: Grid, parent: array[int], start: int, goal: int) -> list[GridRef]:
+    """Construct cell path starting at `goal` and retracing to `start`."""
+    path_from_goal = [goal]
+    current = goal
+
+    while current != start:
+        current = parent[current]
+        path_from_goal.append(current)
+
+    return [grid.cell_from_index(i) for i in reversed(path_from_goal)]
@@ -0,0 +1,65 @@
+"""Contains `RouteIndex` class."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+    from two_d_game_ai.world.grid_ref import GridRef
+
+T = TypeVar("T", bound="Hashable")
+
+
+@dataclass(kw_only=True)
+class RouteIndex(Generic[T]):
+    """Reverse index from `Grid` cells to the routes passing through them.
+
+    Routes are identified by their owners, e.g. `Bot`s. Candidates only: an owner may
+    have moved past a cell since its route was indexed.
+    """
+
+    _owners: dict[GridRef, set[T]] = field(init=False, default_factory=dict)
+    """Owners of routes through each cell."""
+    _cells: dict[T, set[GridRef]] = field(init=False, default_factory=dict)
+    """Cells on each owner's route."""
+
+    def __contains__(self, owner: T) -> bool:
+        return owner in self._cells
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def update(self, owner: T, cells: set[GridRef]) -> None:
+        """Index an owner's route by the cells it passes through, replacing any
+        previous route.
+        """
+        old_cells = self._cells.get(owner, set())
+        for cell in old_cells - cells:
+            self._discard_from_cell(owner, cell)
+        for cell in cells - old_cells:
+            self._owners.setdefault(cell, set()).add(owner)
+        if cells:
+            self._cells[owner] = cells
+        else:
+            self._cells.pop(owner, None)
+
+    def discard(self, owner: T) -> None:
+        """Remove an owner's route, if present."""
+        for cell in self._cells.pop(owner, set()):
+            self._discard_from_cell(owner, cell)
+
+    def owners_through(self, cells: Iterable[GridRef]) -> set[T]:
+        """Return owners of routes through any of `cells`."""
+        owners: set[T] = set()
+        for cell in cells:
+            owners.update(self._owners.get(cell, ()))
+        return owners
+
+    def _discard_from_cell(self, owner: T, cell: GridRef) -> None:
+        owners = self._owners[cell]
+        owners.discard(owner)
+        if not owners:
+            del self._owners[cell]
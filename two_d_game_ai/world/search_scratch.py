@@ -0,0 +1,42 @@
+"""Contains `SearchScratch` class."""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SearchScratch:
+    """Per-cell working arrays for searches, reused between searches.
+
+    Indexed by row-major cell index. Rather than clearing the arrays before each
+    search, a search takes a new `generation` with `begin`: a cell's `parent` and
+    `cost` are valid only where `visited[cell] == generation`, and it's closed only
+    where `closed[cell] == generation`. So reset is O(1).
+
+    Not thread-safe: each thread needs its own; see `Grid.search_scratch`.
+    """
+
+    cell_count: int
+
+    generation: int = field(init=False, default=0)
+    visited: array[int] = field(init=False)
+    """Generation in which cell was last reached."""
+    closed: array[int] = field(init=False)
+    """Generation in which cell was last expanded."""
+    parent: array[int] = field(init=False)
+    """Index of cell from which cell was reached at least cost."""
+    cost: array[float] = field(init=False)
+    """Least cost to reach cell."""
+
+    def __post_init__(self) -> None:
+        self.visited = array("q", bytes(8 * self.cell_count))
+        self.closed = array("q", bytes(8 * self.cell_count))
+        self.parent = array("q", bytes(8 * self.cell_count))
+        self.cost = array("d", bytes(8 * self.cell_count))
+
+    def begin(self) -> int:
+        """Start a new search, invalidating all cell values; return its generation."""
+        self.generation += 1
+        return self.generation
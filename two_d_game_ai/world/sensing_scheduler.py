@@ -0,0 +1,89 @@
+"""Contains `SensingScheduler` class."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pygame import Vector2
+
+    from two_d_game_ai.entities.bot import Bot
+
+
+@dataclass(kw_only=True)
+class SensingScheduler:
+    """Level-of-detail scheduler, deciding which `Bot`s sense on each step.
+
+    Each `Bot` senses every `n`th step, where `n` depends on what it's doing and how
+    near it is to `focus`. `Bot`s are staggered by `id`, so that load is spread evenly
+    across steps. Optionally, sensing per step is capped; `Bot`s which miss out are
+    given priority on following steps.
+    """
+
+    focus: Vector2 | None = None
+    """Point of interest, e.g. camera centre, in `World` coordinates."""
+    near_distance: float = 20
+    """`World` units. `Bot`s within this distance of `focus` are near."""
+    near_interval: int = 1
+    """Steps between sensing, for `Bot`s which are near, or in pursuit of a leader."""
+    far_interval: int = 4
+    """Steps between sensing, for other moving `Bot`s, including those on a route."""
+    idle_interval: int = 8
+    """Steps between sensing, for other stationary `Bot`s."""
+    max_per_step: int | None = None
+    """Maximum `Bot`s sensing per step. `None` for no limit."""
+
+    _step: int = field(init=False, default=0)
+    _sensed_this_step: int = field(init=False, default=0)
+    _overdue: dict[Bot, None] = field(init=False, default_factory=dict)
+    """`Bot`s which were due, but missed out due to `max_per_step`. Ordered."""
+    _reserved: int = field(init=False, default=0)
+    """Sensing slots reserved this step for overdue `Bot`s."""
+
+    def begin_step(self, step: int) -> None:
+        """Reset per-step state. Call at the start of each `World` step."""
+        self._step = step
+        self._sensed_this_step = 0
+        self._reserved = len(self._overdue)
+
+    def interval(self, bot: Bot) -> int:
+        """Return steps between sensing for `bot`."""
+        if bot.leader:
+            return self.near_interval
+        if (
+            self.focus is not None
+            and bot.position.distance_to(self.focus) < self.near_distance
+        ):
+            return self.near_interval
+        if bot.velocity:
+            return self.far_interval
+        return self.idle_interval
+
+    def is_due(self, bot: Bot) -> bool:
+        """Determine whether `bot` should sense this step.
+
+        If it should, it's counted against `max_per_step`.
+        """
+        is_overdue = bot in self._overdue
+        if not is_overdue and (self._step + (bot.id or 0)) % self.interval(bot):
+            return False
+        if self.max_per_step is None:
+            return True
+
+        if is_overdue:
+            self._reserved = max(self._reserved - 1, 0)
+            available = self._sensed_this_step < self.max_per_step
+        else:
+            available = self._sensed_this_step + self._reserved < self.max_per_step
+
+        if available:
+            self._overdue.pop(bot, None)
+            self._sensed_this_step += 1
+        else:
+            self._overdue[bot] = None
+        return available
+
+    def discard(self, bot: Bot) -> None:
+        """Forget `bot`, e.g. when it stops being updated."""
+        self._overdue.pop(bot, None)
@@ -0,0 +1,577 @@
+"""Contains `ShardedWorld` class, running a `World`'s `Bot`s across worker processes.
+
+The `World` is partitioned into square spatial tiles, one per worker process. Each
+worker updates its tile's `Bot`s. It also holds read-only 'ghost' copies of `Bot`s
+from other tiles within a halo around its tile, so that sensing and collision
+detection work across tile boundaries. Each worker exports ghosts of its own `Bot`s
+which are within other tiles' halos, so the parent process only routes them, and those
+of migrating `Bot`s. `Bot`s which move out of their tile migrate to the new tile's
+worker.
+
+Every step, the positions, headings and velocities of the wrapped `World`'s own `Bot`s
+are kept up to date, e.g. for rendering. Other state, e.g. routes and knowledge of
+other `Bot`s, is only copied back by `ShardedWorld.sync`.
+
+Limitations:
+- The obstacle layout is fixed when the `ShardedWorld` is created.
+- Ghosts are at their positions at the end of the previous step.
+- A `Bot`'s `remembered_bots` includes only `Bot`s local to, or ghosts in, its tile;
+  its `memory` is complete.
+"""
+
+from __future__ import annotations
+
+import math
+import multiprocessing
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Self
+
+from loguru import logger
+from pygame import Vector2
+
+from two_d_game_ai import SIMULATION_FPS
+from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.world.batch_runner import StaticMap, shared_static_map
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from types import TracebackType
+
+    from two_d_game_ai.entities.bot_memory import MemoryEntry
+    from two_d_game_ai.world.world import World
+
+_Point = tuple[float, float]
+_Kinematics = tuple[int, float, float, float, float, float, int | None]
+"""`Bot` id, position x, y, heading, velocity x, y, leader id."""
+_Ghost = tuple[int, str, float, float, float, float]
+"""`Bot` id, name, position x, y, heading, radius."""
+_StepResult = tuple[list[_Kinematics], list["BotState"], list[list[_Ghost]], set[int]]
+"""Kinematics of remaining local `Bot`s, state of emigrating `Bot`s, ghosts exported
+to each tile, and ids of non-local leaders of local `Bot`s."""
+
+
+@dataclass(frozen=True, slots=True)
+class _Tiling:
+    """Partition of a `World` into square tiles, each with a surrounding halo.
+
+    Picklable, so can be passed to worker processes.
+    """
+
+    world_magnitude: float
+    tile_size: float
+    tiles_per_side: int
+    halo_width: float
+
+    def index(self, x: float, y: float) -> int:
+        """Return the index of the tile containing a point, clamped to the `World`."""
+        ix, iy = self._coords(x, y)
+        return iy * self.tiles_per_side + ix
+
+    def halo_tiles(self, x: float, y: float, home: int) -> list[int]:
+        """Return tiles other than `home` within whose halo a point lies."""
+        min_ix, min_iy = self._coords(x - self.halo_width, y - self.halo_width)
+        max_ix, max_iy = self._coords(x + self.halo_width, y + self.halo_width)
+        return [
+            tile
+            for iy in range(min_iy, max_iy + 1)
+            for ix in range(min_ix, max_ix + 1)
+            if (tile := iy * self.tiles_per_side + ix) != home
+            and self._distance_to_tile(x, y, ix, iy) <= self.halo_width
+        ]
+
+    def _coords(self, x: float, y: float) -> tuple[int, int]:
+        """Return the (clamped) tile column and row containing a point."""
+        last = self.tiles_per_side - 1
+        ix = min(max(int((x + self.world_magnitude) // self.tile_size), 0), last)
+        iy = min(max(int((y + self.world_magnitude) // self.tile_size), 0), last)
+        return ix, iy
+
+    def _distance_to_tile(self, x: float, y: float, ix: int, iy: int) -> float:
+        """Return the distance from a point to the nearest point of a tile."""
+        min_x = ix * self.tile_size - self.world_magnitude
+        min_y = iy * self.tile_size - self.world_magnitude
+        dx = max(min_x - x, 0, x - (min_x + self.tile_size))
+        dy = max(min_y - y, 0, y - (min_y + self.tile_size))
+        return math.hypot(dx, dy)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class BotState:
+    """Picklable copy of a `Bot`'s state, with other `Bot`s referenced by id."""
+
+    id: int
+    name: str
+    position: _Point
+    heading: float
+    velocity: _Point
+    radius: float
+    max_speed: float
+    max_rotation_rate: float
+    has_memory: bool
+    memory_capacity: int
+    memory_duration: float | None
+    vision_range: float
+    vision_is_occluded: bool
+    team: str | None
+    is_scout: bool
+    senses_eagerly: bool
+    leader_id: int | None
+    destination: _Point | None
+    route: tuple[_Point, ...] | None
+    visible_ids: frozenset[int]
+    memory: tuple[MemoryEntry, ...]
+
+    @classmethod
+    def from_bot(cls, bot: Bot) -> Self:
+        """Return the state of `bot`."""
+        if bot.id is None:
+            err_msg = f"Can't get state of {bot!s}: no `id`. Add to World first."
+            raise ValueError(err_msg)
+
+        return cls(
+            id=bot.id,
+            name=bot.name,
+            position=(bot.position.x, bot.position.y),
+            heading=bot.heading.degrees,
+            velocity=(bot.velocity.x, bot.velocity.y),
+            radius=bot.radius,
+            max_speed=bot.max_speed,
+            max_rotation_rate=bot.max_rotation_rate,
+            has_memory=bot.has_memory,
+            memory_capacity=bot.memory_capacity,
+            memory_duration=bot.memory_duration,
+            vision_range=bot.vision_range,
+            vision_is_occluded=bot.vision_is_occluded,
+            team=bot.team,
+            is_scout=bot.is_scout,
+            senses_eagerly=bot.senses_eagerly,
+            leader_id=bot.leader.id if bot.leader else None,
+            destination=(
+                (bot.destination.x, bot.destination.y) if bot.destination else None
+            ),
+            route=(
+                tuple((p.x, p.y) for p in bot.route) if bot.route is not None else None
+            ),
+            visible_ids=frozenset(_ids(bot.visible_bots)),
+            memory=tuple(bot.memory.entries()) if bot.memory is not None else (),
+        )
+
+    def to_bot(self) -> Bot:
+        """Return a new `Bot` with this state, excluding references to other `Bot`s.
+
+        The `Bot` has this state's `id`, so keeps it when added to a `World`.
+        """
+        bot = Bot(
+            name=self.name,
+            position_from_sequence=self.position,
+            radius=self.radius,
+            max_speed=self.max_speed,
+            max_rotation_rate=self.max_rotation_rate,
+            initial_heading=self.heading,
+            has_memory=self.has_memory,
+            memory_capacity=self.memory_capacity,
+            memory_duration=self.memory_duration,
+            vision_range=self.vision_range,
+            vision_is_occluded=self.vision_is_occluded,
+            team=self.team,
+            is_scout=self.is_scout,
+            senses_eagerly=self.senses_eagerly,
+        )
+        bot.id = self.id
+        self.apply_to(bot, {})
+        return bot
+
+    def apply_to(self, bot: Bot, bots_by_id: dict[int, Bot]) -> None:
+        """Apply this state to an existing `Bot`.
+
+        References to `Bot`s not in `bots_by_id` are dropped.
+        """
+        bot.position.update(self.position)
+        bot.heading.update(self.heading)
+        bot.velocity.update(self.velocity)
+        bot.leader = (
+            bots_by_id.get(self.leader_id) if self.leader_id is not None else None
+        )
+        bot._destination = (  # noqa: SLF001
+            Vector2(self.destination) if self.destination else None
+        )
+        bot.route = None if self.route is None else [Vector2(p) for p in self.route]
+        bot.visible_bots = _resolve(self.visible_ids, bots_by_id)
+        if bot.memory is not None:
+            bot.memory.clear()
+            for entry in self.memory:
+                bot.memory.remember(*entry)
+
+
+@dataclass(kw_only=True)
+class ShardedWorld:
+    """Runs a `World`'s `Bot`s in spatial tiles, one per worker process.
+
+    Use as a context manager, or call `close` when finished, to stop the workers.
+    The wrapped `World` mustn't be updated directly in the meantime.
+
+    NB: each tile's `World` keeps its own team blackboards (`World.team_sightings`),
+    so sightings are only shared between members of a team in the same tile; they
+    don't cross tile boundaries, even via ghosts.
+    """
+
+    world: World
+    """The wrapped `World`."""
+    tiles_per_side: int = 2
+    """Number of tiles (and thus worker processes) is the square of this."""
+
+    tile_size: float = field(init=False)
+    """`World` units per tile side."""
+    halo_width: float = field(init=False)
+    """Distance from a tile within which other tiles' `Bot`s are ghosted to it."""
+
+    _tiling: _Tiling = field(init=False)
+    _bots_by_id: dict[int, Bot] = field(init=False, default_factory=dict)
+    _tile_of: dict[int, int] = field(init=False, default_factory=dict)
+    """Maps `Bot` id to index of the tile it's local to."""
+    _adoptions: list[list[BotState]] = field(init=False, default_factory=list)
+    """Migrating `Bot`s, per tile, to be adopted at the start of the next step."""
+    _ghosts: list[list[_Ghost]] = field(init=False, default_factory=list)
+    """`Bot`s, per tile, to be ghosted to it at the start of the next step."""
+    _connections: list[Connection] = field(init=False, default_factory=list)
+    _processes: list[BaseProcess] = field(init=False, default_factory=list)
+    _exit_stack: ExitStack = field(init=False, default_factory=ExitStack)
+
+    def __post_init__(self) -> None:
+        self.tile_size = self.world.size / self.tiles_per_side
+        bots = self.world.bots
+        self._bots_by_id = {b.id: b for b in bots if b.id is not None}
+        # Far enough to see or collide with anything outside the tile, and to cover
+        # movement within a step:
+        self.halo_width = max(
+            (
+                b.vision_range + 2 * b.radius + b.max_speed / SIMULATION_FPS
+                for b in bots
+            ),
+            default=0,
+        )
+        self._tiling = _Tiling(
+            world_magnitude=self.world.magnitude,
+            tile_size=self.tile_size,
+            tiles_per_side=self.tiles_per_side,
+            halo_width=self.halo_width,
+        )
+        tile_count = self.tiles_per_side**2
+        self._adoptions = [[] for _ in range(tile_count)]
+        initial_states: list[list[BotState]] = [[] for _ in range(tile_count)]
+        for bot_id, bot in self._bots_by_id.items():
+            tile = self.tile_index(bot.position)
+            self._tile_of[bot_id] = tile
+            initial_states[tile].append(BotState.from_bot(bot))
+        self._ghosts = self._initial_ghosts()
+
+        static_map = self._exit_stack.enter_context(shared_static_map(self.world))
+        mp_context = multiprocessing.get_context("spawn")
+        for tile in range(tile_count):
+            parent_connection, child_connection = mp_context.Pipe()
+            process = mp_context.Process(
+                target=_run_tile_worker,
+                args=(
+                    child_connection,
+                    static_map,
+                    tile,
+                    self._tiling,
+                    initial_states[tile],
+                    self.world.step_counter,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+        logger.info(
+            "{}: {} tiles, halo width {:.1f}.", self, tile_count, self.halo_width
+        )
+
+    def __str__(self) -> str:
+        """Human-readable description."""
+        return f"{type(self).__name__}(world={self.world!s})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def tile_index(self, position: Vector2) -> int:
+        """Return the index of the tile containing `position`.
+
+        Positions outside the `World` are assigned to the nearest tile.
+        """
+        return self._tiling.index(position.x, position.y)
+
+    def update(self) -> None:
+        """Update all tiles over 1 simulation step.
+
+        Workers export ghosts of their own `Bot`s; only ghosts of migrating `Bot`s and
+        of leaders in other tiles are found here.
+        """
+        for tile, connection in enumerate(self._connections):
+            connection.send(("step", self._ghosts[tile], self._adoptions[tile]))
+            self._adoptions[tile] = []
+
+        ghosts: list[list[_Ghost]] = [[] for _ in self._connections]
+        leader_ids_by_tile: list[tuple[int, set[int]]] = []
+        for tile, connection in enumerate(self._connections):
+            kinematics, emigrants, exports, leader_ids = connection.recv()
+            for k in kinematics:
+                self._apply_kinematics(k)
+            for to_tile, exported in enumerate(exports):
+                ghosts[to_tile].extend(exported)
+            leader_ids_by_tile.append((tile, leader_ids))
+            for state in emigrants:
+                new_tile = self._migrate(state, ghosts)
+                if state.leader_id is not None:
+                    leader_ids_by_tile.append((new_tile, {state.leader_id}))
+
+        # Once all `Bot`s' tiles are known:
+        for tile, leader_ids in leader_ids_by_tile:
+            for leader_id in leader_ids:
+                leader_tile = self._tile_of.get(leader_id)
+                if leader_tile is not None and leader_tile != tile:
+                    ghosts[tile].append(_ghost(self._bots_by_id[leader_id]))
+        self._ghosts = ghosts
+        self.world.step_counter += 1
+
+    def step_many(self, steps: int) -> None:
+        """Update all tiles over a number of steps."""
+        for _ in range(steps):
+            self.update()
+
+    def sync(self) -> None:
+        """Copy full `Bot` state from workers to the wrapped `World`."""
+        for connection in self._connections:
+            connection.send(("sync",))
+        states: list[BotState] = []
+        for connection in self._connections:
+            states.extend(connection.recv())
+        # Not yet adopted by their new tile:
+        states.extend(s for tile_states in self._adoptions for s in tile_states)
+        for state in states:
+            state.apply_to(self._bots_by_id[state.id], self._bots_by_id)
+
+    def close(self) -> None:
+        """Sync state to the wrapped `World`, and stop the workers."""
+        if not self._processes:
+            return
+        self.sync()
+        for connection in self._connections:
+            connection.send(("stop",))
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        self._connections = []
+        self._exit_stack.close()
+
+    def _migrate(self, state: BotState, ghosts: list[list[_Ghost]]) -> int:
+        """Queue an emigrant for adoption by its new tile; return the new tile.
+
+        It's also ghosted to tiles whose halos it's in.
+        """
+        bot = self._bots_by_id[state.id]
+        state.apply_to(bot, self._bots_by_id)
+        new_tile = self.tile_index(bot.position)
+        self._tile_of[state.id] = new_tile
+        self._adoptions[new_tile].append(state)
+        ghost = _ghost(bot)
+        for tile in self._tiling.halo_tiles(bot.position.x, bot.position.y, new_tile):
+            ghosts[tile].append(ghost)
+        return new_tile
+
+    def _initial_ghosts(self) -> list[list[_Ghost]]:
+        """Return `Bot`s to be ghosted to each tile for the first step.
+
+        That's `Bot`s within the tile's halo, and leaders of the tile's `Bot`s. After
+        that, workers export ghosts; see `update`.
+        """
+        ghosts: list[list[_Ghost]] = [[] for _ in range(self.tiles_per_side**2)]
+        for bot_id, bot in self._bots_by_id.items():
+            home = self._tile_of[bot_id]
+            for tile in self._tiling.halo_tiles(bot.position.x, bot.position.y, home):
+                ghosts[tile].append(_ghost(bot))
+            if bot.leader and bot.leader.id is not None:
+                leader_home = self._tile_of[bot.leader.id]
+                if leader_home != home:
+                    ghosts[home].append(_ghost(bot.leader))
+        return ghosts
+
+    def _apply_kinematics(self, kinematics: _Kinematics) -> None:
+        bot_id, x, y, heading, vx, vy, leader_id = kinematics
+        bot = self._bots_by_id[bot_id]
+        bot.position.update(x, y)
+        bot.heading.update(heading)
+        bot.velocity.update(vx, vy)
+        bot.leader = self._bots_by_id.get(leader_id) if leader_id is not None else None
+
+
+def _run_tile_worker(
+    connection: Connection,
+    static_map: StaticMap,
+    tile: int,
+    tiling: _Tiling,
+    initial_states: list[BotState],
+    step_counter: int,
+) -> None:
+    """Hold and update a tile's `Bot`s, until told to stop. Run in a worker process."""
+    world = static_map.new_world()
+    world.step_counter = step_counter
+    worker = _TileWorker(world=world, tile=tile, tiling=tiling)
+    worker.adopt(initial_states)
+
+    while True:
+        command, *args = connection.recv()
+        if command == "stop":
+            break
+        if command == "sync":
+            connection.send([BotState.from_bot(b) for b in worker.local.values()])
+        else:
+            connection.send(worker.step(*args))
+
+
+@dataclass(kw_only=True)
+class _TileWorker:
+    """A tile's `Bot`s and ghosts, within a worker process's own `World`."""
+
+    world: World
+    tile: int
+    tiling: _Tiling
+    local: dict[int, Bot] = field(default_factory=dict)
+    ghosts: dict[int, Bot] = field(default_factory=dict)
+    leader_ids: dict[int, int] = field(default_factory=dict)
+    """Leader id, by local `Bot` id. Leaders may be ghosts, which are replaced each
+    step, or not yet ghosted when a `Bot` is adopted."""
+
+    def step(self, ghost_data: list[_Ghost], adoptions: list[BotState]) -> _StepResult:
+        """Update local `Bot`s over 1 simulation step.
+
+        Returns
+        -------
+        _StepResult
+            Kinematics of remaining local `Bot`s, state of emigrating `Bot`s, ghosts
+            exported to each tile, and ids of non-local leaders of local `Bot`s.
+        """
+        self._update_ghosts(ghost_data)
+        self.adopt(adoptions)
+        # Leaders' ghosts may have been replaced, e.g. by newly adopted leaders:
+        bots_by_id = self.ghosts | self.local
+        for bot_id, leader_id in self.leader_ids.items():
+            self.local[bot_id].leader = bots_by_id.get(leader_id)
+
+        self.world.update_bots([self.local[i] for i in sorted(self.local)])
+        self.world.step_counter += 1
+
+        emigrants: list[BotState] = []
+        for bot_id, bot in list(self.local.items()):
+            if self.tiling.index(bot.position.x, bot.position.y) != self.tile:
+                emigrants.append(BotState.from_bot(bot))
+                self.world.remove_entity(self.local.pop(bot_id))
+
+        self.leader_ids = {
+            bot_id: bot.leader.id
+            for bot_id, bot in self.local.items()
+            if bot.leader and bot.leader.id is not None
+        }
+        exports: list[list[_Ghost]] = [[] for _ in range(self.tiling.tiles_per_side**2)]
+        for bot in self.local.values():
+            halo_tiles = self.tiling.halo_tiles(
+                bot.position.x, bot.position.y, self.tile
+            )
+            if halo_tiles:
+                ghost = _ghost(bot)
+                for tile in halo_tiles:
+                    exports[tile].append(ghost)
+
+        kinematics = [_kinematics(b) for b in self.local.values()]
+        remote_leader_ids = set(self.leader_ids.values()) - self.local.keys()
+        return kinematics, emigrants, exports, remote_leader_ids
+
+    def adopt(self, states: list[BotState]) -> None:
+        """Add `Bot`s to the tile."""
+        for state in states:
+            if state.id in self.ghosts:
+                self.world.remove_entity(self.ghosts.pop(state.id))
+            bot = state.to_bot()
+            self.world.add_entity(bot)
+            self.local[state.id] = bot
+            if state.leader_id is not None:
+                self.leader_ids[state.id] = state.leader_id
+        bots_by_id = self.ghosts | self.local
+        for state in states:
+            state.apply_to(self.local[state.id], bots_by_id)
+
+    def _update_ghosts(self, ghost_data: list[_Ghost]) -> None:
+        """Replace ghosts, reusing existing `Bot` objects where possible."""
+        current_ids = set()
+        for bot_id, name, x, y, heading, radius in ghost_data:
+            current_ids.add(bot_id)
+            ghost = self.ghosts.get(bot_id)
+            if ghost is None:
+                ghost = Bot(
+                    name=name,
+                    position_from_sequence=(x, y),
+                    initial_heading=heading,
+                    radius=radius,
+                )
+                ghost.id = bot_id
+                self.world.add_entity(ghost)
+                self.ghosts[bot_id] = ghost
+            else:
+                ghost.position.update(x, y)
+                ghost.heading.update(heading)
+        for bot_id in self.ghosts.keys() - current_ids:
+            self.world.remove_entity(self.ghosts.pop(bot_id))
+
+
+def _kinematics(bot: Bot) -> _Kinematics:
+    if bot.id is None:
+        err_msg = (
+            f"Can't export kinematics of {bot!s}: `id` is {type(bot.id).__name__}, not"
+            " int. Add to World first."
+        )
+        raise TypeError(err_msg)
+    return (
+        bot.id,
+        bot.position.x,
+        bot.position.y,
+        bot.heading.degrees,
+        bot.velocity.x,
+        bot.velocity.y,
+        bot.leader.id if bot.leader else None,
+    )
+
+
+def _ghost(bot: Bot) -> _Ghost:
+    if bot.id is None:
+        err_msg = (
+            f"Can't export ghost of {bot!s}: `id` is {type(bot.id).__name__}, not"
+            " int. Add to World first."
+        )
+        raise TypeError(err_msg)
+    return (
+        bot.id,
+        bot.name,
+        bot.position.x,
+        bot.position.y,
+        bot.heading.degrees,
+        bot.radius,
+    )
+
+
+def _ids(bots: set[Bot]) -> list[int]:
+    return [b.id for b in bots if b.id is not None]
+
+
+def _resolve(ids: frozenset[int], bots_by_id: dict[int, Bot]) -> set[Bot]:
+    return {bots_by_id[i] for i in ids if i in bots_by_id}
@@ -0,0 +1,73 @@
+"""Contains `SpatialHash` class."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+    from pygame import Vector2
+
+T = TypeVar("T", bound="Hashable")
+
+_Bucket = tuple[int, int]
+
+
+@dataclass(kw_only=True)
+class SpatialHash(Generic[T]):
+    """Index of items by position, in square buckets, for fast proximity queries.
+
+    Independent of `Grid`, as bucket size is chosen for the query radius rather than
+    pathfinding resolution.
+    """
+
+    bucket_size: float
+    """`World` units per bucket side."""
+
+    _buckets: dict[_Bucket, set[T]] = field(init=False, default_factory=dict)
+    _bucket_of: dict[T, _Bucket] = field(init=False, default_factory=dict)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._bucket_of
+
+    def __len__(self) -> int:
+        return len(self._bucket_of)
+
+    def insert(self, item: T, position: Vector2) -> None:
+        """Add an item at a position, or move it if already present."""
+        bucket = self._bucket(position.x, position.y)
+        old_bucket = self._bucket_of.get(item)
+        if old_bucket == bucket:
+            return
+        if old_bucket is not None:
+            self._discard_from_bucket(item, old_bucket)
+        self._buckets.setdefault(bucket, set()).add(item)
+        self._bucket_of[item] = bucket
+
+    def discard(self, item: T) -> None:
+        """Remove an item, if present."""
+        bucket = self._bucket_of.pop(item, None)
+        if bucket is not None:
+            self._discard_from_bucket(item, bucket)
+
+    def near(self, position: Vector2, radius: float) -> Iterator[T]:
+        """Yield items in buckets overlapping the square around a circle.
+
+        Candidates only: may include items further than `radius` from `position`.
+        """
+        min_bx, min_by = self._bucket(position.x - radius, position.y - radius)
+        max_bx, max_by = self._bucket(position.x + radius, position.y + radius)
+        for bx in range(min_bx, max_bx + 1):
+            for by in range(min_by, max_by + 1):
+                yield from self._buckets.get((bx, by), ())
+
+    def _bucket(self, x: float, y: float) -> _Bucket:
+        return int(x // self.bucket_size), int(y // self.bucket_size)
+
+    def _discard_from_bucket(self, item: T, bucket: _Bucket) -> None:
+        items = self._buckets[bucket]
+        items.discard(item)
+        if not items:
+            del self._buckets[bucket]
@@ -2,23 +2,41 @@
 
 from __future__ import annotations
 
+import itertools
 import random
+import threading
 from dataclasses import InitVar, dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from loguru import logger
 from pygame import Vector2
 
+from two_d_game_ai import SIMULATION_FPS
 from two_d_game_ai.entities.bot import Bot
+from two_d_game_ai.entities.bot_memory import BotMemory
 from two_d_game_ai.entities.obstacles import Obstacle
 from two_d_game_ai.geometry import point_in_or_on_rect
+from two_d_game_ai.telemetry import metrics
+from two_d_game_ai.tracing import traced, tracer
+from two_d_game_ai.world.events import EntityAdded, EntityRemoved, EventBus
 from two_d_game_ai.world.grid import Grid
 from two_d_game_ai.world.grid_ref import GridRef
+from two_d_game_ai.world.group_route import GroupRoute
+from two_d_game_ai.world.route_index import RouteIndex
+from two_d_game_ai.world.spatial_hash import SpatialHash
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from concurrent.futures import Executor
+
+    from two_d_game_ai.entities.bot_memory import MemoryEntry
     from two_d_game_ai.entities.generic_entity import (
         GenericEntity,
     )
+    from two_d_game_ai.world.sensing_scheduler import SensingScheduler
+
+_GROUP_ROUTES_JOINED = metrics.counter("world.group_routes_joined")
+_ROUTES_REPAIRED = metrics.counter("world.routes_repaired")
 
 
 @dataclass
@@ -33,6 +51,8 @@ class World:
     size: int
     """`World` units per side."""
     grid_size: InitVar[int] = 2
+    seed: InitVar[int | None] = None
+    """Seed for `rng`. If `None`, seeded from system randomness."""
 
     magnitude: float = field(init=False)
     """Half of `World` size."""
@@ -48,16 +68,87 @@ class World:
     """Number of update steps taken."""
     is_paused: bool = field(init=False)
     """Whether the `World` is paused."""
+    rng: random.Random = field(init=False)
+    """Random number generator, e.g. for scenario setup."""
+    sensing_scheduler: SensingScheduler | None = field(init=False, default=None)
+    """If set, decides which `Bot`s sense on each step. Otherwise, all do."""
+    events: EventBus = field(init=False, default_factory=EventBus)
+    """Dispatches events, e.g. `Bot` arrivals, to subscribers."""
+    update_executor: Executor | None = field(init=False, default=None)
+    """If set, runs the read phase of `update_bots` in parallel chunks.
+
+    A thread pool: `Bot`s are updated in place. Event subscribers are then called from
+    its threads. Multicore scaling needs a free-threaded Python build; otherwise, see
+    `two_d_game_ai.world.sharded_world.ShardedWorld`.
+    """
+    _next_entity_id: int = field(init=False, default=0)
+    _bots: set[Bot] = field(init=False, default_factory=set)
+    _bots_by_id: dict[int, Bot] = field(init=False, default_factory=dict)
+    _active_bots: set[Bot] = field(init=False, default_factory=set)
+    """`Bot`s updated each step. Others are asleep."""
+    _sleeping_bots: SpatialHash[Bot] = field(init=False)
+    """Sleeping `Bot`s, indexed by position so they can be woken by others moving
+    into view."""
+    _sleeping_followers: dict[Bot, set[Bot]] = field(init=False, default_factory=dict)
+    """Sleeping `Bot`s, by leader, so they can be woken when their leader is."""
+    _sleeping_vision_range: float = field(init=False, default=0)
+    """Maximum vision range of `Bot`s that have slept."""
+    _group_routes: dict[Bot, GroupRoute] = field(init=False, default_factory=dict)
+    """Routes to leaders, shared by their followers, by leader."""
+    _is_deciding: bool = field(init=False, default=False)
+    """Whether `Bot`s are in the read phase of an update, during which
+    `_group_routes` is read-only; see `_prepare_group_routes`."""
+    _route_index: RouteIndex[Bot] = field(init=False, default_factory=RouteIndex)
+    """`Bot`s by the cells their routes pass through, so that routes through newly
+    blocked cells can be found."""
+    _route_index_lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False, compare=False
+    )
+    """`Bot`s may be routed concurrently; see `update_executor`."""
+    _blackboards: dict[str, BotMemory] = field(init=False, default_factory=dict)
+    """Sightings shared by each team's members, by team."""
+    _blackboards_lock: threading.Lock = field(
+        init=False, default_factory=threading.Lock, repr=False, compare=False
+    )
+    """`Bot`s may sense concurrently; see `update_executor`."""
+    _team_sensors: dict[str, Bot] = field(init=False, default_factory=dict)
+    """Active non-scout `Bot` whose turn it is to sense, by team; see
+    `sensing_is_due`."""
+    _team_sensors_step: int | None = field(init=False, default=None)
+    """Step for which `_team_sensors` was chosen."""
+
+    SLEEPING_BOTS_BUCKET_SIZE: ClassVar[float] = 10
+    """`World` units. Comparable to a typical `Bot.vision_range`."""
+    UPDATE_CHUNK_SIZE: ClassVar[int] = 256
+    """`Bot`s per task when the read phase runs on `update_executor`."""
+    BLACKBOARD_CAPACITY: ClassVar[int] = 256
+    """Maximum `Bot`s known to a team at once."""
+    BLACKBOARD_MAX_AGE: ClassVar[int] = SIMULATION_FPS
+    """Steps for which a team's sighting is kept."""
 
-    def __post_init__(self, grid_size: int) -> None:
+    def __post_init__(self, grid_size: int, seed: int | None) -> None:
+        self.rng = random.Random(seed)
         self.magnitude = self.size / 2
         self.grid = Grid(size=grid_size)
         self.grid_resolution = self.size / self.grid.size
         self.grid_offset = -Vector2(self.magnitude, self.magnitude)
         self.step_counter = 0
         self.is_paused = True
+        self._sleeping_bots = SpatialHash(bucket_size=self.SLEEPING_BOTS_BUCKET_SIZE)
         logger.info(f"{self} initialized.")
 
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle, or copy, without locks; they're recreated."""
+        state = self.__dict__.copy()
+        del state["_route_index_lock"]
+        del state["_blackboards_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._route_index_lock = threading.Lock()
+        self._blackboards_lock = threading.Lock()
+
     def __str__(self) -> str:
         """Human-readable description."""
         return f"{type(self).__name__}(size={self.size})"
@@ -65,20 +156,243 @@ class World:
     @property
     def bots(self) -> set[Bot]:
         """TO DO."""
-        return {e for e in self.entities if isinstance(e, Bot)}
+        return set(self._bots)
+
+    def bot_by_id(self, bot_id: int) -> Bot | None:
+        """Return the `Bot` with `id`, or `None` if there isn't one in the `World`."""
+        return self._bots_by_id.get(bot_id)
+
+    @property
+    def active_bots(self) -> set[Bot]:
+        """`Bot`s which are updated each step.
+
+        Others are asleep, as they have nothing to do, until woken.
+        """
+        return set(self._active_bots)
 
     @property
     def obstacles(self) -> set[GenericEntity]:
         """TO DO."""
         return {e for e in self.entities if isinstance(e, Obstacle)}
 
+    @traced("World.update")
     def update(self) -> None:
-        """Only Bots currently need to be updated."""
-        for e in self.entities:
-            if isinstance(e, Bot):
-                e.update()
+        """Update active `Bot`s; only Bots currently need to be updated.
+
+        Idle `Bot`s are put to sleep. Sleeping `Bot`s which could now see a `Bot` that
+        moved are woken, to be updated from the next step.
+        """
+        tracer.next_frame()
+        if self.sensing_scheduler:
+            self.sensing_scheduler.begin_step(self.step_counter)
+        bots = sorted(self._active_bots, key=_entity_id)
+        for bot in self.update_bots(bots):
+            self._wake_observers_of(bot)
+        for bot in bots:
+            if bot.is_idle and (
+                bot.leader is None or bot.leader in self._sleeping_bots
+            ):
+                self._sleep(bot)
         self.step_counter += 1
 
+    def update_bots(self, bots: Sequence[Bot]) -> list[Bot]:
+        """Update `Bot`s over 1 simulation step, in two phases.
+
+        In the read phase, each `Bot` senses, steers and decides its next position
+        (`Bot.decide`), against positions as they were at the start of the step. In the
+        write phase, all move (`Bot.move`). So the result doesn't depend on the order
+        of `bots`.
+
+        If `update_executor` is set, the read phase runs on it, in chunks of
+        `UPDATE_CHUNK_SIZE` `Bot`s. Sensing schedules and group routes are decided
+        beforehand, in order, so results are the same as in series.
+
+        Returns
+        -------
+        list[Bot]
+            `Bot`s which moved.
+        """
+        sensing_is_due = [self.sensing_is_due(bot) for bot in bots]
+        self._prepare_group_routes(bots)
+        self._is_deciding = True
+        try:
+            if self.update_executor and len(bots) > self.UPDATE_CHUNK_SIZE:
+                chunk_starts = range(0, len(bots), self.UPDATE_CHUNK_SIZE)
+                for _ in self.update_executor.map(
+                    _decide,
+                    (bots[i : i + self.UPDATE_CHUNK_SIZE] for i in chunk_starts),
+                    (
+                        sensing_is_due[i : i + self.UPDATE_CHUNK_SIZE]
+                        for i in chunk_starts
+                    ),
+                ):
+                    pass
+            else:
+                _decide(bots, sensing_is_due)
+        finally:
+            self._is_deciding = False
+        self._share_team_sightings(bots, sensing_is_due)
+        return [bot for bot in bots if bot.move()]
+
+    def sensing_is_due(self, bot: Bot) -> bool:
+        """Determine whether `bot` should sense this step.
+
+        Active non-scout members of a team take turns, so one senses each step; they
+        share what they see via `team_sightings`, and the others see that instead.
+        Sleeping members don't take turns.
+        """
+        if (
+            bot.team is not None
+            and not bot.is_scout
+            and self._team_sensor(bot.team) is not bot
+        ):
+            return False
+        if self.sensing_scheduler is None:
+            return True
+        return self.sensing_scheduler.is_due(bot)
+
+    def _share_team_sightings(
+        self, bots: Sequence[Bot], sensing_is_due: Sequence[bool]
+    ) -> None:
+        """Show team members which didn't sense this step what their team saw.
+
+        Only for teams which sensed this step; see `Bot.handle_team_sightings`.
+        """
+        sensing_teams = {
+            bot.team
+            for bot, is_due in zip(bots, sensing_is_due, strict=True)
+            if is_due and bot.team is not None
+        }
+        sighted_bots_by_team: dict[str, set[Bot]] = {}
+        for bot, is_due in zip(bots, sensing_is_due, strict=True):
+            if is_due or bot.team not in sensing_teams:
+                continue
+            sighted_bots = sighted_bots_by_team.get(bot.team)
+            if sighted_bots is None:
+                sighted_bots = {
+                    sighted_bot
+                    for sighting in self.team_sightings(bot.team)
+                    if sighting.step == self.step_counter
+                    and (sighted_bot := self.bot_by_id(sighting.bot_id)) is not None
+                }
+                sighted_bots_by_team[bot.team] = sighted_bots
+            bot.handle_team_sightings(sighted_bots)
+
+    def _team_sensor(self, team: str) -> Bot | None:
+        """Return the active non-scout member of `team` whose turn it is to sense."""
+        if self._team_sensors_step != self.step_counter:
+            members_by_team: dict[str, list[Bot]] = {}
+            for bot in self._active_bots:
+                if bot.team is not None and not bot.is_scout:
+                    members_by_team.setdefault(bot.team, []).append(bot)
+            self._team_sensors = {
+                t: sorted(members, key=_entity_id)[self.step_counter % len(members)]
+                for t, members in members_by_team.items()
+            }
+            self._team_sensors_step = self.step_counter
+        return self._team_sensors.get(team)
+
+    def publish_sightings(self, team: str, bots: Iterable[Bot]) -> None:
+        """Record that a team member sees `bots` this step, for the whole team.
+
+        Teammates aren't recorded.
+        """
+        with self._blackboards_lock:
+            blackboard = self._blackboard(team)
+            for bot in bots:
+                if bot.team != team and bot.id is not None:
+                    blackboard.remember(
+                        bot.id, self.step_counter, bot.position.x, bot.position.y
+                    )
+
+    def team_sightings(self, team: str) -> list[MemoryEntry]:
+        """Return when and where other `Bot`s were last seen by any of a team.
+
+        Only sightings within the last `BLACKBOARD_MAX_AGE` steps; least recent first.
+        """
+        with self._blackboards_lock:
+            blackboard = self._blackboard(team)
+            blackboard.expire(self.step_counter)
+            return blackboard.entries()
+
+    def _blackboard(self, team: str) -> BotMemory:
+        blackboard = self._blackboards.get(team)
+        if blackboard is None:
+            blackboard = BotMemory(
+                capacity=self.BLACKBOARD_CAPACITY, max_age=self.BLACKBOARD_MAX_AGE
+            )
+            self._blackboards[team] = blackboard
+        return blackboard
+
+    def wake(self, bot: Bot) -> None:
+        """Ensure a `Bot` is updated each step, e.g. after its state is changed.
+
+        Also wakes its sleeping followers.
+        """
+        if bot in self._active_bots or bot not in self._bots:
+            return
+        self._sleeping_bots.discard(bot)
+        if bot.leader:
+            self._sleeping_followers.get(bot.leader, set()).discard(bot)
+        self._active_bots.add(bot)
+        if bot.team is not None:
+            self._team_sensors_step = None
+        for follower in self._sleeping_followers.pop(bot, set()):
+            self.wake(follower)
+
+    def _sleep(self, bot: Bot) -> None:
+        """Stop updating a `Bot` until it's woken."""
+        self._active_bots.discard(bot)
+        if bot.team is not None:
+            self._team_sensors_step = None
+        self._sleeping_bots.insert(bot, bot.position)
+        if self.sensing_scheduler:
+            self.sensing_scheduler.discard(bot)
+        self._sleeping_vision_range = max(self._sleeping_vision_range, bot.vision_range)
+        if bot.leader:
+            self._sleeping_followers.setdefault(bot.leader, set()).add(bot)
+
+    def _wake_observers_of(self, bot: Bot) -> None:
+        """Wake sleeping `Bot`s which can see `bot`."""
+        if not self._sleeping_bots:
+            return
+        for observer in list(
+            self._sleeping_bots.near(bot.position, self._sleeping_vision_range)
+        ):
+            if observer.can_see(bot):
+                self.wake(observer)
+
+    def step_many(self, steps: int) -> None:
+        """Update the `World` over a number of steps, as fast as possible.
+
+        Ignores `is_paused`, which is intended for interactive use.
+        """
+        for _ in range(steps):
+            self.update()
+
+    def run_until(self, condition: Callable[[World], bool], max_steps: int) -> int:
+        """Update the `World` until `condition` is met, as fast as possible.
+
+        `condition` is checked before each step. Ignores `is_paused`.
+
+        Parameters
+        ----------
+        condition
+            Called with the `World`; stepping stops when it returns `True`.
+        max_steps
+            Upper limit on steps taken, in case `condition` is never met.
+
+        Returns
+        -------
+        int
+            Number of steps taken.
+        """
+        steps_taken = 0
+        while steps_taken < max_steps and not condition(self):
+            self.update()
+            steps_taken += 1
+        return steps_taken
+
     def location_is_inside_world_bounds(self, location: Vector2) -> bool:
         """Return `True` if point is inside the World bounds, else `False`."""
         return point_in_or_on_rect(
@@ -95,16 +409,21 @@ class World:
         return grid_ref in self.grid.movement_blocking_cells
 
     def random_location(self) -> Vector2:
-        """Return random location, not movement-blocked."""
-        location = Vector2(
-            random.uniform(-self.magnitude, self.magnitude),
-            random.uniform(-self.magnitude, self.magnitude),
-        )
-        if self.location_is_movement_blocked(location):
-            return self.random_location()
+        """Return random location, not movement-blocked.
 
-        return location
+        Constant time: draws a random free `Grid` cell, then a random point within it.
+        """
+        cell = self.grid.random_free_cell(self.rng)
+        return (
+            self.grid_offset
+            + cell * self.grid_resolution
+            + Vector2(
+                self.rng.random() * self.grid_resolution,
+                self.rng.random() * self.grid_resolution,
+            )
+        )
 
+    @traced("World.route")
     def route(
         self,
         *,
@@ -126,8 +445,9 @@ class World:
             Points on the path, including `to_pos` itself.
             Empty if no route was found.
         """
+        # Copies of end points, as positions are updated in place:
         if not self.grid.movement_blocking_cells:
-            return [to_pos]
+            return [Vector2(to_pos)]
 
         from_cell = self.grid_ref_from_pos(from_pos)
         to_cell = self.grid_ref_from_pos(to_pos)
@@ -138,22 +458,214 @@ class World:
 
         pos_route = [Grid.cell_centre_to_world_pos(self, cell) for cell in cell_route]
         # always use actual points (not cell centre) for end waypoints:
-        pos_route[0] = from_pos
-        pos_route[-1] = to_pos
+        pos_route[0] = Vector2(from_pos)
+        pos_route[-1] = Vector2(to_pos)
         return pos_route
 
+    def group_route(self, leader: Bot, *, from_pos: Vector2) -> list[Vector2] | None:
+        """Determine a route to a leader, sharing a search with its other followers.
+
+        While the leader stays in the same cell, followers join the route computed for
+        the first of them, at the nearest waypoint they can see, rather than each
+        searching. A follower which can't see any waypoint searches for itself.
+
+        While `Bot`s decide, routes are only joined: they're computed beforehand, by
+        `_prepare_group_routes`.
+
+        Parameters
+        ----------
+        leader
+            The `Bot` being followed.
+        from_pos
+            A point in `World` coordinates, e.g. the follower's position.
+
+        Returns
+        -------
+        list[Vector2]
+            Points on the path, as `route`. Shared waypoints mustn't be modified.
+        """
+        leader_cell = self.grid_ref_from_pos(leader.position)
+        if not self._needs_group_search(from_pos, leader_cell):
+            return self.route(from_pos=from_pos, to_pos=leader.position)
+
+        group_route = self._group_routes.get(leader)
+        if group_route and group_route.leader_cell == leader_cell:
+            if group_route.waypoints[0] == from_pos:
+                # computed from here:
+                return list(group_route.waypoints)
+            joined_route = group_route.joined_from(self, from_pos, leader.position)
+            if joined_route:
+                _GROUP_ROUTES_JOINED.inc()
+                return joined_route
+            return self.route(from_pos=from_pos, to_pos=leader.position)
+
+        waypoints = self.route(from_pos=from_pos, to_pos=leader.position)
+        if waypoints and not self._is_deciding:
+            self._group_routes[leader] = GroupRoute(leader_cell, waypoints)
+            return list(waypoints)
+        return waypoints
+
+    def _prepare_group_routes(self, bots: Sequence[Bot]) -> None:
+        """Compute group routes for leaders about to be followed, before `bots` decide.
+
+        For each leader, the route is computed from the first of `bots` following it
+        which needs one; the others join it. So routes don't depend on which follower
+        decides first, e.g. on `update_executor`.
+        """
+        for bot in bots:
+            leader = bot.leader
+            if leader is None or bot.destination == leader.position:
+                continue
+            leader_cell = self.grid_ref_from_pos(leader.position)
+            group_route = self._group_routes.get(leader)
+            if (
+                group_route and group_route.leader_cell == leader_cell
+            ) or not self._needs_group_search(bot.position, leader_cell):
+                continue
+            waypoints = self.route(from_pos=bot.position, to_pos=leader.position)
+            if waypoints:
+                self._group_routes[leader] = GroupRoute(leader_cell, waypoints)
+
+    def _needs_group_search(self, from_pos: Vector2, leader_cell: GridRef) -> bool:
+        """Determine whether routing to a leader needs a search, i.e. isn't direct."""
+        return bool(
+            self.grid.movement_blocking_cells
+        ) and not self.grid.is_line_of_sight(
+            self.grid_ref_from_pos(from_pos), leader_cell
+        )
+
+    def track_route(self, bot: Bot) -> None:
+        """Index a `Bot`'s route, so that it's repaired if any of its cells become
+        blocked.
+
+        Call whenever the route is replaced, e.g. when routed to a new destination.
+        """
+        cells = self._cells_on_route(bot.position, bot.route) if bot.route else set()
+        with self._route_index_lock:
+            self._route_index.update(bot, cells)
+
+    def _repair_routes_through(self, cells: set[GridRef]) -> None:
+        """Repair routes which pass through newly blocked cells.
+
+        Only `Bot`s whose routes are indexed through the cells are checked. Each route
+        is repaired locally: the blocked stretch is replaced by a detour between the
+        waypoints either side. If that's not possible, e.g. because a waypoint is
+        blocked, the `Bot` is routed afresh.
+        """
+        self._group_routes.clear()
+        for bot in self._route_index.owners_through(cells):
+            if not bot.route:
+                self._route_index.discard(bot)
+                continue
+            points = [bot.position, *bot.route]
+            blocked_segments = [
+                i
+                for i, (a, b) in enumerate(itertools.pairwise(points))
+                if not cells.isdisjoint(
+                    self.grid.cells_on_line(
+                        self.nearest_grid_ref(a), self.nearest_grid_ref(b)
+                    )
+                )
+            ]
+            if blocked_segments:
+                _ROUTES_REPAIRED.inc()
+                self._repair_route(
+                    bot, points, blocked_segments[0], blocked_segments[-1]
+                )
+            self.track_route(bot)
+
+    def _repair_route(
+        self, bot: Bot, points: Sequence[Vector2], first: int, last: int
+    ) -> None:
+        """Replace route segments `first` to `last` with a detour.
+
+        `points` are the `Bot`'s position then its route; segment `i` runs from
+        `points[i]` to `points[i + 1]`.
+        """
+        if bot.route is None:
+            return
+        detour_start = points[first]
+        detour_end = points[last + 1]
+        detour = None
+        if not (
+            self.location_is_movement_blocked(detour_start)
+            or self.location_is_movement_blocked(detour_end)
+        ):
+            detour = self.route(from_pos=detour_start, to_pos=detour_end)
+        if detour is None:
+            logger.info("{}: route blocked; re-planning.", bot)
+            bot.replan_route()
+            return
+        logger.info("{}: route blocked; repaired.", bot)
+        bot.route = bot.route[:first] + detour[1:] + bot.route[last + 1 :]
+        bot.stop()
+
+    def _cells_on_route(
+        self, from_pos: Vector2, route: Sequence[Vector2]
+    ) -> set[GridRef]:
+        """Return cells passed through by a route, from `from_pos`."""
+        cells: set[GridRef] = set()
+        previous_cell = self.nearest_grid_ref(from_pos)
+        for waypoint in route:
+            cell = self.nearest_grid_ref(waypoint)
+            cells |= self.grid.cells_on_line(previous_cell, cell)
+            previous_cell = cell
+        return cells
+
     def add_entity(self, entity: GenericEntity) -> None:
-        """Add an entity to `World`."""
-        entity.id = len(self.entities)
+        """Add an entity to `World`.
+
+        Assigns a new `id`, unless the entity already has one, e.g. when it's a copy of
+        an entity in another `World`.
+        """
+        if entity.id is None:
+            entity.id = self._next_entity_id
+        self._next_entity_id = max(self._next_entity_id, entity.id + 1)
         self.entities.add(entity)
+        if isinstance(entity, Bot):
+            self._bots.add(entity)
+            self._bots_by_id[entity.id] = entity
+            self._active_bots.add(entity)
+            if entity.team is not None:
+                self._team_sensors_step = None
         entity.world = self
         if isinstance(entity, Obstacle):
-            entity.add_to_grid(self.grid)
+            newly_blocked_cells = entity.add_to_grid(self.grid)
+            if newly_blocked_cells:
+                self._repair_routes_through(newly_blocked_cells)
+
+        if isinstance(entity, Bot):
+            self._wake_observers_of(entity)
 
-        logger.info(f"{self}: added {entity!s}.")
+        logger.info("{}: added {}.", self, entity)
+        if self.events.has_subscribers(EntityAdded):
+            self.events.emit(EntityAdded(entity))
         if not self.location_is_inside_world_bounds(entity.position):
             logger.warning(f"{entity!s}: outside World bounds.")
 
+    def remove_entity(self, entity: GenericEntity) -> None:
+        """Remove an entity from `World`.
+
+        NB: cells blocked by an `Obstacle` remain blocked.
+        """
+        self.entities.remove(entity)
+        if isinstance(entity, Bot):
+            self.wake(entity)
+            self._bots.discard(entity)
+            if entity.id is not None and self._bots_by_id.get(entity.id) is entity:
+                del self._bots_by_id[entity.id]
+            self._active_bots.discard(entity)
+            self._group_routes.pop(entity, None)
+            self._route_index.discard(entity)
+            if entity.team is not None:
+                self._team_sensors_step = None
+            if self.sensing_scheduler:
+                self.sensing_scheduler.discard(entity)
+        entity.world = None
+        logger.info("{}: removed {}.", self, entity)
+        if self.events.has_subscribers(EntityRemoved):
+            self.events.emit(EntityRemoved(entity))
+
     def grid_ref_from_pos(self, pos: Vector2) -> GridRef:
         """Return the `GridRef` of the cell containing `World` position."""
         relative_pos = pos - self.grid_offset
@@ -173,3 +685,27 @@ class World:
             raise ValueError(err_msg)
 
         return grid_ref
+
+    def nearest_grid_ref(self, pos: Vector2) -> GridRef:
+        """Return the `GridRef` of the cell containing, or nearest to, `pos`."""
+        max_index = self.grid.size - 1
+        return GridRef(
+            min(
+                max(int((pos.x - self.grid_offset.x) // self.grid_resolution), 0),
+                max_index,
+            ),
+            min(
+                max(int((pos.y - self.grid_offset.y) // self.grid_resolution), 0),
+                max_index,
+            ),
+        )
+
+
+def _entity_id(entity: GenericEntity) -> int:
+    return entity.id if entity.id is not None else -1
+
+
+def _decide(bots: Sequence[Bot], sensing_is_due: Sequence[bool]) -> None:
+    """Run the read phase of an update for `Bot`s."""
+    for bot, is_sensing_due in zip(bots, sensing_is_due, strict=True):
+        bot.decide(is_sensing_due=is_sensing_due)